@@ -0,0 +1,138 @@
+"""
+Hexen AST Cache
+
+Content-addressed on-disk cache of parsed ASTs, used by
+HexenParser.parse_file to skip parsing sources that have not changed.
+
+Entries are keyed by a hash of the source text and a fingerprint of the
+parser itself (grammar files, transformer source, marshal format), so any
+change to the grammar or transformer invalidates every previous entry.
+ASTs are plain dicts/lists/scalars and are stored compactly with marshal,
+optionally together with the serialized span table of a SourceMap.
+"""
+
+import functools
+import hashlib
+import marshal
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import DiskCache
+from .source_map import SourceMap
+from .typed_ast import Node
+
+# Files whose contents determine the AST produced for a given source
+_PARSER_FILES = ("hexen.lark", "hexen_lalr.lark", "parser.py", "ast_nodes.py")
+
+
+@functools.lru_cache(maxsize=None)
+def parser_fingerprint() -> str:
+    """Hash identifying the grammar/transformer version that builds ASTs"""
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).parent
+    for file_name in _PARSER_FILES:
+        digest.update((package_dir / file_name).read_bytes())
+    digest.update(f"{sys.version_info[:2]}/{marshal.version}".encode())
+    return digest.hexdigest()
+
+
+class ASTCache(DiskCache):
+    """
+    Opt-in persistent cache mapping source text to its transformed AST.
+
+    Design:
+    - Content-addressed: the key is sha256(parser fingerprint + source)
+    - Storage: a DiskCache, so entries are crc32-checked and evicted
+      least-recently-used past max_bytes
+    - Spans: entries may carry the source spans of the AST; readers asking
+      for spans treat entries stored without them as misses
+    """
+
+    SUBDIR = "ast"
+    SUFFIX = ".ast"
+    # Payloads are marshalled (ast, span starts, span ends) tuples; spans
+    # are None when unknown
+    MAGIC = b"HXAST2\n"
+
+    def key(self, source_code: str, variant: str = "") -> str:
+        """
+        Content address of a source file for the current parser.
+
+        variant distinguishes parser options that change the AST built for
+        the same source, or whether it parses at all: HexenParser passes its
+        mode, suffixed with "-flat" for flattened operator chains.
+        """
+        digest = hashlib.sha256(parser_fingerprint().encode())
+        if variant:
+            digest.update(f"{variant}\0".encode())
+        digest.update(source_code.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(
+        self,
+        source_code: str,
+        source_map: Optional[SourceMap] = None,
+        variant: str = "",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached AST for source_code, or None on a miss.
+
+        If source_map is given, the entry's spans are recorded into it and
+        entries stored without spans count as misses.
+        """
+        key = self.key(source_code, variant)
+        entry = self._read(key)
+        if entry is None:
+            return None
+
+        ast, starts, ends = entry
+        if source_map is not None and (
+            starts is None or not source_map.load(ast, starts, ends)
+        ):
+            self.misses += 1
+            return None
+
+        self._touch(key)
+        return ast
+
+    def put(
+        self,
+        source_code: str,
+        ast: Dict[str, Any],
+        source_map: Optional[SourceMap] = None,
+        variant: str = "",
+    ) -> None:
+        """Store the AST (and its spans, if given), evicting old entries if needed"""
+        if self.cache_dir is None:
+            return
+
+        # Spans are stored in walk order, which to_dict() preserves
+        starts = ends = None
+        if source_map is not None:
+            starts, ends = source_map.dump(ast)
+
+        # Entries always hold the dict-based AST
+        if isinstance(ast, Node):
+            ast = ast.to_dict()
+
+        try:
+            payload = marshal.dumps((ast, starts, ends))
+        except ValueError:
+            # Too deeply nested (or not marshallable): just don't cache it
+            return
+        self._write(self.key(source_code, variant), payload)
+
+    def _load(
+        self, payload: bytes
+    ) -> Optional[Tuple[Dict[str, Any], Optional[bytes], Optional[bytes]]]:
+        """Unmarshal an entry, returning None if it is not a valid entry"""
+        try:
+            entry = marshal.loads(payload)
+        except (EOFError, ValueError, TypeError):
+            return None
+        if not (
+            isinstance(entry, tuple) and len(entry) == 3 and isinstance(entry[0], dict)
+        ):
+            return None
+        return entry
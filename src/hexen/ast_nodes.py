@@ -49,6 +49,7 @@ class NodeType(Enum):
     LITERAL = "literal"
     IDENTIFIER = "identifier"
     BINARY_OPERATION = "binary_operation"
+    NARY_OPERATION = "nary_operation"  # Flattened same-operator chain
     UNARY_OPERATION = "unary_operation"
     EXPLICIT_CONVERSION_EXPRESSION = "explicit_conversion_expression"
 
@@ -0,0 +1,111 @@
+"""
+Hexen Batch Checking
+
+Checks many source files for `hexen check <files and directories...>`.
+Files are fanned out to a process pool whose workers each keep one warm
+HexenParser (its grammar is built at most once per worker, on the first file
+the AST cache does not answer, not once per file) and one SemanticAnalyzer,
+reset between files, and results are yielded as soon as each file is done.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from .ast_cache import ASTCache
+from .parser import HexenParser
+from .semantic import SemanticAnalyzer
+
+SOURCE_SUFFIX = ".hxn"
+
+# Parser and analyzer of the current worker process (see _init_worker)
+_worker_parser: Optional[HexenParser] = None
+_worker_analyzer: Optional[SemanticAnalyzer] = None
+
+
+@dataclass
+class FileResult:
+    """Outcome of checking one file"""
+
+    path: str
+    # Semantic errors rendered as "line:column: message"
+    errors: List[str] = field(default_factory=list)
+    # Syntax or unexpected error that stopped the check, if any
+    failure: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.failure is None and not self.errors
+
+
+def collect_sources(paths: Iterable[str]) -> List[str]:
+    """
+    Expand paths into the list of files to check.
+
+    Directories contribute every *.hxn file below them (sorted); files are
+    kept as given. Duplicates are dropped, keeping the first occurrence.
+    """
+    sources = {}
+    for path in paths:
+        if Path(path).is_dir():
+            for source in sorted(Path(path).rglob(f"*{SOURCE_SUFFIX}")):
+                sources.setdefault(str(source), None)
+        else:
+            sources.setdefault(path, None)
+    return list(sources)
+
+
+def check_files(
+    files: List[str], jobs: int, parser_mode: str, ast_cache: bool = False
+) -> Iterator[FileResult]:
+    """
+    Check files, yielding each FileResult as soon as it is available.
+
+    With jobs > 1 files are checked in that many worker processes and
+    results arrive in completion order; otherwise they are checked here,
+    in order.
+    """
+    if jobs <= 1 or len(files) <= 1:
+        _init_worker(parser_mode, ast_cache)
+        for path in files:
+            yield _check_file(path)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(files)),
+        initializer=_init_worker,
+        initargs=(parser_mode, ast_cache),
+    ) as pool:
+        futures = [pool.submit(_check_file, path) for path in files]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _init_worker(parser_mode: str, ast_cache: bool) -> None:
+    """Build the parser and analyzer reused for every file of this process"""
+    global _worker_parser, _worker_analyzer
+    _worker_parser = HexenParser(
+        mode=parser_mode,
+        ast_cache=ASTCache() if ast_cache else None,
+        track_spans=True,
+    )
+    _worker_analyzer = SemanticAnalyzer()
+
+
+def _check_file(path: str) -> FileResult:
+    """Parse and analyze one file with the worker's parser and analyzer"""
+    start_time = time.perf_counter()
+    result = FileResult(path)
+    try:
+        ast = _worker_parser.parse_file(path)
+        errors = _worker_analyzer.analyze(ast)
+        result.errors = [error.format(_worker_parser.source_map) for error in errors]
+    except SyntaxError as e:
+        result.failure = str(e)
+    except Exception as e:
+        result.failure = f"Unexpected error: {e}"
+    result.elapsed = time.perf_counter() - start_time
+    return result
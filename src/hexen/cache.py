@@ -0,0 +1,213 @@
+"""
+Hexen Disk Caches
+
+Resolves the on-disk directories used by persistent compiler caches
+(compiled grammar tables, ASTs, JIT machine code) and provides DiskCache,
+the checksummed LRU store the AST and JIT object caches are built on.
+"""
+
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+# Overrides the cache root; an empty value disables disk caching entirely
+CACHE_DIR_ENV = "HEXEN_CACHE_DIR"
+
+
+def get_cache_dir(*parts: str) -> Optional[Path]:
+    """
+    Return the cache directory for the given sub-path, creating it if needed.
+
+    The cache root is resolved in order from:
+    1. $HEXEN_CACHE_DIR
+    2. $XDG_CACHE_HOME/hexen
+    3. ~/.cache/hexen
+
+    Returns None when caching is disabled (HEXEN_CACHE_DIR="") or the
+    directory cannot be created, so callers can fall back to no caching.
+    """
+    root = os.environ.get(CACHE_DIR_ENV)
+    if root is None:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        root = Path(xdg_cache) / "hexen"
+    elif not root:
+        return None
+
+    cache_dir = Path(root).joinpath(*parts)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return cache_dir
+
+
+class DiskCache:
+    """
+    Directory of content-addressed entries with integrity checks and LRU
+    eviction, shared by ASTCache and ObjectCache.
+
+    Design:
+    - Entries: one file per key, MAGIC | crc32(payload) as 4 big-endian
+      bytes | payload, written atomically; damaged entries are dropped and
+      treated as misses
+    - LRU eviction: hits refresh an entry's mtime, and the oldest entries
+      are removed once the cache grows past max_bytes. The cache size is
+      scanned once and then tracked, so a put only rescans the directory
+      when it crosses the limit
+    - Subclasses set SUBDIR, SUFFIX and MAGIC, compute keys and may
+      override _load() to validate and unpack payloads
+
+    A cache without a usable directory silently does nothing, so callers
+    never have to special-case an unwritable cache location.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    SUBDIR = ""
+    SUFFIX = ""
+    MAGIC = b""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        if cache_dir is None:
+            cache_dir = get_cache_dir(self.SUBDIR)
+        else:
+            cache_dir = Path(cache_dir)
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                cache_dir = None
+        self.cache_dir: Optional[Path] = cache_dir
+        self.max_bytes = max_bytes
+        # Bytes in cache_dir, counted on the first write
+        self._total_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        if self.cache_dir is None:
+            return
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            self._remove(path)
+        self._total_bytes = 0
+
+    def _read(self, key: str) -> Optional[Any]:
+        """
+        The loaded entry for key, or None on a miss. Callers count the hit
+        with _touch() once they accept the entry.
+        """
+        path = self._entry_path(key)
+        if path is None:
+            return None
+
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+
+        entry = self._decode(data)
+        if entry is None:
+            # Damaged entry: drop it so it gets rewritten
+            self._remove(path)
+            self._track(-len(data))
+            self.misses += 1
+        return entry
+
+    def _touch(self, key: str) -> None:
+        """Count a hit and refresh the entry for LRU eviction"""
+        try:
+            os.utime(self._entry_path(key))
+        except OSError:
+            pass
+        self.hits += 1
+
+    def _write(self, key: str, payload: bytes) -> None:
+        """Store a payload, evicting old entries if needed"""
+        path = self._entry_path(key)
+        if path is None:
+            return
+        data = self.MAGIC + zlib.crc32(payload).to_bytes(4, "big") + payload
+
+        if self._total_bytes is None:
+            self._total_bytes = self._scan()[1]
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+
+        # Write atomically so concurrent readers never see partial entries
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except OSError:
+            return
+
+        self._track(len(data) - replaced)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _load(self, payload: bytes) -> Optional[Any]:
+        """The entry stored as payload, or None if it is not a valid entry"""
+        return payload
+
+    def _entry_path(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def _decode(self, data: bytes) -> Optional[Any]:
+        """Validate and load an entry, returning None if damaged"""
+        header_size = len(self.MAGIC) + 4
+        if len(data) < header_size or not data.startswith(self.MAGIC):
+            return None
+        checksum = int.from_bytes(data[len(self.MAGIC) : header_size], "big")
+        payload = data[header_size:]
+        if zlib.crc32(payload) != checksum:
+            return None
+        return self._load(payload)
+
+    def _track(self, delta: int) -> None:
+        """Adjust the tracked cache size, once it has been counted"""
+        if self._total_bytes is not None:
+            self._total_bytes = max(self._total_bytes + delta, 0)
+
+    def _scan(self) -> Tuple[List[Tuple[float, int, Path]], int]:
+        """(mtime, size, path) of every entry, and their total size"""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        return entries, total
+
+    def _evict(self) -> None:
+        """Remove least-recently-used entries until under max_bytes"""
+        # Rescan: other processes sharing the directory change its size too
+        entries, total = self._scan()
+        if total > self.max_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+        self._total_bytes = total
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -4,72 +4,418 @@ Hexen CLI
 Command-line interface for Hexen compiler.
 """
 
+import functools
 import json
+import os
+import signal
 import sys
+import time
 from pathlib import Path
 
-from .parser import HexenParser
-from .semantic import SemanticAnalyzer
+# Only what a run answered by `hexen serve` needs is imported up front; the
+# parser (lark) and the analyzer are imported when the work is done here
+from .client import default_socket_path, send_request
+
+# The LALR parser builds the same ASTs as the reference Earley parser (see
+# hexen_lalr.lark), loads its tables from the grammar cache instead of
+# rebuilding them on every run, and transforms while it parses
+DEFAULT_PARSER_MODE = "lalr-treeless"
+
+OPTIONS = {
+    "parser",
+    "ast-cache",
+    "jobs",
+    "socket",
+    "no-server",
+    "output",
+    "emit",
+    "entry",
+    "opt",
+    "mcpu",
+    "mattr",
+    "time-passes",
+    "jit-cache",
+}
 
 
 def main():
     """Main CLI entry point"""
-    if len(sys.argv) != 3:
-        print("Usage:")
-        print("  hexen parse <file.hxn>     - Parse and show AST")
-        print("  hexen check <file.hxn>     - Parse and run semantic analysis")
+    args, options = _split_options(sys.argv[1:])
+
+    if args[:1] == ["serve"]:
+        _serve(args[1:], options)
+        return
+
+    if len(args) < 2 or set(options) - OPTIONS:
+        _print_usage()
         sys.exit(1)
 
-    command = sys.argv[1]
-    file_path = sys.argv[2]
+    command = args[0]
+    paths = args[1:]
 
-    if command not in ["parse", "check"]:
-        print("Commands: 'parse' or 'check'")
+    if command not in ["parse", "check", "build", "run"]:
+        print("Commands: 'parse', 'check', 'build', 'run' or 'serve'")
         sys.exit(1)
 
-    if not Path(file_path).exists():
-        print(f"Error: File '{file_path}' not found")
+    parser_mode = options.get("parser", DEFAULT_PARSER_MODE)
+
+    # Batch checks use every CPU unless told otherwise; a single file
+    # analyzes its functions in this process unless --jobs is given
+    batch = command == "check" and (len(paths) > 1 or Path(paths[0]).is_dir())
+    default_jobs = (os.cpu_count() or 1) if batch else 1
+    jobs = _parse_jobs(options.get("jobs"), default_jobs)
+    if jobs is None:
+        print("--jobs expects a positive number of processes")
         sys.exit(1)
 
-    try:
-        parser = HexenParser()
-        ast = parser.parse_file(file_path)
-
-        print("✅ Parse successful!")
-
-        if command == "parse":
-            # Just show the AST
-            print("\n🌳 Abstract Syntax Tree:")
-            print(json.dumps(ast, indent=2))
-
-        elif command == "check":
-            # Run semantic analysis
-            analyzer = SemanticAnalyzer()
-            errors = analyzer.analyze(ast)
-
-            if errors:
-                print(f"\n❌ Semantic errors found ({len(errors)}):")
-                for error in errors:
-                    print(f"   • {error.message}")
-                sys.exit(1)
-            else:
-                print("\n✅ Semantic analysis passed - no errors found!")
-                print("\n📊 Symbol Information:")
-                _show_symbol_table(analyzer.symbol_table)
+    for path in paths:
+        if not Path(path).exists():
+            print(f"Error: File '{path}' not found")
+            sys.exit(1)
+
+    if command in ("build", "run"):
+        if len(paths) != 1:
+            _print_usage()
+            sys.exit(1)
+        _check_pass_timing(options)
+        if command == "build":
+            _build(paths[0], parser_mode, options)
+        else:
+            _run(paths[0], parser_mode, options)
+        return
+
+    if batch:
+        _check_batch(paths, jobs, parser_mode, "ast-cache" in options)
+        return
+
+    if len(paths) != 1:
+        _print_usage()
+        sys.exit(1)
+
+    request = {
+        "command": command,
+        "path": os.path.abspath(paths[0]),
+        "parser": parser_mode,
+        "ast_cache": "ast-cache" in options,
+        "jobs": jobs,
+    }
+    # A running `hexen serve` answers with warm parsers and analyzer;
+    # otherwise the same service runs here for this one request
+    response = None
+    if "no-server" not in options:
+        response = send_request(request, options.get("socket") or None)
+    if response is None:
+        from .server import CompileService
 
+        response = CompileService(incremental=False).handle(request)
+    _print_response(command, response)
+
+
+def _print_response(command, response):
+    """Print a parse/check response and exit with its status"""
+    status = response.get("status")
+    if status == "usage":
+        print(response["message"])
+        sys.exit(1)
+    if status == "syntax_error":
+        print(f"❌ {response['message']}")
+        sys.exit(1)
+    if status != "ok":
+        print(f"❌ Unexpected error: {response.get('message')}")
+        sys.exit(1)
+
+    print("✅ Parse successful!")
+
+    if command == "parse":
+        # Just show the AST
+        print("\n🌳 Abstract Syntax Tree:")
+        print(json.dumps(response["ast"], indent=2))
+        return
+
+    errors = response["errors"]
+    if errors:
+        print(f"\n❌ Semantic errors found ({len(errors)}):")
+        for error in errors:
+            print(f"   • {error}")
+        sys.exit(1)
+    print("\n✅ Semantic analysis passed - no errors found!")
+    print("\n📊 Symbol Information:")
+    print("   Analysis completed successfully")
+
+
+def _generate(path, parser_mode, timings):
+    """Parse, check and lower one file, recording the time of each phase"""
+    from .codegen import CodeGenerator, CodegenError
+    from .parser import HexenParser
+    from .semantic import SemanticAnalyzer
+
+    if parser_mode not in HexenParser.MODES:
+        print(f"Parser modes: {', '.join(HexenParser.MODES)}")
+        sys.exit(1)
+
+    start_time = time.perf_counter()
+    parser = HexenParser(mode=parser_mode, track_spans=True)
+    try:
+        ast = parser.parse_file(path)
     except SyntaxError as e:
         print(f"❌ {e}")
         sys.exit(1)
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+    timings["parse"] = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    errors = SemanticAnalyzer().analyze(ast)
+    if errors:
+        print(f"❌ Semantic errors found ({len(errors)}):")
+        for error in errors:
+            print(f"   • {error.format(parser.source_map)}")
         sys.exit(1)
+    timings["check"] = time.perf_counter() - start_time
 
+    start_time = time.perf_counter()
+    try:
+        module = CodeGenerator(module_name=Path(path).stem).generate(ast)
+    except CodegenError as e:
+        print(f"❌ {e.format(parser.source_map)}")
+        sys.exit(1)
+    timings["IR generation"] = time.perf_counter() - start_time
+    return ast, module, parser.source_map
 
-def _show_symbol_table(symbol_table):
-    """Display symbol table information"""
-    # Note: After analysis, we're back to global scope, but we can show
-    # what was analyzed. For now, let's just indicate analysis completed.
-    print("   Analysis completed successfully")
+
+def _optimization_level(options):
+    """The -O level of build/run, exiting on an unknown level"""
+    from .codegen import OPT_LEVELS
+    from .codegen.target import DEFAULT_OPT_LEVEL
+
+    opt_level = options.get("opt") or DEFAULT_OPT_LEVEL
+    if opt_level not in OPT_LEVELS:
+        levels = ", ".join(f"-O{level}" for level in OPT_LEVELS)
+        print(f"Optimization levels: {levels}")
+        sys.exit(1)
+    return opt_level
+
+
+def _check_pass_timing(options):
+    """Exit when --time-passes is given but llvmlite cannot time passes"""
+    from .codegen import PASS_TIMING_SUPPORTED
+
+    if "time-passes" in options and not PASS_TIMING_SUPPORTED:
+        print("--time-passes requires llvmlite 0.45 or newer")
+        sys.exit(1)
+
+
+def _compile(module, opt_level, options, timings, object_cache=None):
+    """
+    Compile and optimize a generated module for the selected target.
+
+    With an object cache, also returns the key the module's machine code is
+    cached under and, for an unchanged module, the cached machine code; the
+    module is then left unoptimized since the JIT will not compile it.
+    """
+    from .codegen import compile_module, host_target_machine, optimize, resolve_cpu
+
+    start_time = time.perf_counter()
+    cpu, features = resolve_cpu(options.get("mcpu") or "", options.get("mattr") or "")
+    machine = host_target_machine(cpu, features, opt_level)
+    compiled = compile_module(module, machine)
+    key = object_code = report = None
+    if object_cache is not None:
+        key = object_cache.key(str(compiled), machine.triple, cpu, features, opt_level)
+        object_code = object_cache.get(key)
+    if object_code is None:
+        report = optimize(compiled, machine, opt_level, "time-passes" in options)
+    timings["LLVM optimization"] = time.perf_counter() - start_time
+    return compiled, machine, report, key, object_code
+
+
+def _build(path, parser_mode, options):
+    """Compile one file to an object file, assembly or LLVM IR"""
+    from .codegen import EMIT_SUFFIXES, emit_compiled
+
+    emit_format = options.get("emit") or "obj"
+    if emit_format not in EMIT_SUFFIXES:
+        print(f"Emit formats: {', '.join(EMIT_SUFFIXES)}")
+        sys.exit(1)
+    opt_level = _optimization_level(options)
+
+    _, module, _ = _generate(path, parser_mode, {})
+    compiled, machine, report, _, _ = _compile(module, opt_level, options, {})
+    output = options.get("output") or str(
+        Path(path).with_suffix(EMIT_SUFFIXES[emit_format])
+    )
+    Path(output).write_bytes(emit_compiled(compiled, machine, emit_format))
+    print(f"✅ Wrote {output}")
+    if report is not None:
+        print(report)
+
+
+def _run(path, parser_mode, options):
+    """JIT-compile one file, call its entry function and report timings"""
+    from .codegen import CodegenError, JitProgram, ObjectCache
+
+    entry = options.get("entry") or "main"
+    opt_level = _optimization_level(options)
+    object_cache = ObjectCache() if "jit-cache" in options else None
+    timings = {}
+    ast, module, source_map = _generate(path, parser_mode, timings)
+    compiled, machine, report, key, object_code = _compile(
+        module, opt_level, options, timings, object_cache
+    )
+
+    start_time = time.perf_counter()
+    on_compiled = None
+    if object_cache is not None:
+        on_compiled = functools.partial(object_cache.put, key)
+    program = JitProgram(compiled, ast, machine, object_code, on_compiled)
+    timings["JIT compilation"] = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    try:
+        result = program.call(entry)
+    except CodegenError as e:
+        print(f"❌ {e.format(source_map)}")
+        sys.exit(1)
+    timings["execution"] = time.perf_counter() - start_time
+
+    if result is None:
+        print(f"✅ {entry}() finished")
+    else:
+        print(f"✅ {entry}() returned {result}")
+    cached = ", cached machine code" if object_code is not None else ""
+    print(f"\n📊 Timings (-O{opt_level}{cached}):")
+    for phase, seconds in timings.items():
+        print(f"   {phase + ':':<20} {seconds * 1000:9.2f} ms")
+    if report is not None:
+        print(f"\n{report}")
+
+
+def _serve(args, options):
+    """Run the compile server in the foreground, or stop it with --stop"""
+    if args or set(options) - {"socket", "stop"}:
+        _print_usage()
+        sys.exit(1)
+    socket_path = options.get("socket") or default_socket_path()
+
+    if "stop" in options:
+        if send_request({"command": "shutdown"}, socket_path) is None:
+            print(f"No Hexen server running on {socket_path}")
+            sys.exit(1)
+        print("🛑 Hexen server stopped")
+        return
+
+    from .server import create_server, serve
+
+    try:
+        server = create_server(socket_path)
+    except (RuntimeError, OSError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    # Remove the socket on `kill` as well as on Ctrl-C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"🚀 Hexen server listening on {socket_path} (pid {os.getpid()})")
+    sys.stdout.flush()
+    try:
+        serve(server)
+    except KeyboardInterrupt:
+        pass
+    print("🛑 Hexen server stopped")
+
+
+def _print_usage():
+    """Display command-line usage"""
+    print("Usage:")
+    print("  hexen parse <file.hxn>     - Parse and show AST")
+    print("  hexen check <file.hxn>     - Parse and run semantic analysis")
+    print("  hexen check <paths...>     - Check many files and directories")
+    print("  hexen build <file.hxn>     - Compile to a native object file")
+    print("  hexen run <file.hxn>       - JIT-compile and call the entry function")
+    print("  hexen serve                - Run the compile server (--stop stops it)")
+    print("Options:")
+    print("  --parser=MODE              - earley, lalr or lalr-treeless (default)")
+    print("  --ast-cache                - Reuse cached ASTs for unchanged files")
+    print("  --jobs[=N]                 - Check function bodies (one file) or")
+    print("                               files (batch) in N processes;")
+    print("                               all CPUs when N is omitted")
+    print("  --emit=FORMAT              - build output: obj (default), asm or llvm")
+    print("  --output=PATH              - build output file (default: next to")
+    print("                               the source, .o/.s/.ll)")
+    print("  --entry=NAME               - run entry function (default: main)")
+    print("  -O0, -O1, -O2, -O3, -Os    - build/run optimization level (default:")
+    print("                               -O2; -Os optimizes for size)")
+    print("  --mcpu=CPU                 - build/run target CPU; native for the host")
+    print("  --mattr=FEATURES           - build/run CPU features, e.g. +avx2,-fma")
+    print("  --time-passes              - Report the time spent in each LLVM pass")
+    print("  --jit-cache                - Reuse run's cached machine code for")
+    print("                               unchanged programs")
+    print("  --socket=PATH              - Compile server socket")
+    print("  --no-server                - Do not use a running compile server")
+
+
+def _split_options(argv):
+    """Separate positional arguments from --name=value options (and -O<level>)"""
+    args = []
+    options = {}
+    for arg in argv:
+        if arg.startswith("-O"):
+            options["opt"] = arg[2:]
+        elif arg.startswith("--"):
+            name, _, value = arg[2:].partition("=")
+            options[name] = value
+        else:
+            args.append(arg)
+    return args, options
+
+
+def _check_batch(paths, jobs, parser_mode, ast_cache):
+    """Check every file below paths, streaming results, then summarize"""
+    from .batch import check_files, collect_sources
+    from .parser import HexenParser
+
+    if parser_mode not in HexenParser.MODES:
+        print(f"Parser modes: {', '.join(HexenParser.MODES)}")
+        sys.exit(1)
+
+    files = collect_sources(paths)
+    if not files:
+        print("No .hxn files found")
+        sys.exit(1)
+
+    processes = min(jobs, len(files))
+    print(f"🔍 Checking {len(files)} files with {processes} process(es)", flush=True)
+    start_time = time.perf_counter()
+    failed = 0
+    for result in check_files(files, jobs, parser_mode, ast_cache):
+        if result.ok:
+            print(f"✅ {result.path}", flush=True)
+            continue
+        failed += 1
+        if result.failure is not None:
+            print(f"❌ {result.path}: {result.failure}", flush=True)
+            continue
+        print(f"❌ {result.path}: semantic errors found ({len(result.errors)})")
+        for error in result.errors:
+            print(f"   • {error}")
+        sys.stdout.flush()
+    elapsed = time.perf_counter() - start_time
+
+    print(
+        f"\n📊 {len(files)} files checked in {elapsed:.2f}s "
+        f"({len(files) / elapsed:.1f} files/sec): "
+        f"{len(files) - failed} passed, {failed} failed"
+    )
+    if failed:
+        sys.exit(1)
+
+
+def _parse_jobs(value, default):
+    """Worker count for --jobs[=N]: default when absent, all CPUs without N"""
+    if value is None:
+        return default
+    if value == "":
+        return os.cpu_count() or 1
+    if not value.isdigit() or int(value) < 1:
+        return None
+    return int(value)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""
+Hexen Compile Server Client
+
+Sends requests to a running `hexen serve` daemon (see hexen.server). This
+module only needs the standard library's json and socket, so a CLI run that
+is answered by the server never imports lark, builds a parser or constructs
+an analyzer.
+"""
+
+import json
+import os
+import socket
+from typing import Any, Dict, Optional
+
+# Overrides the default socket path
+SOCKET_ENV = "HEXEN_SOCKET"
+
+# Seconds to wait for a response; a cold check of a large file can be slow
+REQUEST_TIMEOUT = 120.0
+
+
+def default_socket_path() -> str:
+    """
+    Return the Unix socket path the server listens on by default.
+
+    Resolved in order from:
+    1. $HEXEN_SOCKET
+    2. $XDG_RUNTIME_DIR/hexen.sock
+    3. $TMPDIR (or /tmp)/hexen-<uid>.sock
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "hexen.sock")
+    temp_dir = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(temp_dir, f"hexen-{os.getuid()}.sock")
+
+
+def send_request(
+    request: Dict[str, Any],
+    socket_path: Optional[str] = None,
+    timeout: float = REQUEST_TIMEOUT,
+) -> Optional[Dict[str, Any]]:
+    """
+    Send one request to the server and return its response.
+
+    Returns None when no server is reachable (no socket, a stale socket, or
+    a connection lost before the response arrived), so callers can fall
+    back to doing the work themselves.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(timeout)
+            connection.connect(socket_path or default_socket_path())
+            connection.sendall(json.dumps(request).encode() + b"\n")
+            with connection.makefile("rb") as stream:
+                line = stream.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def server_running(socket_path: Optional[str] = None) -> bool:
+    """Whether a server answers on the socket"""
+    response = send_request({"command": "ping"}, socket_path, timeout=5.0)
+    return response is not None and response.get("status") == "ok"
@@ -0,0 +1,39 @@
+"""
+Hexen Code Generation Package
+
+Lowers semantically checked programs to LLVM IR (llvmlite) and emits
+native object files, assembly or textual IR for the host, or runs them
+in-process with the MCJIT engine.
+"""
+
+from .errors import CodegenError
+from .generator import CodeGenerator
+from .jit import JitProgram
+from .object_cache import ObjectCache
+from .target import (
+    EMIT_SUFFIXES,
+    OPT_LEVELS,
+    PASS_TIMING_SUPPORTED,
+    compile_module,
+    emit,
+    emit_compiled,
+    host_target_machine,
+    optimize,
+    resolve_cpu,
+)
+
+__all__ = [
+    "CodeGenerator",
+    "CodegenError",
+    "EMIT_SUFFIXES",
+    "JitProgram",
+    "OPT_LEVELS",
+    "ObjectCache",
+    "PASS_TIMING_SUPPORTED",
+    "compile_module",
+    "emit",
+    "emit_compiled",
+    "host_target_machine",
+    "optimize",
+    "resolve_cpu",
+]
@@ -0,0 +1,213 @@
+"""
+Compile-Time Evaluation for Code Generation
+
+Folds the expressions the semantic analyzer typed as comptime_int,
+comptime_float or comptime arrays into Python values (int, float, bool and
+nested lists). The code generator emits them as constants of whatever type
+the context asks for, so `val k = 40 + 2` costs nothing at runtime and the
+same k can become an i32 in one place and an f64 in another.
+
+Range materializations with literal bounds ([0..10], [0.0..1.0:0.25]) are
+comptime arrays as well, as long as the analyzer could size them.
+
+Integer arithmetic is exact; float arithmetic uses Python's doubles.
+Division truncates toward zero and remainders take the sign of the
+dividend, matching the sdiv/srem/frem instructions used at runtime.
+"""
+
+import math
+from typing import Any, Callable, Dict, List
+
+from ..ast_nodes import NodeType
+from ..semantic.types import ArrayType, ComptimeArrayType
+from .errors import CodegenError
+from .llvm_types import FLOAT_TYPES, INTEGER_TYPES
+
+_LOGICAL_OPERATORS = frozenset({"&&", "||"})
+
+
+def _is_full_range(node: Dict) -> bool:
+    return node.get("type") == NodeType.RANGE_EXPR.value and all(
+        node.get(bound) is None for bound in ("start", "end", "step")
+    )
+
+
+class NotComptime(Exception):
+    """The expression depends on a runtime value"""
+
+
+class ComptimeEvaluator:
+    """
+    Evaluates comptime expressions with callbacks into the code generator.
+
+    lookup_value(name) returns the compile-time value of a variable or
+    raises NotComptime; type_of(node) returns the analyzed type of an
+    expression (used for .length).
+    """
+
+    def __init__(
+        self,
+        lookup_value: Callable[[str], Any],
+        type_of: Callable[[Dict], Any],
+    ):
+        self._lookup_value = lookup_value
+        self._type_of = type_of
+        # Variables declared inside the expression blocks being evaluated
+        self._locals: List[Dict[str, Any]] = []
+        self._handlers = {
+            NodeType.COMPTIME_INT.value: lambda node: node["value"],
+            NodeType.COMPTIME_FLOAT.value: lambda node: node["value"],
+            NodeType.LITERAL.value: self._literal,
+            NodeType.IDENTIFIER.value: self._identifier,
+            NodeType.BINARY_OPERATION.value: self._binary_operation,
+            NodeType.NARY_OPERATION.value: self._nary_operation,
+            NodeType.UNARY_OPERATION.value: self._unary_operation,
+            NodeType.EXPLICIT_CONVERSION_EXPRESSION.value: self._conversion,
+            NodeType.BLOCK.value: self._block,
+            NodeType.ARRAY_LITERAL.value: self._array_literal,
+            NodeType.ARRAY_ACCESS.value: self._array_access,
+            NodeType.ARRAY_COPY.value: lambda node: list(self.evaluate(node["array"])),
+            NodeType.PROPERTY_ACCESS.value: self._property_access,
+        }
+
+    def evaluate(self, node: Dict) -> Any:
+        """Value of a compile-time expression; raises NotComptime otherwise"""
+        handler = self._handlers.get(node.get("type"))
+        if handler is None:
+            raise NotComptime(node)
+        return handler(node)
+
+    def _literal(self, node: Dict) -> Any:
+        value = node.get("value")
+        if not isinstance(value, bool):
+            raise NotComptime(node)
+        return value
+
+    def _identifier(self, node: Dict) -> Any:
+        name = node["name"]
+        for scope in reversed(self._locals):
+            if name in scope:
+                return scope[name]
+        return self._lookup_value(name)
+
+    def _binary_operation(self, node: Dict) -> Any:
+        # Operator chains are left-deep: walk the left spine iteratively
+        spine = []
+        while node.get("type") == NodeType.BINARY_OPERATION.value:
+            spine.append(node)
+            node = node["left"]
+        value = self.evaluate(node)
+        for operation in reversed(spine):
+            value = self._apply(operation, value, self.evaluate(operation["right"]))
+        return value
+
+    def _nary_operation(self, node: Dict) -> Any:
+        operands = node["operands"]
+        value = self.evaluate(operands[0])
+        for operand in operands[1:]:
+            value = self._apply(node, value, self.evaluate(operand))
+        return value
+
+    def _apply(self, node: Dict, left: Any, right: Any) -> Any:
+        operator = node["operator"]
+        if operator == "+":
+            return left + right
+        if operator == "-":
+            return left - right
+        if operator == "*":
+            return left * right
+        if operator in ("/", "\\", "%") and right == 0:
+            raise CodegenError("Division by zero in compile-time expression", node)
+        if operator == "/":
+            return left / right
+        if operator == "\\":
+            quotient = abs(left) // abs(right)
+            return quotient if (left < 0) == (right < 0) else -quotient
+        if operator == "%":
+            if isinstance(left, float) or isinstance(right, float):
+                return math.fmod(left, right)
+            remainder = abs(left) % abs(right)
+            return remainder if left >= 0 else -remainder
+        if operator in _LOGICAL_OPERATORS:
+            return (left and right) if operator == "&&" else (left or right)
+        comparisons = {
+            "<": left < right,
+            ">": left > right,
+            "<=": left <= right,
+            ">=": left >= right,
+            "==": left == right,
+            "!=": left != right,
+        }
+        if operator not in comparisons:
+            raise NotComptime(node)
+        return comparisons[operator]
+
+    def _unary_operation(self, node: Dict) -> Any:
+        value = self.evaluate(node["operand"])
+        if node["operator"] == "-":
+            return -value
+        return not value
+
+    def _conversion(self, node: Dict) -> Any:
+        value = self.evaluate(node["expression"])
+        target_type = self._type_of(node)
+        if target_type in INTEGER_TYPES:
+            return int(value)
+        if target_type in FLOAT_TYPES:
+            return float(value)
+        raise NotComptime(node)
+
+    def _block(self, node: Dict) -> Any:
+        self._locals.append({})
+        try:
+            for statement in node.get("statements", []):
+                statement_type = statement.get("type")
+                if statement_type == NodeType.ASSIGN_STATEMENT.value:
+                    return self.evaluate(statement["value"])
+                if (
+                    statement_type != NodeType.VAL_DECLARATION.value
+                    or statement.get("type_annotation") is not None
+                ):
+                    raise NotComptime(statement)
+                self._locals[-1][statement["name"]] = self.evaluate(statement["value"])
+            raise NotComptime(node)
+        finally:
+            self._locals.pop()
+
+    def _array_literal(self, node: Dict) -> Any:
+        elements = node["elements"]
+        if len(elements) == 1 and elements[0].get("type") == NodeType.RANGE_EXPR.value:
+            return self._range(node, elements[0])
+        return [self.evaluate(element) for element in elements]
+
+    def _range(self, node: Dict, range_node: Dict) -> Any:
+        """Elements of [start..end:step], as many as the analyzer counted"""
+        length = self._type_of(node).dimensions[0]
+        if length == "_":
+            raise NotComptime(node)
+        start = self.evaluate(range_node["start"])
+        step = range_node.get("step")
+        step = 1 if step is None else self.evaluate(step)
+        return [start + index * step for index in range(length)]
+
+    def _array_access(self, node: Dict) -> Any:
+        array = self.evaluate(node["array"])
+        if _is_full_range(node["index"]):
+            return list(array)
+        index = self.evaluate(node["index"])
+        if not 0 <= index < len(array):
+            raise CodegenError(
+                f"Array index {index} out of bounds for length {len(array)}", node
+            )
+        return array[index]
+
+    def _property_access(self, node: Dict) -> Any:
+        if node.get("property") != "length":
+            raise NotComptime(node)
+        array_type = self._type_of(node["object"])
+        if not isinstance(array_type, (ArrayType, ComptimeArrayType)):
+            raise NotComptime(node)
+        length = array_type.dimensions[0]
+        if length == "_":
+            raise NotComptime(node)
+        return length
@@ -0,0 +1,36 @@
+"""
+Hexen Code Generation Errors
+
+Raised when a semantically valid program uses a construct the code
+generator does not lower yet (strings, ranges, inferred-size arrays, ...).
+"""
+
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from ..source_map import SourceMap
+
+
+class CodegenError(Exception):
+    """
+    Code generation failure with optional AST node context.
+
+    Like SemanticError, the node is located through the parser's SourceMap
+    only when the error is rendered with format().
+    """
+
+    def __init__(self, message: str, node: Optional[Dict] = None):
+        self.message = message
+        self.node = node
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return self.message
+
+    def format(self, source_map: Optional["SourceMap"] = None) -> str:
+        """Render the error as "line:column: message" when the node is known"""
+        location = source_map.location(self.node) if source_map else None
+        if location is None:
+            return self.message
+        line, column = location
+        return f"{line}:{column}: {self.message}"
@@ -0,0 +1,907 @@
+"""
+Hexen LLVM IR Generator
+
+Lowers a semantically checked program to an llvmlite ir.Module.
+
+The generator does not re-implement Hexen's type rules. It keeps a
+SemanticAnalyzer as a type oracle and mirrors, while walking the program,
+the scopes and symbols the analyzer saw at the same point. Each expression
+is then typed exactly as it was checked: analyze_expression(node, target)
+with the target the analyzer used for that position.
+
+Lowering rules:
+- Expressions typed comptime_int/comptime_float (and comptime arrays) are
+  folded at compile time and emitted as constants of the type their context
+  asks for; a `val` of comptime type becomes a compile-time constant, not
+  storage
+- `val` locals of scalar type are SSA values, `mut` locals, mut parameters
+  and arrays live in stack slots (allocas in the entry block)
+- Arrays are passed and returned by value; indexing with a constant is
+  checked at compile time, a runtime index is checked against the length
+  and traps (llvm.trap) when out of bounds
+- Arrays whose value is known at compile time (comptime array literals,
+  constant-bound range materializations) become private read-only
+  globals, one per distinct value: `val` arrays and comptime arrays indexed
+  at runtime read the global directly, `mut` arrays copy it with a single
+  llvm.memcpy
+- Conditionals and expression blocks are lowered to branches; the value of
+  a conditional expression is merged with a phi
+
+Top-level statements are not lowered: functions cannot see them and they
+have no side effects. Strings, range values and materializations with
+runtime bounds, array slicing and inferred-size ([_]) parameters are
+rejected with a CodegenError.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from llvmlite import ir
+
+from ..ast_nodes import NodeType
+from ..semantic import SemanticAnalyzer
+from ..semantic.symbol_table import Symbol, create_function_signature_from_ast
+from ..semantic.types import (
+    ArrayType,
+    ComptimeArrayType,
+    HexenType,
+    Mutability,
+    intern_array_type,
+)
+from .comptime import ComptimeEvaluator, NotComptime
+from .errors import CodegenError
+from .llvm_types import (
+    FLOAT_TYPES,
+    INDEX_TYPE,
+    INTEGER_TYPES,
+    SIGNED_TYPES,
+    UNSIGNED_TYPES,
+    element_type,
+    is_comptime,
+    llvm_type,
+    materialize,
+    size_of,
+)
+
+_ARITHMETIC_OPERATORS = frozenset({"+", "-", "*", "/", "\\", "%"})
+_COMPARISON_OPERATORS = frozenset({"<", ">", "<=", ">=", "==", "!="})
+_LOGICAL_OPERATORS = frozenset({"&&", "||"})
+
+_BOOL = ir.IntType(1)
+_BYTE_POINTER = ir.IntType(8).as_pointer()
+
+
+@dataclass(slots=True)
+class _Variable:
+    """
+    A local: a compile-time value ("comptime"), an SSA value ("value") or a
+    stack slot ("pointer"), with its Hexen type.
+    """
+
+    kind: str
+    storage: Any
+    type: Any
+
+
+class CodeGenerator:
+    """
+    Generates LLVM IR for programs that passed semantic analysis.
+
+    Lowering a program with semantic errors is undefined: check it with
+    SemanticAnalyzer.analyze() first. One generator can lower any number of
+    programs.
+    """
+
+    def __init__(self, module_name: str = "hexen"):
+        self.module_name = module_name
+        self._oracle = SemanticAnalyzer()
+        self._comptime = ComptimeEvaluator(
+            self._comptime_value, lambda node: self._type_of(node, None)
+        )
+        self._expression_handlers = {
+            NodeType.IDENTIFIER.value: self._identifier,
+            NodeType.LITERAL.value: self._literal,
+            NodeType.BINARY_OPERATION.value: self._binary_operation,
+            NodeType.NARY_OPERATION.value: self._nary_operation,
+            NodeType.UNARY_OPERATION.value: self._unary_operation,
+            NodeType.EXPLICIT_CONVERSION_EXPRESSION.value: self._conversion,
+            NodeType.BLOCK.value: self._expression_block,
+            NodeType.CONDITIONAL_STATEMENT.value: self._conditional,
+            NodeType.FUNCTION_CALL.value: self._function_call,
+            NodeType.ARRAY_LITERAL.value: self._array_literal,
+            NodeType.ARRAY_ACCESS.value: self._array_access,
+            NodeType.ARRAY_COPY.value: lambda node, target, result_type: (
+                self._emit_as(node["array"], target, result_type)
+            ),
+        }
+        self._statement_handlers = {
+            NodeType.VAL_DECLARATION.value: self._declaration,
+            NodeType.MUT_DECLARATION.value: self._declaration,
+            NodeType.ASSIGNMENT_STATEMENT.value: self._assignment,
+            NodeType.RETURN_STATEMENT.value: self._return,
+            NodeType.CONDITIONAL_STATEMENT.value: lambda node: self._conditional(
+                node, None, None
+            ),
+            NodeType.FUNCTION_CALL_STATEMENT.value: lambda node: self._emit(
+                node["function_call"], None
+            ),
+            NodeType.BLOCK.value: self._statement_block,
+        }
+
+    def generate(self, ast: Dict) -> ir.Module:
+        """Lower a checked program node to a new module"""
+        self.module = ir.Module(name=self.module_name)
+        self._functions: Dict[str, Tuple[ir.Function, Any]] = {}
+        self._trap_function: Optional[ir.Function] = None
+        self._memcpy_function: Optional[ir.Function] = None
+        # Constant globals by initializer, so equal tables are emitted once
+        self._constant_globals: Dict[str, ir.GlobalVariable] = {}
+        self._oracle.reset()
+        try:
+            for function in ast.get("functions", []):
+                self._function(function)
+        finally:
+            # Drop the mirrored symbols and memoized types (and the AST)
+            self._oracle.reset()
+        return self.module
+
+    # =========================================================================
+    # Functions, scopes and statements
+    # =========================================================================
+
+    def _function(self, node: Dict) -> None:
+        signature = create_function_signature_from_ast(node)
+        symbols = self._oracle.symbol_table
+        # Declared before the body: functions may call themselves
+        symbols.declare_function(signature)
+        function_type = ir.FunctionType(
+            llvm_type(signature.return_type, node),
+            [llvm_type(p.param_type, node) for p in signature.parameters],
+        )
+        function = ir.Function(self.module, function_type, name=signature.name)
+        self._functions[signature.name] = (function, signature)
+
+        self._current = function
+        self._return_type = signature.return_type
+        self._trap_block = None
+        # Stack slots go to the entry block, which jumps to the body last
+        self._allocas = ir.IRBuilder(function.append_basic_block("entry"))
+        body = function.append_basic_block("body")
+        self._builder = ir.IRBuilder(body)
+
+        symbols.enter_function_scope(signature.name)
+        self._oracle._set_function_context(signature.name, signature.return_type)
+        self._scopes: List[Dict[str, _Variable]] = [{}]
+        try:
+            for parameter, argument in zip(signature.parameters, function.args):
+                argument.name = parameter.name
+                variable = _Variable("value", argument, parameter.param_type)
+                if parameter.is_mutable or isinstance(parameter.param_type, ArrayType):
+                    variable = self._stack_variable(argument, parameter.param_type)
+                self._scopes[-1][parameter.name] = variable
+            self._statement_block(node["body"])
+        finally:
+            self._oracle._clear_function_context()
+            symbols.exit_function_scope()
+
+        if not self._builder.block.is_terminated:
+            if signature.return_type == HexenType.VOID:
+                self._builder.ret_void()
+            else:
+                self._builder.unreachable()
+        self._allocas.branch(body)
+
+    def _enter_scope(self) -> None:
+        self._scopes.append({})
+        self._oracle.symbol_table.enter_scope()
+
+    def _exit_scope(self) -> None:
+        self._scopes.pop()
+        self._oracle.symbol_table.exit_scope()
+
+    def _declare(self, name: str, variable: _Variable, symbol_type, mutable: bool):
+        self._scopes[-1][name] = variable
+        mutability = Mutability.MUTABLE if mutable else Mutability.IMMUTABLE
+        self._oracle.symbol_table.declare_symbol(
+            Symbol(name, symbol_type, mutability, initialized=True)
+        )
+
+    def _lookup(self, name: str, node: Dict) -> _Variable:
+        for scope in reversed(self._scopes):
+            variable = scope.get(name)
+            if variable is not None:
+                return variable
+        raise CodegenError(f"Undefined variable: '{name}'", node)
+
+    def _statement_block(self, node: Dict) -> None:
+        self._enter_scope()
+        try:
+            for statement in node.get("statements", []):
+                self._statement(statement)
+        finally:
+            self._exit_scope()
+
+    def _statement(self, node: Dict) -> None:
+        handler = self._statement_handlers.get(node.get("type"))
+        if handler is None:
+            raise CodegenError(
+                f"Statement '{node.get('type')}' is not supported by code "
+                "generation yet",
+                node,
+            )
+        handler(node)
+
+    def _declaration(self, node: Dict) -> None:
+        name = node["name"]
+        value = node["value"]
+        mutable = node["type"] == NodeType.MUT_DECLARATION.value
+        annotation = node.get("type_annotation")
+
+        if annotation is None:
+            # Inferred: val keeps comptime types, like the analyzer
+            target = None
+            var_type = self._type_of(value, None)
+        else:
+            target = self._oracle.declaration_analyzer._parse_type_annotation(
+                annotation
+            )
+            var_type = target
+            if _is_undef(value):
+                pointer = self._allocas.alloca(llvm_type(var_type, node), name=name)
+                variable = _Variable("pointer", pointer, var_type)
+                self._declare(name, variable, var_type, True)
+                return
+            if isinstance(var_type, ArrayType) and "_" in var_type.dimensions:
+                var_type = self._inferred_array_type(var_type, value, node)
+
+        symbol_type = var_type
+        if is_comptime(var_type):
+            try:
+                constant = self._comptime.evaluate(value)
+                variable = _Variable("comptime", constant, var_type)
+                self._declare(name, variable, symbol_type, mutable)
+                return
+            except NotComptime:
+                var_type = materialize(var_type)
+
+        if isinstance(var_type, ArrayType):
+            source = self._constant_global(value, target, var_type)
+            if source is not None:
+                # A val reads the global itself; a mut copies it once
+                if mutable:
+                    storage = llvm_type(var_type, node)
+                    pointer = self._allocas.alloca(storage, name=name)
+                    self._copy(pointer, source, var_type)
+                    source = pointer
+                variable = _Variable("pointer", source, var_type)
+                self._declare(name, variable, symbol_type, mutable)
+                return
+
+        result = self._emit_as(value, target, var_type)
+        if mutable or isinstance(var_type, ArrayType):
+            variable = self._stack_variable(result, var_type, name)
+        else:
+            variable = _Variable("value", result, var_type)
+        self._declare(name, variable, symbol_type, mutable)
+
+    def _inferred_array_type(self, annotated: ArrayType, value: Dict, node: Dict):
+        """[_] dimensions of a declaration, taken from the value's shape"""
+        value_type = self._type_of(value, None)
+        dimensions = getattr(value_type, "dimensions", None)
+        if (
+            not isinstance(value_type, (ArrayType, ComptimeArrayType))
+            or "_" in dimensions
+            or len(dimensions) != len(annotated.dimensions)
+        ):
+            raise CodegenError(f"Cannot infer the size of array type {annotated}", node)
+        return intern_array_type(annotated.element_type, dimensions)
+
+    def _assignment(self, node: Dict) -> None:
+        variable = self._lookup(node["target"], node)
+        if isinstance(variable.type, ArrayType):
+            source = self._constant_global(node["value"], variable.type, variable.type)
+            if source is not None:
+                self._copy(variable.storage, source, variable.type)
+                return
+        value = self._emit_as(node["value"], variable.type, variable.type)
+        self._builder.store(value, variable.storage)
+
+    def _return(self, node: Dict) -> None:
+        value = node.get("value")
+        if value is None:
+            self._builder.ret_void()
+        else:
+            return_type = self._return_type
+            self._builder.ret(self._emit_as(value, return_type, return_type))
+        # Statements after a return are unreachable but still lowered
+        self._builder.position_at_end(self._current.append_basic_block("dead"))
+
+    # =========================================================================
+    # Expressions
+    # =========================================================================
+
+    def _type_of(self, node: Dict, target):
+        """The analyzed type of an expression under the analyzer's target"""
+        result = self._oracle.expression_analyzer.analyze_expression(node, target)
+        if result is HexenType.UNKNOWN:
+            raise CodegenError("Cannot determine the type of this expression", node)
+        return result
+
+    def _emit(self, node: Dict, target, want=None) -> Tuple[ir.Value, Any]:
+        """
+        Lower an expression analyzed with target; returns (value, type).
+
+        Comptime values become constants of want (or target) when that is a
+        concrete type of the right kind, else of the default i32/f64.
+        """
+        node_type = self._type_of(node, target)
+        result_type = materialize(node_type, want if want is not None else target)
+        if is_comptime(node_type):
+            try:
+                value = self._comptime.evaluate(node)
+                return self._constant(value, result_type, node), result_type
+            except NotComptime:
+                pass
+        handler = self._expression_handlers.get(node.get("type"))
+        if handler is None:
+            raise CodegenError(
+                f"Expression '{node.get('type')}' is not supported by code "
+                "generation yet",
+                node,
+            )
+        return handler(node, target, result_type), result_type
+
+    def _emit_as(self, node: Dict, target, want) -> ir.Value:
+        """Lower an expression analyzed with target as a value of type want"""
+        value, value_type = self._emit(node, target, want)
+        return self._coerce(value, value_type, want, node)
+
+    def _comptime_value(self, name: str) -> Any:
+        for scope in reversed(self._scopes):
+            variable = scope.get(name)
+            if variable is not None:
+                if variable.kind != "comptime":
+                    raise NotComptime(name)
+                return variable.storage
+        raise NotComptime(name)
+
+    def _identifier(self, node: Dict, target, result_type) -> ir.Value:
+        variable = self._lookup(node["name"], node)
+        if variable.kind == "comptime":
+            return self._constant(variable.storage, result_type, node)
+        value = variable.storage
+        if variable.kind == "pointer":
+            value = self._builder.load(value, name=node["name"])
+        return self._coerce(value, variable.type, result_type, node)
+
+    def _literal(self, node: Dict, target, result_type) -> ir.Value:
+        if not isinstance(node.get("value"), bool):
+            raise CodegenError("Strings are not supported by code generation yet", node)
+        return ir.Constant(_BOOL, int(node["value"]))
+
+    def _binary_operation(self, node: Dict, target, result_type) -> ir.Value:
+        operator = node["operator"]
+        if operator in _LOGICAL_OPERATORS:
+            return self._logical(operator, [node["left"], node["right"]], target)
+        if operator in _COMPARISON_OPERATORS:
+            return self._comparison(node, target)
+
+        # Operator chains are left-deep: collect the concrete operations on
+        # the left spine and lower them innermost first, without recursion
+        spine = [(node, result_type)]
+        left = node["left"]
+        while (
+            left.get("type") == NodeType.BINARY_OPERATION.value
+            and left["operator"] in _ARITHMETIC_OPERATORS
+        ):
+            left_type = self._type_of(left, target)
+            if is_comptime(left_type):
+                break
+            spine.append((left, left_type))
+            left = left["left"]
+
+        operation, value_type = spine[-1]
+        value = self._emit_as(operation["left"], target, value_type)
+        for operation, operation_type in reversed(spine):
+            value = self._coerce(value, value_type, operation_type, operation)
+            right = self._emit_as(operation["right"], target, operation_type)
+            value = self._arithmetic(operation, value, right, operation_type)
+            value_type = operation_type
+        return value
+
+    def _nary_operation(self, node: Dict, target, result_type) -> ir.Value:
+        operator = node["operator"]
+        operands = node["operands"]
+        if operator in _LOGICAL_OPERATORS:
+            return self._logical(operator, operands, target)
+        value = self._emit_as(operands[0], target, result_type)
+        for operand in operands[1:]:
+            right = self._emit_as(operand, target, result_type)
+            value = self._arithmetic(node, value, right, result_type)
+        return value
+
+    def _arithmetic(self, node: Dict, left, right, result_type) -> ir.Value:
+        builder = self._builder
+        operator = node["operator"]
+        if result_type in FLOAT_TYPES:
+            operations = {
+                "+": builder.fadd,
+                "-": builder.fsub,
+                "*": builder.fmul,
+                "/": builder.fdiv,
+                "%": builder.frem,
+            }
+        elif result_type in INTEGER_TYPES:
+            signed = result_type in SIGNED_TYPES
+            operations = {
+                "+": builder.add,
+                "-": builder.sub,
+                "*": builder.mul,
+                "\\": builder.sdiv if signed else builder.udiv,
+                "%": builder.srem if signed else builder.urem,
+            }
+        else:
+            operations = {}
+        if operator not in operations:
+            raise CodegenError(
+                f"Operator '{operator}' on {result_type} is not supported by "
+                "code generation",
+                node,
+            )
+        return operations[operator](left, right)
+
+    def _comparison(self, node: Dict, target) -> ir.Value:
+        operator = node["operator"]
+        left_type = self._type_of(node["left"], target)
+        right_type = self._type_of(node["right"], target)
+        # A comptime side takes the type of the concrete side
+        if is_comptime(left_type) and is_comptime(right_type):
+            try:
+                return ir.Constant(_BOOL, int(self._comptime.evaluate(node)))
+            except NotComptime:
+                pass
+            floats = HexenType.COMPTIME_FLOAT in (left_type, right_type)
+            operand_type = HexenType.F64 if floats else HexenType.I64
+        elif is_comptime(left_type):
+            operand_type = right_type
+        elif is_comptime(right_type) or left_type == right_type:
+            operand_type = left_type
+        elif {left_type, right_type} & SIGNED_TYPES and (
+            {left_type, right_type} & UNSIGNED_TYPES
+        ):
+            return self._mixed_sign_comparison(node, target, left_type in SIGNED_TYPES)
+        else:
+            operand_type = _wider_type(left_type, right_type)
+
+        left = self._emit_as(node["left"], target, operand_type)
+        right = self._emit_as(node["right"], target, operand_type)
+        if operand_type in FLOAT_TYPES:
+            # != is true for NaN operands, the other comparisons false
+            if operator == "!=":
+                return self._builder.fcmp_unordered(operator, left, right)
+            return self._builder.fcmp_ordered(operator, left, right)
+        if operand_type in SIGNED_TYPES:
+            return self._builder.icmp_signed(operator, left, right)
+        if operand_type in INTEGER_TYPES or operand_type == HexenType.BOOL:
+            return self._builder.icmp_unsigned(operator, left, right)
+        raise CodegenError(
+            f"Comparing {operand_type} values is not supported by code generation",
+            node,
+        )
+
+    def _mixed_sign_comparison(self, node: Dict, target, signed_left: bool) -> ir.Value:
+        """
+        Compare a signed integer with a usize by value: a negative signed
+        operand is below every usize, otherwise both compare as unsigned.
+        """
+        builder = self._builder
+        operator = node["operator"]
+        left_type = HexenType.I64 if signed_left else HexenType.USIZE
+        right_type = HexenType.USIZE if signed_left else HexenType.I64
+        left = self._emit_as(node["left"], target, left_type)
+        right = self._emit_as(node["right"], target, right_type)
+        signed = left if signed_left else right
+        negative = builder.icmp_signed("<", signed, ir.Constant(signed.type, 0))
+        # Outcome when the signed operand is negative, i.e. the smaller one
+        smaller_is_true = {"<", "<=", "!="} if signed_left else {">", ">=", "!="}
+        negative_result = ir.Constant(_BOOL, int(operator in smaller_is_true))
+        unsigned_result = builder.icmp_unsigned(operator, left, right)
+        return builder.select(negative, negative_result, unsigned_result)
+
+    def _logical(self, operator: str, operands: List[Dict], target) -> ir.Value:
+        """Short-circuit && and ||: later operands run only when needed"""
+        builder = self._builder
+        label = "and" if operator == "&&" else "or"
+        # The value every skipped operand leaves behind
+        short_circuit = ir.Constant(_BOOL, int(operator == "||"))
+        end = self._current.append_basic_block(f"{label}.end")
+        incoming = []
+        for operand in operands[:-1]:
+            value = self._emit_as(operand, target, HexenType.BOOL)
+            next_operand = self._current.append_basic_block(f"{label}.rhs")
+            incoming.append((short_circuit, builder.block))
+            if operator == "&&":
+                builder.cbranch(value, next_operand, end)
+            else:
+                builder.cbranch(value, end, next_operand)
+            builder.position_at_end(next_operand)
+        value = self._emit_as(operands[-1], target, HexenType.BOOL)
+        incoming.append((value, builder.block))
+        builder.branch(end)
+
+        builder.position_at_end(end)
+        result = builder.phi(_BOOL, name=label)
+        for value, block in incoming:
+            result.add_incoming(value, block)
+        return result
+
+    def _unary_operation(self, node: Dict, target, result_type) -> ir.Value:
+        operand = self._emit_as(node["operand"], target, result_type)
+        if node["operator"] == "!":
+            return self._builder.not_(operand)
+        if result_type in FLOAT_TYPES:
+            return self._builder.fneg(operand)
+        return self._builder.neg(operand)
+
+    def _conversion(self, node: Dict, target, result_type) -> ir.Value:
+        expression = node["expression"]
+        source_type = self._type_of(expression, None)
+        if is_comptime(source_type):
+            try:
+                value = self._comptime.evaluate(expression)
+            except NotComptime:
+                source_type = materialize(source_type)
+            else:
+                if result_type in INTEGER_TYPES and isinstance(value, float):
+                    value = int(value)
+                return self._constant(value, result_type, node)
+        value = self._emit_as(expression, None, source_type)
+        return self._coerce(value, source_type, result_type, node)
+
+    def _expression_block(self, node: Dict, target, result_type) -> ir.Value:
+        """A block ending in `-> value` (or in a return, leaving no value)"""
+        self._enter_scope()
+        try:
+            statements = node.get("statements", [])
+            for statement in statements[:-1]:
+                self._statement(statement)
+            return self._block_result(statements[-1], self._return_type, result_type)
+        finally:
+            self._exit_scope()
+
+    def _block_result(self, statement: Dict, target, result_type) -> ir.Value:
+        if statement.get("type") == NodeType.ASSIGN_STATEMENT.value:
+            return self._emit_as(statement["value"], target, result_type)
+        self._statement(statement)
+        return ir.Constant(llvm_type(result_type, statement), ir.Undefined)
+
+    def _conditional(self, node: Dict, target, result_type) -> Optional[ir.Value]:
+        """
+        if/else if/else as a statement (result_type None) or an expression.
+
+        Branch values are merged with a phi; branches that return do not
+        reach the merge block.
+        """
+        builder = self._builder
+        function = self._current
+        # Branch values are analyzed with the conditional's target, or as
+        # expression blocks (with the function's return type) without one
+        branch_target = target if target is not None else self._return_type
+        end = function.append_basic_block("if.end")
+        incoming = []
+
+        clauses = [(node["condition"], node["if_branch"])] + [
+            (clause.get("condition"), clause["branch"])
+            for clause in node.get("else_clauses", [])
+        ]
+        for condition, branch in clauses:
+            otherwise = None
+            if condition is not None:
+                value = self._emit_as(condition, None, HexenType.BOOL)
+                then = function.append_basic_block("if.then")
+                otherwise = function.append_basic_block("if.else")
+                builder.cbranch(value, then, otherwise)
+                builder.position_at_end(then)
+
+            if result_type is None:
+                self._statement_block(branch)
+            else:
+                self._enter_scope()
+                try:
+                    statements = branch.get("statements", [])
+                    for statement in statements[:-1]:
+                        self._statement(statement)
+                    value = self._block_result(
+                        statements[-1], branch_target, result_type
+                    )
+                finally:
+                    self._exit_scope()
+                incoming.append((value, builder.block))
+            builder.branch(end)
+
+            if otherwise is None:
+                break
+            builder.position_at_end(otherwise)
+        else:
+            # No final else: falling through skips every branch
+            if result_type is not None:
+                undefined = ir.Constant(llvm_type(result_type, node), ir.Undefined)
+                incoming.append((undefined, builder.block))
+            builder.branch(end)
+
+        builder.position_at_end(end)
+        if result_type is None:
+            return None
+        result = builder.phi(llvm_type(result_type, node), name="if.value")
+        for value, block in incoming:
+            result.add_incoming(value, block)
+        return result
+
+    def _function_call(self, node: Dict, target, result_type) -> ir.Value:
+        name = node["function_name"]
+        if name not in self._functions:
+            raise CodegenError(f"Undefined function: '{name}'", node)
+        function, signature = self._functions[name]
+        arguments = [
+            self._emit_as(argument, parameter.param_type, parameter.param_type)
+            for argument, parameter in zip(node["arguments"], signature.parameters)
+        ]
+        result = self._builder.call(function, arguments)
+        if signature.return_type == HexenType.VOID:
+            return result
+        return self._coerce(result, signature.return_type, result_type, node)
+
+    # =========================================================================
+    # Arrays
+    # =========================================================================
+
+    def _array_literal(self, node: Dict, target, result_type) -> ir.Value:
+        elements = node["elements"]
+        if len(elements) == 1 and elements[0].get("type") == NodeType.RANGE_EXPR.value:
+            # Concrete ranges ([0..10] into [_]i64) still have constant bounds
+            try:
+                value = self._comptime.evaluate(node)
+            except NotComptime:
+                raise CodegenError(
+                    "Range materialization with runtime bounds is not supported "
+                    "by code generation yet",
+                    node,
+                ) from None
+            return self._constant(value, result_type, node)
+        element = element_type(result_type)
+        element_target = None
+        if isinstance(target, ArrayType):
+            element_target = element_type(target)
+        value = ir.Constant(llvm_type(result_type, node), ir.Undefined)
+        for index, item in enumerate(elements):
+            item_value = self._emit_as(item, element_target, element)
+            value = self._builder.insert_value(value, item_value, index)
+        return value
+
+    def _array_access(self, node: Dict, target, result_type) -> ir.Value:
+        if _is_full_range(node["index"]):
+            # array[..] copies the whole array: arrays are values already
+            return self._emit_as(node["array"], target, result_type)
+        # Comptime arrays indexed at runtime are materialized with the
+        # element type the access should produce
+        scalar = result_type
+        if isinstance(result_type, ArrayType):
+            scalar = result_type.element_type
+        pointer, element = self._element_pointer(node, scalar)
+        value = self._builder.load(pointer)
+        return self._coerce(value, element, result_type, node)
+
+    def _element_pointer(self, node: Dict, scalar) -> Tuple[ir.Value, Any]:
+        """Address and type of array[index], bounds-checking the index"""
+        if node["index"].get("type") == NodeType.RANGE_EXPR.value:
+            raise CodegenError(
+                "Array slicing is not supported by code generation yet", node
+            )
+        array = node["array"]
+        if array.get("type") == NodeType.ARRAY_ACCESS.value:
+            pointer, array_type = self._element_pointer(array, scalar)
+        else:
+            pointer, array_type = self._array_pointer(array, scalar)
+        index = self._index(node["index"], array_type.dimensions[0])
+        zero = ir.Constant(INDEX_TYPE, 0)
+        address = self._builder.gep(pointer, [zero, index], inbounds=True)
+        return address, element_type(array_type)
+
+    def _array_pointer(self, node: Dict, scalar) -> Tuple[ir.Value, ArrayType]:
+        """Address and type of an array: its stack slot, or a temporary"""
+        if node.get("type") == NodeType.IDENTIFIER.value:
+            variable = self._lookup(node["name"], node)
+            if variable.kind == "pointer":
+                return variable.storage, variable.type
+        array_type = self._type_of(node, None)
+        if isinstance(array_type, ComptimeArrayType):
+            array_type = intern_array_type(scalar, array_type.dimensions)
+        elif not isinstance(array_type, ArrayType):
+            raise CodegenError(f"Cannot index a value of type {array_type}", node)
+        source = self._constant_global(node, None, array_type)
+        if source is not None:
+            return source, array_type
+        value = self._emit_as(node, None, array_type)
+        return self._stack_variable(value, array_type).storage, array_type
+
+    def _index(self, node: Dict, length: int) -> ir.Value:
+        """An in-bounds index: checked now if constant, else at runtime"""
+        index_type = self._type_of(node, None)
+        if is_comptime(index_type):
+            try:
+                index = self._comptime.evaluate(node)
+            except NotComptime:
+                index_type = materialize(index_type)
+            else:
+                if not 0 <= index < length:
+                    raise CodegenError(
+                        f"Array index {index} out of bounds for length {length}", node
+                    )
+                return ir.Constant(INDEX_TYPE, index)
+
+        index = self._emit_as(node, None, index_type)
+        if index.type.width < INDEX_TYPE.width:
+            index = self._builder.sext(index, INDEX_TYPE)
+        # Negative indices wrap to huge unsigned values: one compare suffices
+        in_bounds = self._builder.icmp_unsigned(
+            "<", index, ir.Constant(INDEX_TYPE, length)
+        )
+        checked = self._current.append_basic_block("in_bounds")
+        self._builder.cbranch(in_bounds, checked, self._bounds_trap())
+        self._builder.position_at_end(checked)
+        return index
+
+    def _bounds_trap(self) -> ir.Block:
+        """The function's block that traps on an out-of-bounds index"""
+        if self._trap_block is None:
+            if self._trap_function is None:
+                self._trap_function = ir.Function(
+                    self.module, ir.FunctionType(ir.VoidType(), []), "llvm.trap"
+                )
+            self._trap_block = self._current.append_basic_block("bounds.trap")
+            trap = ir.IRBuilder(self._trap_block)
+            trap.call(self._trap_function, [])
+            trap.unreachable()
+        return self._trap_block
+
+    # =========================================================================
+    # Values
+    # =========================================================================
+
+    def _constant_global(self, node: Dict, target, array_type: ArrayType):
+        """
+        A read-only global holding the array node's value as array_type when
+        the value is known at compile time, else None.
+        """
+        if node.get("type") != NodeType.ARRAY_LITERAL.value and not is_comptime(
+            self._type_of(node, target)
+        ):
+            return None
+        try:
+            value = self._comptime.evaluate(node)
+        except NotComptime:
+            return None
+        constant = self._constant(value, array_type, node)
+        key = str(constant)
+        variable = self._constant_globals.get(key)
+        if variable is None:
+            name = f".const.{len(self._constant_globals)}"
+            variable = ir.GlobalVariable(self.module, constant.type, name=name)
+            variable.global_constant = True
+            variable.linkage = "private"
+            variable.unnamed_addr = True
+            variable.initializer = constant
+            self._constant_globals[key] = variable
+        return variable
+
+    def _copy(self, destination: ir.Value, source: ir.Value, array_type) -> None:
+        """Copy an array between two addresses with one llvm.memcpy"""
+        if self._memcpy_function is None:
+            memcpy_type = ir.FunctionType(
+                ir.VoidType(), [_BYTE_POINTER, _BYTE_POINTER, INDEX_TYPE, _BOOL]
+            )
+            self._memcpy_function = ir.Function(
+                self.module, memcpy_type, "llvm.memcpy.p0.p0.i64"
+            )
+        self._builder.call(
+            self._memcpy_function,
+            [
+                self._builder.bitcast(destination, _BYTE_POINTER),
+                self._builder.bitcast(source, _BYTE_POINTER),
+                size_of(llvm_type(array_type)),
+                ir.Constant(_BOOL, 0),
+            ],
+        )
+
+    def _stack_variable(self, value: ir.Value, value_type, name: str = "") -> _Variable:
+        pointer = self._allocas.alloca(value.type, name=name)
+        self._builder.store(value, pointer)
+        return _Variable("pointer", pointer, value_type)
+
+    def _constant(self, value: Any, hexen_type, node: Dict) -> ir.Constant:
+        """A compile-time value as a constant of a concrete type"""
+        if isinstance(hexen_type, ArrayType):
+            element = element_type(hexen_type)
+            return ir.Constant(
+                llvm_type(hexen_type, node),
+                [self._constant(item, element, node) for item in value],
+            )
+        result_type = llvm_type(hexen_type, node)
+        if hexen_type in INTEGER_TYPES:
+            # Wrap to the type's width (two's complement)
+            bits = result_type.width
+            value = int(value) & ((1 << bits) - 1)
+            if value >= 1 << (bits - 1):
+                value -= 1 << bits
+            return ir.Constant(result_type, value)
+        if hexen_type in FLOAT_TYPES:
+            return ir.Constant(result_type, float(value))
+        return ir.Constant(result_type, int(bool(value)))
+
+    def _coerce(self, value: ir.Value, from_type, to_type, node: Dict) -> ir.Value:
+        """Convert a value between concrete types (explicit or implicit)"""
+        if from_type == to_type or to_type == HexenType.VOID:
+            return value
+        builder = self._builder
+        if isinstance(from_type, ArrayType) and isinstance(to_type, ArrayType):
+            if from_type.dimensions != to_type.dimensions:
+                raise CodegenError(f"Cannot convert {from_type} to {to_type}", node)
+            from_element = element_type(from_type)
+            to_element = element_type(to_type)
+            result = ir.Constant(llvm_type(to_type, node), ir.Undefined)
+            for index in range(from_type.dimensions[0]):
+                item = builder.extract_value(value, index)
+                item = self._coerce(item, from_element, to_element, node)
+                result = builder.insert_value(result, item, index)
+            return result
+
+        target = llvm_type(to_type, node)
+        if from_type in INTEGER_TYPES or from_type == HexenType.BOOL:
+            signed = from_type in SIGNED_TYPES
+            if to_type in FLOAT_TYPES:
+                return (
+                    builder.sitofp(value, target)
+                    if signed
+                    else builder.uitofp(value, target)
+                )
+            if to_type == HexenType.BOOL:
+                return builder.icmp_unsigned("!=", value, ir.Constant(value.type, 0))
+            if to_type in INTEGER_TYPES:
+                if value.type.width > target.width:
+                    return builder.trunc(value, target)
+                if value.type.width < target.width:
+                    return (
+                        builder.sext(value, target)
+                        if signed
+                        else builder.zext(value, target)
+                    )
+                return value
+        if from_type in FLOAT_TYPES:
+            if to_type in FLOAT_TYPES:
+                if to_type == HexenType.F64:
+                    return builder.fpext(value, target)
+                return builder.fptrunc(value, target)
+            if to_type in SIGNED_TYPES:
+                return builder.fptosi(value, target)
+            if to_type in INTEGER_TYPES:
+                return builder.fptoui(value, target)
+        raise CodegenError(f"Cannot convert {from_type} to {to_type}", node)
+
+
+def _is_undef(node: Dict) -> bool:
+    return node.get("type") == NodeType.IDENTIFIER.value and node["name"] == "undef"
+
+
+def _is_full_range(node: Dict) -> bool:
+    """Whether an index is the `..` of array[..]"""
+    return node.get("type") == NodeType.RANGE_EXPR.value and all(
+        node.get(bound) is None for bound in ("start", "end", "step")
+    )
+
+
+def _wider_type(left, right):
+    """Common type of two concrete numeric operands"""
+    for candidate in (HexenType.F64, HexenType.F32, HexenType.I64, HexenType.USIZE):
+        if candidate in (left, right):
+            return candidate
+    return left
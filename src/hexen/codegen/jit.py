@@ -0,0 +1,89 @@
+"""
+JIT Execution
+
+Compiles a generated module to machine code in this process with llvmlite's
+MCJIT engine and calls its functions through ctypes. Functions with scalar
+parameters and results can be called; a failed runtime bounds check traps
+and ends the process, as it would in a native build.
+"""
+
+import ctypes
+from typing import Any, Callable, Dict, Optional
+
+import llvmlite.binding as llvm
+
+from ..semantic.symbol_table import create_function_signature_from_ast
+from ..semantic.types import HexenType
+from .errors import CodegenError
+from .target import host_target_machine
+
+_CTYPES = {
+    HexenType.I32: ctypes.c_int32,
+    HexenType.I64: ctypes.c_int64,
+    HexenType.USIZE: ctypes.c_uint64,
+    HexenType.F32: ctypes.c_float,
+    HexenType.F64: ctypes.c_double,
+    HexenType.BOOL: ctypes.c_bool,
+    HexenType.VOID: None,
+}
+
+
+class JitProgram:
+    """
+    A program compiled to machine code in this process.
+
+    compiled is the verified (and possibly optimized) module from
+    compile_module(); ast is the program it was generated from, which gives
+    the Hexen signatures of its functions. The engine owns the module.
+
+    object_code, when given, is machine code previously compiled from the
+    same module (see ObjectCache); the engine loads it instead of
+    generating code. on_compiled receives the object code the engine
+    generates otherwise.
+    """
+
+    def __init__(
+        self,
+        compiled: llvm.ModuleRef,
+        ast: Dict,
+        machine: Optional[llvm.TargetMachine] = None,
+        object_code: Optional[bytes] = None,
+        on_compiled: Optional[Callable[[bytes], None]] = None,
+    ):
+        self._nodes = {node["name"]: node for node in ast.get("functions", [])}
+        self._engine = llvm.create_mcjit_compiler(
+            compiled, machine or host_target_machine()
+        )
+        if object_code is not None or on_compiled is not None:
+
+            def notify(module, buffer):
+                if on_compiled is not None:
+                    on_compiled(buffer)
+
+            self._engine.set_object_cache(notify, lambda module: object_code)
+        self._engine.finalize_object()
+
+    def call(self, name: str, *args: Any) -> Any:
+        """Call a function of the program with Python numbers"""
+        node = self._nodes.get(name)
+        if node is None:
+            raise CodegenError(f"No function named '{name}' in the program")
+        signature = create_function_signature_from_ast(node)
+        if len(args) != len(signature.parameters):
+            raise CodegenError(
+                f"Function '{name}' expects {len(signature.parameters)} "
+                f"argument(s), got {len(args)}",
+                node,
+            )
+        types = [signature.return_type]
+        types += [parameter.param_type for parameter in signature.parameters]
+        for hexen_type in types:
+            if hexen_type not in _CTYPES:
+                raise CodegenError(
+                    f"Cannot call '{name}' from the JIT: type {hexen_type} is "
+                    "not supported at the entry point",
+                    node,
+                )
+        function_type = ctypes.CFUNCTYPE(*(_CTYPES[t] for t in types))
+        address = self._engine.get_function_address(name)
+        return function_type(address)(*args)
@@ -0,0 +1,102 @@
+"""
+Hexen to LLVM Type Mapping
+
+Maps the semantic analyzer's types onto llvmlite IR types. usize is a
+64-bit unsigned integer (the code generator targets 64-bit platforms), bool
+is i1 and fixed-size arrays are nested LLVM arrays, outermost dimension
+first.
+"""
+
+from typing import Dict, Optional, Union
+
+from llvmlite import ir
+
+from ..semantic.types import ArrayType, ComptimeArrayType, HexenType, intern_array_type
+from .errors import CodegenError
+
+SIGNED_TYPES = frozenset({HexenType.I32, HexenType.I64})
+UNSIGNED_TYPES = frozenset({HexenType.USIZE})
+INTEGER_TYPES = SIGNED_TYPES | UNSIGNED_TYPES
+FLOAT_TYPES = frozenset({HexenType.F32, HexenType.F64})
+COMPTIME_TYPES = frozenset({HexenType.COMPTIME_INT, HexenType.COMPTIME_FLOAT})
+
+# Index type of GEPs and bounds checks (the width of usize)
+INDEX_TYPE = ir.IntType(64)
+
+_SCALAR_TYPES: Dict[HexenType, ir.Type] = {
+    HexenType.I32: ir.IntType(32),
+    HexenType.I64: ir.IntType(64),
+    HexenType.USIZE: ir.IntType(64),
+    HexenType.F32: ir.FloatType(),
+    HexenType.F64: ir.DoubleType(),
+    HexenType.BOOL: ir.IntType(1),
+    HexenType.VOID: ir.VoidType(),
+}
+
+# Concrete type a comptime value takes when nothing else decides
+_DEFAULT_TYPES = {
+    HexenType.COMPTIME_INT: HexenType.I32,
+    HexenType.COMPTIME_FLOAT: HexenType.F64,
+}
+
+
+def llvm_type(hexen_type: Union[HexenType, ArrayType], node: Optional[Dict] = None):
+    """LLVM type of a concrete Hexen type; node locates unsupported types"""
+    if isinstance(hexen_type, ArrayType):
+        if "_" in hexen_type.dimensions:
+            raise CodegenError(
+                f"Inferred-size array type {hexen_type} is not supported by "
+                "code generation yet",
+                node,
+            )
+        result = llvm_type(hexen_type.element_type, node)
+        for size in reversed(hexen_type.dimensions):
+            result = ir.ArrayType(result, size)
+        return result
+    result = _SCALAR_TYPES.get(hexen_type)
+    if result is None:
+        raise CodegenError(
+            f"Type {hexen_type} is not supported by code generation yet", node
+        )
+    return result
+
+
+def is_comptime(hexen_type) -> bool:
+    """Whether values of this type only exist at compile time"""
+    return hexen_type in COMPTIME_TYPES or isinstance(hexen_type, ComptimeArrayType)
+
+
+def materialize(hexen_type, target=None):
+    """
+    Concrete type of a comptime value: the target when it has the right
+    shape (scalar or array), otherwise the defaults i32 and f64.
+    """
+    if isinstance(hexen_type, ComptimeArrayType):
+        # The literal's shape also fills in inferred ([_]) dimensions
+        if isinstance(target, ArrayType):
+            element = target.element_type
+        else:
+            element = _DEFAULT_TYPES[hexen_type.element_comptime_type]
+        return intern_array_type(element, hexen_type.dimensions)
+    if hexen_type in COMPTIME_TYPES:
+        if target in INTEGER_TYPES or target in FLOAT_TYPES:
+            return target
+        return _DEFAULT_TYPES[hexen_type]
+    return hexen_type
+
+
+def element_type(array_type: ArrayType):
+    """Type of array_type[i]: the element type or an array of one less dimension"""
+    if len(array_type.dimensions) == 1:
+        return array_type.element_type
+    return intern_array_type(array_type.element_type, array_type.dimensions[1:])
+
+
+def size_of(ir_type: ir.Type) -> ir.Constant:
+    """
+    Bytes a value of ir_type occupies in memory, as the constant expression
+    `ptrtoint (gep null, 1)`: LLVM folds it with the data layout of the
+    target the module is compiled for.
+    """
+    null = ir.Constant(ir_type.as_pointer(), None)
+    return null.gep([ir.Constant(ir.IntType(32), 1)]).ptrtoint(INDEX_TYPE)
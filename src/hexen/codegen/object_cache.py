@@ -0,0 +1,73 @@
+"""
+Hexen JIT Object Cache
+
+Content-addressed on-disk cache of the machine code MCJIT produces for a
+module, used by `hexen run --jit-cache` to skip LLVM optimization and code
+generation for programs that have not changed.
+
+Entries are keyed by a hash of the module's IR before optimization, the
+target (triple, CPU and features), the optimization level and the LLVM
+version, so a change to any of them compiles the module afresh. Entries
+are the object files LLVM hands to the ObjectCache hooks of the execution
+engine, stored in a DiskCache like the AST cache's.
+"""
+
+import hashlib
+from typing import Optional
+
+import llvmlite
+import llvmlite.binding as llvm
+
+from ..cache import DiskCache
+
+
+class ObjectCache(DiskCache):
+    """
+    Opt-in persistent cache mapping a module's IR to its machine code.
+
+    Design:
+    - Content-addressed: the key is sha256(LLVM version + target + opt
+      level + IR), computed by key() before the module is optimized
+    - Storage: a DiskCache, so entries are crc32-checked and evicted
+      least-recently-used past max_bytes
+    """
+
+    SUBDIR = "jit"
+    SUFFIX = ".o"
+    MAGIC = b"HXOBJ1\n"
+
+    def key(
+        self,
+        ir_text: str,
+        triple: str,
+        cpu: str = "",
+        features: str = "",
+        opt_level: str = "",
+    ) -> str:
+        """
+        Content address of a module's machine code.
+
+        ir_text is the unoptimized IR; cpu and features must already be
+        resolved (see resolve_cpu), so "native" never reaches a key.
+        """
+        digest = hashlib.sha256(self.MAGIC)
+        version = ".".join(map(str, llvm.llvm_version_info))
+        for part in (llvmlite.__version__, version, triple, cpu, features, opt_level):
+            digest.update(f"{part}\0".encode())
+        digest.update(ir_text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached object code for key, or None on a miss"""
+        object_code = self._read(key)
+        if object_code is not None:
+            self._touch(key)
+        return object_code
+
+    def put(self, key: str, object_code: bytes) -> None:
+        """Store object code, evicting old entries if needed"""
+        self._write(key, object_code)
+
+    def _load(self, payload: bytes) -> Optional[bytes]:
+        """An entry's object code, or None for an empty (damaged) entry"""
+        return payload or None
@@ -0,0 +1,141 @@
+"""
+Native Code Emission
+
+Compiles generated modules for the host with llvmlite's binding layer:
+verifies and optimizes the IR and emits an object file, assembly or
+textual LLVM IR.
+
+Optimization levels follow the usual -O flags. "0" to "3" select LLVM's
+default per-module pipelines; "s" (size) is the -O2 pipeline with a lower
+inlining threshold and no loop unrolling, since llvmlite's pass builder
+takes no separate size level.
+"""
+
+from typing import Optional, Tuple
+
+import llvmlite.binding as llvm
+from llvmlite import ir
+
+# --emit formats of `hexen build` and the suffix of their default output
+EMIT_SUFFIXES = {"obj": ".o", "asm": ".s", "llvm": ".ll"}
+
+# -O levels: LLVM speed level of the pipeline and of instruction selection
+OPT_LEVELS = {"0": 0, "1": 1, "2": 2, "3": 3, "s": 2}
+DEFAULT_OPT_LEVEL = "2"
+
+# Inlining threshold clang uses at -Os
+_SIZE_INLINING_THRESHOLD = 75
+
+# Pass timing reports need llvmlite 0.45+; older pass builders lack them
+PASS_TIMING_SUPPORTED = hasattr(llvm.PassBuilder, "start_pass_timing")
+
+_native_initialized = False
+
+
+def _initialize_native() -> None:
+    global _native_initialized
+    if not _native_initialized:
+        llvm.initialize_native_target()
+        llvm.initialize_native_asmprinter()
+        _native_initialized = True
+
+
+def resolve_cpu(cpu: str = "", features: str = "") -> Tuple[str, str]:
+    """cpu and features with "native" replaced by the host's CPU and features"""
+    if cpu == "native":
+        cpu = llvm.get_host_cpu_name()
+        features = features or llvm.get_host_cpu_features().flatten()
+    return cpu, features
+
+
+def host_target_machine(
+    cpu: str = "", features: str = "", opt_level: str = DEFAULT_OPT_LEVEL
+) -> llvm.TargetMachine:
+    """
+    Target machine for the host, producing position-independent code.
+
+    cpu and features take LLVM's names ("skylake", "+avx2,-fma"); cpu
+    "native" selects the host CPU and, unless features are given, all of
+    its features. The default is a generic CPU of the host's architecture.
+    """
+    _initialize_native()
+    cpu, features = resolve_cpu(cpu, features)
+    target = llvm.Target.from_default_triple()
+    return target.create_target_machine(
+        cpu=cpu,
+        features=features,
+        opt=OPT_LEVELS[opt_level],
+        reloc="pic",
+        codemodel="default",
+    )
+
+
+def compile_module(
+    module: ir.Module, machine: Optional[llvm.TargetMachine] = None
+) -> llvm.ModuleRef:
+    """Parse and verify a module for the machine's triple and data layout"""
+    machine = machine or host_target_machine()
+    module.triple = machine.triple
+    module.data_layout = str(machine.target_data)
+    compiled = llvm.parse_assembly(str(module))
+    compiled.name = module.name
+    compiled.verify()
+    return compiled
+
+
+def optimize(
+    compiled: llvm.ModuleRef,
+    machine: Optional[llvm.TargetMachine] = None,
+    opt_level: str = DEFAULT_OPT_LEVEL,
+    time_passes: bool = False,
+) -> Optional[str]:
+    """
+    Run the -O<opt_level> pipeline over a compiled module. With time_passes,
+    returns LLVM's report of the time spent in each pass.
+    """
+    if opt_level not in OPT_LEVELS:
+        raise ValueError(f"Unknown optimization level: {opt_level}")
+    if time_passes and not PASS_TIMING_SUPPORTED:
+        raise ValueError("Pass timing reports require llvmlite 0.45 or newer")
+    machine = machine or host_target_machine(opt_level=opt_level)
+    options = llvm.PipelineTuningOptions(speed_level=OPT_LEVELS[opt_level])
+    if opt_level == "s":
+        options.inlining_threshold = _SIZE_INLINING_THRESHOLD
+        options.loop_unrolling = False
+    builder = llvm.create_pass_builder(machine, options)
+    if time_passes:
+        builder.start_pass_timing()
+    builder.getModulePassManager().run(compiled, builder)
+    return builder.finish_pass_timing() if time_passes else None
+
+
+def emit(
+    module: ir.Module,
+    emit_format: str = "obj",
+    machine: Optional[llvm.TargetMachine] = None,
+    opt_level: Optional[str] = None,
+) -> bytes:
+    """
+    The module as an object file ("obj"), assembly ("asm") or IR ("llvm"),
+    optimized first when an opt_level is given.
+    """
+    if emit_format not in EMIT_SUFFIXES:
+        raise ValueError(f"Unknown emit format: {emit_format}")
+    machine = machine or host_target_machine()
+    compiled = compile_module(module, machine)
+    if opt_level is not None:
+        optimize(compiled, machine, opt_level)
+    return emit_compiled(compiled, machine, emit_format)
+
+
+def emit_compiled(
+    compiled: llvm.ModuleRef, machine: llvm.TargetMachine, emit_format: str = "obj"
+) -> bytes:
+    """emit() for a module already compiled (and optimized) for machine"""
+    if emit_format not in EMIT_SUFFIXES:
+        raise ValueError(f"Unknown emit format: {emit_format}")
+    if emit_format == "llvm":
+        return str(compiled).encode()
+    if emit_format == "asm":
+        return machine.emit_assembly(compiled).encode()
+    return machine.emit_object(compiled)
@@ -4,16 +4,35 @@ Hexen Parser
 Parser for Hexen language with variable declarations using Lark.
 """
 
-from lark import Lark, Transformer, v_args
+import functools
+import hashlib
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
+import lark
+from lark import Lark, Token, Transformer, v_args
+from lark.visitors import Transformer_NonRecursive
+
+from .ast_cache import ASTCache
 from .ast_nodes import NodeType
+from .cache import get_cache_dir
+from .source_map import SourceMap
+from .typed_ast import to_typed_ast
+
+
+# Operators whose same-operator chains flatten_chains turns into n-ary nodes
+ASSOCIATIVE_OPERATORS = frozenset({"+", "*", "&&", "||"})
 
 
 class HexenTransformer(Transformer):
     """Transform parse tree into meaningful AST nodes"""
 
+    def __init__(self, flatten_chains: bool = False):
+        super().__init__()
+        # Build n-ary nodes for same-operator associative chains (opt-in)
+        self.flatten_chains = flatten_chains
+
     def function(self, args):
         """Transform function: FUNC IDENTIFIER ( parameter_list? ) : type = block"""
         if len(args) == 4:
@@ -236,112 +255,22 @@ class HexenTransformer(Transformer):
             }
 
     def logical_or(self, children):
-        # print("[DEBUG] logical_or children:", children)
-        if len(children) == 1:
-            return children[0]
-        left = children[0]
-        i = 1
-        while i < len(children):
-            op = children[i]
-            right = children[i + 1]
-            left = {
-                "type": NodeType.BINARY_OPERATION.value,
-                "operator": str(op),
-                "left": left,
-                "right": right,
-            }
-            i += 2
-        return left
+        return self._build_binary_operation_tree(children)
 
     def logical_and(self, children):
-        # print("[DEBUG] logical_and children:", children)
-        if len(children) == 1:
-            return children[0]
-        left = children[0]
-        i = 1
-        while i < len(children):
-            op = children[i]
-            right = children[i + 1]
-            left = {
-                "type": NodeType.BINARY_OPERATION.value,
-                "operator": str(op),
-                "left": left,
-                "right": right,
-            }
-            i += 2
-        return left
+        return self._build_binary_operation_tree(children)
 
     def equality(self, children):
-        # print("[DEBUG] equality children:", children)
-        if len(children) == 1:
-            return children[0]
-        left = children[0]
-        i = 1
-        while i < len(children):
-            op = children[i]
-            right = children[i + 1]
-            left = {
-                "type": NodeType.BINARY_OPERATION.value,
-                "operator": str(op),
-                "left": left,
-                "right": right,
-            }
-            i += 2
-        return left
+        return self._build_binary_operation_tree(children)
 
     def relational(self, children):
-        # print("[DEBUG] relational children:", children)
-        if len(children) == 1:
-            return children[0]
-        left = children[0]
-        i = 1
-        while i < len(children):
-            op = children[i]
-            right = children[i + 1]
-            left = {
-                "type": NodeType.BINARY_OPERATION.value,
-                "operator": str(op),
-                "left": left,
-                "right": right,
-            }
-            i += 2
-        return left
+        return self._build_binary_operation_tree(children)
 
     def additive(self, children):
-        # print("[DEBUG] additive children:", children)
-        if len(children) == 1:
-            return children[0]
-        left = children[0]
-        i = 1
-        while i < len(children):
-            op = children[i]
-            right = children[i + 1]
-            left = {
-                "type": NodeType.BINARY_OPERATION.value,
-                "operator": str(op),
-                "left": left,
-                "right": right,
-            }
-            i += 2
-        return left
+        return self._build_binary_operation_tree(children)
 
     def multiplicative(self, children):
-        # print("[DEBUG] multiplicative children:", children)
-        if len(children) == 1:
-            return children[0]
-        left = children[0]
-        i = 1
-        while i < len(children):
-            op = children[i]
-            right = children[i + 1]
-            left = {
-                "type": NodeType.BINARY_OPERATION.value,
-                "operator": str(op),
-                "left": left,
-                "right": right,
-            }
-            i += 2
-        return left
+        return self._build_binary_operation_tree(children)
 
     def unary(self, children):
         # unary: ("-" | "!")? primary
@@ -594,22 +523,43 @@ class HexenTransformer(Transformer):
         return "..="
 
     def _build_binary_operation_tree(self, children):
-        # print("[DEBUG] _build_binary_operation_tree children:", children)
+        """
+        Build a left-deep tree from `operand (OP operand)*` children.
+
+        With flatten_chains, runs of three or more operands joined by the same
+        associative operator become one n-ary node holding an operand list
+        (still evaluated as a left fold): a + b + c - d is
+        (nary + [a, b, c]) - d. Two-operand operations stay binary.
+        """
         if len(children) == 1:
             return children[0]  # Single operand
         result = children[0]
+        # Node built by this call that the next operator may extend
+        chain = None
         for i in range(1, len(children) - 1, 2):
             operator = str(children[i])
             right_operand = children[i + 1]
-            # print(
-            #     f"[DEBUG] Building node: left={result}, op={operator}, right={right_operand}"
-            # )
+            if chain is not None and chain["operator"] == operator:
+                if chain["type"] == NodeType.BINARY_OPERATION.value:
+                    result = chain = {
+                        "type": NodeType.NARY_OPERATION.value,
+                        "operator": operator,
+                        "operands": [chain["left"], chain["right"], right_operand],
+                    }
+                else:
+                    chain["operands"].append(right_operand)
+                continue
             result = {
                 "type": NodeType.BINARY_OPERATION.value,
                 "operator": operator,
                 "left": result,
                 "right": right_operand,
             }
+            chain = (
+                result
+                if self.flatten_chains and operator in ASSOCIATIVE_OPERATORS
+                else None
+            )
         return result
 
     @v_args(inline=True)
@@ -682,6 +632,10 @@ class HexenTransformer(Transformer):
         # Used for variable names and references
         return {"type": NodeType.IDENTIFIER.value, "name": str(token)}
 
+    def ASSIGNMENT_TARGET(self, token):
+        # LALR grammar only: an identifier lexed as the target of `x = ...`
+        return self.IDENTIFIER(token)
+
     def NUMBER(self, token):
         """Enhanced number parser supporting all literal formats with overflow detection"""
         token_str = str(token).strip()
@@ -809,26 +763,374 @@ class HexenTransformer(Transformer):
         return int(str(token))
 
 
-class HexenParser:
-    """Main parser class for Hexen language"""
+class NonRecursiveHexenTransformer(Transformer_NonRecursive, HexenTransformer):
+    """
+    HexenTransformer that walks the parse tree with an explicit stack.
+
+    Lark's default Transformer recurses once per tree level, so deeply
+    nested blocks, conditionals or parentheses overflow the Python stack.
+    This variant flattens the tree into post-order first and then runs the
+    same HexenTransformer callbacks, producing an identical AST at any
+    depth. None of the callbacks return Discard, which the flattened walk
+    relies on.
+    """
+
+
+def _load_grammar(file_name: str) -> str:
+    """Load a grammar file shipped next to this module"""
+    grammar_path = Path(__file__).parent / file_name
+    with open(grammar_path, "r") as f:
+        return f.read()
+
+
+def _grammar_cache_file(
+    file_name: str, grammar: str, variant: str = ""
+) -> Optional[str]:
+    """
+    Path of the on-disk cache for a grammar's compiled LALR tables.
+
+    The file name is versioned by a hash of the grammar text and the lark
+    version, so grammar edits and lark upgrades never load stale tables.
+    Parsers built with different Lark options pass a distinct variant so
+    they do not overwrite each other's file. Lark additionally checks its
+    own hash (options, Python version) when loading and rebuilds the file
+    on mismatch.
+    """
+    cache_dir = get_cache_dir("grammar")
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha256((grammar + lark.__version__).encode()).hexdigest()
+    stem = Path(file_name).stem + (f"-{variant}" if variant else "")
+    return str(cache_dir / f"{stem}-{digest[:16]}.lark")
+
+
+# =============================================================================
+# Span tracking
+# =============================================================================
+
+
+class _SpanTrackingTransformer(NonRecursiveHexenTransformer):
+    """
+    HexenTransformer that records the span of every node it builds.
+
+    Used on parse trees built with propagate_positions=True, whose meta
+    covers all of a rule's tokens (keywords included).
+    """
+
+    def __init__(self, source_map: SourceMap, flatten_chains: bool = False):
+        super().__init__(flatten_chains)
+        self.source_map = source_map
+
+    def _call_userfunc(self, tree, new_children=None):
+        node = super()._call_userfunc(tree, new_children)
+        if isinstance(node, dict) and not tree.meta.empty:
+            self.source_map.record(node, tree.meta.start_pos, tree.meta.end_pos)
+        return node
+
+    def _call_userfunc_token(self, token):
+        node = super()._call_userfunc_token(token)
+        if isinstance(node, dict):
+            self.source_map.record(node, token.start_pos, token.end_pos)
+        return node
+
+
+class _SpanRecorder:
+    """
+    Records node spans while the tree-less LALR parser reduces rules.
+
+    Every callback of the parser is wrapped. Wrappers see a rule's children
+    before keyword tokens are filtered out, so spans match the Earley ones.
+    Tokens carry their own positions; every other value on Lark's value
+    stack was produced by a wrapped callback, which pushes its span onto a
+    parallel span stack. A reduction pops the spans of its non-token
+    children, so the extra state is bounded by the parse stack depth.
+
+    The active source map is thread-local, so the shared parser stays safe
+    to use from several threads.
+
+    Lark exposes no public hook that sees unfiltered children, so install()
+    wraps the parser's private callback table. pyproject.toml pins the lark
+    versions known to keep it, and install() fails loudly without it.
+    """
 
     def __init__(self):
-        # Load grammar from file
-        grammar_path = Path(__file__).parent / "hexen.lark"
-        with open(grammar_path, "r") as f:
-            grammar = f.read()
+        self._local = threading.local()
+
+    def start(self, source_map: SourceMap) -> None:
+        self._local.source_map = source_map
+        self._local.stack = []
+
+    def stop(self) -> None:
+        self._local.source_map = None
+        self._local.stack = None
+
+    def install(self, parser: Lark) -> None:
+        # Lark's LALR parser uses this dict by reference: rule callbacks are
+        # keyed by Rule, terminal callbacks by terminal name
+        callbacks = getattr(parser, "_callbacks", None)
+        if not isinstance(callbacks, dict):
+            raise RuntimeError(
+                f"Span tracking is not supported with lark {lark.__version__}: "
+                "its LALR parser has no callback table to record spans from"
+            )
+        for key, callback in list(callbacks.items()):
+            if isinstance(key, str):
+                callbacks[key] = self._wrap_terminal(callback)
+            else:
+                callbacks[key] = self._wrap_rule(callback)
+
+    def _wrap_rule(self, callback):
+        local = self._local
+
+        def record_rule(children):
+            stack = local.stack
+            if len(children) == 1 and not isinstance(children[0], Token):
+                # Pass-through rules (most precedence levels) keep the span
+                # already on the stack
+                node = callback(children)
+                if node is children[0]:
+                    return node
+                start, end = stack.pop()
+            else:
+                # Pop the spans of non-token children, last child first
+                start = end = -1
+                for child in reversed(children):
+                    if isinstance(child, Token):
+                        child_start, child_end = child.start_pos, child.end_pos
+                    else:
+                        child_start, child_end = stack.pop()
+                    if child_start >= 0:
+                        if end < 0:
+                            end = child_end
+                        start = child_start
+                node = callback(children)
+
+            if not isinstance(node, Token):
+                stack.append((start, end))
+                if isinstance(node, dict) and start >= 0:
+                    local.source_map.record(node, start, end)
+            return node
+
+        return record_rule
+
+    def _wrap_terminal(self, callback):
+        local = self._local
+
+        def record_terminal(token):
+            node = callback(token)
+            if not isinstance(node, Token):
+                local.stack.append((token.start_pos, token.end_pos))
+                if isinstance(node, dict):
+                    local.source_map.record(node, token.start_pos, token.end_pos)
+            return node
+
+        return record_terminal
+
+
+_span_recorder = _SpanRecorder()
+
+
+# =============================================================================
+# Shared Lark parsers
+# =============================================================================
+
+# Compiled Lark parsers are immutable once built, so they are created once and
+# shared by every HexenParser in the process. Both HexenTransformer instances
+# below are stateless, which keeps the tree-less parser safe to share too.
+# Span-tracking variants are separate instances so that parses without
+# track_spans never pay for position bookkeeping.
+
+
+@functools.lru_cache(maxsize=None)
+def _get_earley_parser(spans: bool = False) -> Lark:
+    # Lark can only serialize LALR tables, so Earley is shared but not cached
+    return Lark(
+        _load_grammar("hexen.lark"),
+        start="program",
+        parser="earley",
+        propagate_positions=spans,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_lalr_parser(
+    treeless: bool = False, spans: bool = False, flatten_chains: bool = False
+) -> Lark:
+    # With a transformer, Lark calls it on every reduction and parse()
+    # returns the AST directly
+    grammar = _load_grammar("hexen_lalr.lark")
+    # Tree-less parsers track spans through _span_recorder instead of
+    # propagate_positions, so only tree-building span parsers differ
+    propagate_positions = spans and not treeless
+    cache_file = _grammar_cache_file(
+        "hexen_lalr.lark", grammar, "positions" if propagate_positions else ""
+    )
+    parser = Lark(
+        grammar,
+        start="program",
+        parser="lalr",
+        lexer="contextual",
+        transformer=HexenTransformer(flatten_chains) if treeless else None,
+        propagate_positions=propagate_positions,
+        cache=cache_file if cache_file is not None else False,
+    )
+    if spans and treeless:
+        _span_recorder.install(parser)
+    return parser
+
+
+class HexenParser:
+    """Main parser class for Hexen language
+
+    Parsing modes:
+    - "earley": reference parser over hexen.lark (tolerates ambiguity, slower)
+    - "lalr": deterministic LALR(1) parser with a contextual lexer over
+      hexen_lalr.lark, producing the same AST as the Earley parser
+    - "lalr-treeless": LALR(1) parser that runs HexenTransformer callbacks
+      inline as each rule is reduced, so no intermediate parse tree is built
+    - "differential": parses with Earley and tree-less LALR and raises
+      AssertionError whenever they disagree (testing aid for keeping the
+      grammars in sync)
+
+    The underlying Lark parsers are built once per process and shared; LALR
+    tables are also persisted in the user cache directory (see hexen.cache).
+    They are looked up on the first parse, so constructing a HexenParser is
+    cheap. An ASTCache can be passed to let parse_file skip parsing
+    unchanged sources entirely, in which case no Lark parser is needed.
+
+    With typed_ast=True, parse results are converted to the compact slotted
+    node classes of hexen.typed_ast instead of plain dicts.
+
+    With track_spans=True, every parse also fills self.source_map with the
+    source span of each node (see hexen.source_map); AST cache entries
+    carry their spans along.
+
+    With flatten_chains=True, chains of three or more operands joined by the
+    same associative operator (+, *, &&, ||) become a single nary_operation
+    node holding an operand list instead of a left-deep binary tree.
+    """
+
+    MODES = ("earley", "lalr", "lalr-treeless", "differential")
+
+    # Defaults used when not passed explicitly (tests may override them)
+    DEFAULT_MODE = "earley"
+    DEFAULT_TYPED_AST = False
+    DEFAULT_FLATTEN_CHAINS = False
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        ast_cache: Optional[ASTCache] = None,
+        typed_ast: Optional[bool] = None,
+        track_spans: bool = False,
+        flatten_chains: Optional[bool] = None,
+    ):
+        mode = mode or self.DEFAULT_MODE
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Unknown parser mode '{mode}' (expected one of: {', '.join(self.MODES)})"
+            )
+        self.mode = mode
+        # Parse trees can be arbitrarily deep, so they are never transformed
+        # recursively (tree-less parsers transform during the parse instead)
+        if flatten_chains is None:
+            flatten_chains = self.DEFAULT_FLATTEN_CHAINS
+        self.flatten_chains = flatten_chains
+        self.transformer = NonRecursiveHexenTransformer(flatten_chains)
+
+        # Optional on-disk cache consulted by parse_file (opt-in)
+        self.ast_cache = ast_cache
+
+        self.typed_ast = self.DEFAULT_TYPED_AST if typed_ast is None else typed_ast
+
+        # Span table of the last parse (only with track_spans)
+        self.track_spans = track_spans
+        self.source_map: Optional[SourceMap] = None
+
+        # Lark parsers are looked up on first use, so parse_file calls that
+        # all hit the AST cache never build one
+        self._parser: Optional[Lark] = None
+        self._reference_parser: Optional[Lark] = None
+
+    @property
+    def parser(self) -> Lark:
+        """Lark parser for this mode (built on first use)"""
+        if self._parser is None:
+            if self.mode == "earley":
+                self._parser = _get_earley_parser(spans=self.track_spans)
+            elif self.mode == "lalr":
+                self._parser = _get_lalr_parser(spans=self.track_spans)
+            else:
+                # Differential mode returns the Earley AST, so only the
+                # reference parser needs to track spans
+                self._parser = _get_lalr_parser(
+                    treeless=True,
+                    spans=self.track_spans and self.mode != "differential",
+                    flatten_chains=self.flatten_chains,
+                )
+        return self._parser
+
+    @parser.setter
+    def parser(self, parser: Lark) -> None:
+        self._parser = parser
 
-        # Create parser with Earley algorithm
-        self.parser = Lark(grammar, start="program", parser="earley")
-        self.transformer = HexenTransformer()
+    @property
+    def reference_parser(self) -> Optional[Lark]:
+        """Earley parser checked against in differential mode, else None"""
+        if self._reference_parser is None and self.mode == "differential":
+            self._reference_parser = _get_earley_parser(spans=self.track_spans)
+        return self._reference_parser
 
     def parse(self, source_code: str) -> Dict[str, Any]:
         """Parse Hexen source code into AST"""
+        return self._finish(self._parse_source(source_code))
+
+    def _parse_source(self, source_code: str) -> Dict[str, Any]:
+        """Parse source code into the dict-based AST"""
+        self.source_map = SourceMap(source_code) if self.track_spans else None
+        if self.mode == "differential":
+            return self._parse_differential(source_code)
+        return self._parse_with(self.parser, source_code, self.source_map)
+
+    def _finish(self, ast: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a dict-based AST to the configured output format"""
+        if not self.typed_ast:
+            return ast
+        if self.source_map is None:
+            return to_typed_ast(ast)
+
+        # Move the recorded spans over to the typed nodes
+        converted: Dict[int, Any] = {}
+        typed = to_typed_ast(ast, converted)
+        self.source_map.rekey(lambda node: converted.get(id(node), node))
+        return typed
+
+    def _parse_with(
+        self,
+        parser: Lark,
+        source_code: str,
+        source_map: Optional[SourceMap] = None,
+    ) -> Dict[str, Any]:
+        """Parse source code with the given Lark parser and transform it"""
         try:
+            # Tree-less parsers already transform during the parse
+            if parser.options.transformer is not None:
+                if source_map is None:
+                    return parser.parse(source_code)
+                _span_recorder.start(source_map)
+                try:
+                    return parser.parse(source_code)
+                finally:
+                    _span_recorder.stop()
+
             # Parse source code
-            parse_tree = self.parser.parse(source_code)
+            parse_tree = parser.parse(source_code)
 
             # Transform into AST
+            if source_map is not None:
+                return _SpanTrackingTransformer(
+                    source_map, self.flatten_chains
+                ).transform(parse_tree)
             ast = self.transformer.transform(parse_tree)
 
             return ast
@@ -836,8 +1138,55 @@ class HexenParser:
         except Exception as e:
             raise SyntaxError(f"Parse error: {e}")
 
+    def _parse_differential(self, source_code: str) -> Dict[str, Any]:
+        """
+        Parse with both the tree-less LALR and the reference Earley parser.
+
+        Both must either succeed with identical ASTs or both reject the
+        source. The Earley result (or error) is what callers observe.
+        """
+        results = []
+        for parser, source_map in (
+            (self.reference_parser, self.source_map),
+            (self.parser, None),
+        ):
+            try:
+                results.append(self._parse_with(parser, source_code, source_map))
+            except SyntaxError as e:
+                results.append(e)
+        reference, candidate = results
+
+        reference_failed = isinstance(reference, SyntaxError)
+        candidate_failed = isinstance(candidate, SyntaxError)
+        if reference_failed != candidate_failed or (
+            not reference_failed and reference != candidate
+        ):
+            raise AssertionError(
+                "LALR parser disagrees with Earley reference:\n"
+                f"  earley: {reference}\n"
+                f"  lalr:   {candidate}\n"
+                f"  source: {source_code!r}"
+            )
+
+        if reference_failed:
+            raise reference
+        return reference
+
     def parse_file(self, file_path: str) -> Dict[str, Any]:
-        """Parse Hexen source file"""
+        """Parse Hexen source file, reusing a cached AST when available"""
         with open(file_path, "r") as f:
             source_code = f.read()
-        return self.parse(source_code)
+
+        if self.ast_cache is None:
+            return self.parse(source_code)
+
+        # The cache always stores the dict-based AST
+        self.source_map = SourceMap(source_code) if self.track_spans else None
+        # Modes never share entries, so a drift between the grammars cannot
+        # carry over from one mode to another
+        variant = self.mode + ("-flat" if self.flatten_chains else "")
+        ast = self.ast_cache.get(source_code, self.source_map, variant)
+        if ast is None:
+            ast = self._parse_source(source_code)
+            self.ast_cache.put(source_code, ast, self.source_map, variant)
+        return self._finish(ast)
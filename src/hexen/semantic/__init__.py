@@ -14,6 +14,12 @@ from .block_analyzer import BlockAnalyzer
 # Error handling
 from .errors import SemanticError
 
+# Incremental re-checking across program versions
+from .incremental import IncrementalSession
+
+# Expression memo statistics (SemanticAnalyzer stats_hook)
+from .expression_memo import MemoStats
+
 # Symbol table components
 from .symbol_table import Symbol, SymbolTable
 
@@ -29,4 +35,6 @@ __all__ = [
     "SymbolTable",
     "SemanticError",
     "BlockAnalyzer",
+    "MemoStats",
+    "IncrementalSession",
 ]
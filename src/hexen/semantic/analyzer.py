@@ -6,7 +6,7 @@ Performs semantic analysis on the AST including type checking,
 symbol table management, and validation.
 """
 
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from .assignment_analyzer import AssignmentAnalyzer
 from .binary_ops_analyzer import BinaryOpsAnalyzer
@@ -16,7 +16,10 @@ from .conversion_analyzer import ConversionAnalyzer
 from .declaration_analyzer import DeclarationAnalyzer
 from .errors import SemanticError
 from .expression_analyzer import ExpressionAnalyzer
+from .expression_memo import ExpressionMemo, MemoStats
 from .function_analyzer import FunctionAnalyzer
+from .incremental import IncrementalSession
+from .parallel_analysis import analyze_functions_in_pool, collect_signatures
 from .range_analyzer import RangeAnalyzer
 from .return_analyzer import ReturnAnalyzer
 from .symbol_table import SymbolTable
@@ -43,9 +46,34 @@ class SemanticAnalyzer:
     - Informative: Provide helpful error messages
     """
 
-    def __init__(self):
+    # Programs with fewer functions are analyzed sequentially even when
+    # workers are available: starting the process pool costs more
+    PARALLEL_MIN_FUNCTIONS = 64
+
+    def __init__(
+        self,
+        stats_hook: Optional[Callable[[MemoStats], None]] = None,
+        workers: int = 1,
+        incremental: Optional[IncrementalSession] = None,
+    ):
+        """
+        Args:
+            stats_hook: Called with the expression memo statistics at the
+                end of every analyze() call
+            workers: Processes used to analyze function bodies (see
+                parallel_analysis); 1 analyzes everything in this process
+            incremental: Session holding the function results of a previous
+                version of the program; only changed functions are analyzed
+                again (see incremental). Takes precedence over workers.
+        """
         self.symbol_table = SymbolTable()
         self.errors: List[SemanticError] = []  # Collect all errors for batch reporting
+        self.stats_hook = stats_hook
+        self.workers = workers
+        self.incremental = incremental
+
+        # Per-analysis cache of expression types and errors (see expression_memo)
+        self.expression_memo = ExpressionMemo(self.errors)
         self.current_function_return_type: Optional[
             Union[HexenType, ArrayType]
         ] = None
@@ -118,6 +146,7 @@ class SemanticAnalyzer:
             is_parameter_callback=self.symbol_table.is_parameter,
             get_parameter_info_callback=self.symbol_table.get_parameter_info,
             track_parameter_modification_callback=self._track_parameter_modification,
+            resolve_operand_types_callback=self.binary_ops.resolve_operand_types,
         )
 
         # Initialize return analyzer with callbacks
@@ -145,17 +174,59 @@ class SemanticAnalyzer:
         )
 
         # Initialize expression analyzer with callbacks
+        # (bound directly to the sub-analyzers: this is the hot path)
         self.expression_analyzer = ExpressionAnalyzer(
             error_callback=self._error,
-            analyze_block_callback=self._analyze_block,
-            analyze_binary_operation_callback=self._analyze_binary_operation,
-            analyze_unary_operation_callback=self._analyze_unary_operation,
+            analyze_block_callback=self.block_analyzer.analyze_block,
+            analyze_binary_operation_callback=self.binary_ops.analyze_binary_operation,
+            analyze_unary_operation_callback=self.unary_ops.analyze_unary_operation,
             lookup_symbol_callback=self.symbol_table.lookup_symbol,
-            analyze_function_call_callback=self._analyze_function_call,
+            analyze_function_call_callback=self.function_analyzer.analyze_function_call,
             conversion_analyzer=self.conversion_analyzer,
             comptime_analyzer=self.comptime_analyzer,
+            binary_ops_analyzer=self.binary_ops,
+            unary_ops_analyzer=self.unary_ops,
+            expression_memo=self.expression_memo,
         )
 
+        # Point expression callbacks straight at the expression analyzer,
+        # skipping the _analyze_expression delegation hop on every operand
+        analyze_expression = self.expression_analyzer.analyze_expression
+        for analyzer in (
+            self.binary_ops,
+            self.unary_ops,
+            self.range_analyzer,
+            self.block_analyzer,
+            self.declaration_analyzer,
+            self.assignment_analyzer,
+            self.return_analyzer,
+            self.conversion_analyzer,
+            self.function_analyzer,
+        ):
+            analyzer._analyze_expression = analyze_expression
+
+        # Statement dispatch table: node type -> handler(node), built once
+        analyze_declaration = self.declaration_analyzer.analyze_declaration
+        self._statement_handlers = {
+            NodeType.VAL_DECLARATION.value: analyze_declaration,
+            NodeType.MUT_DECLARATION.value: analyze_declaration,
+            NodeType.RETURN_STATEMENT.value: (
+                self.return_analyzer.analyze_return_statement
+            ),
+            NodeType.ASSIGN_STATEMENT.value: self._analyze_assign_statement,
+            NodeType.ASSIGNMENT_STATEMENT.value: (
+                self.assignment_analyzer.analyze_assignment_statement
+            ),
+            # Statement block - standalone execution (like void functions)
+            NodeType.BLOCK.value: lambda node: self.block_analyzer.analyze_block(
+                node, node, "statement"
+            ),
+            NodeType.CONDITIONAL_STATEMENT.value: self._analyze_conditional_statement,
+            NodeType.FUNCTION_CALL_STATEMENT.value: (
+                self._analyze_function_call_statement
+            ),
+        }
+
     def analyze(self, ast: Dict) -> List[SemanticError]:
         """
         Main entry point for semantic analysis.
@@ -166,16 +237,41 @@ class SemanticAnalyzer:
         Error handling strategy:
         - Catch and convert unexpected exceptions to semantic errors
         - Continue analysis after errors to find as many issues as possible
-        - Reset error list for fresh analysis
+        - Start from a clean state (see reset), so one analyzer can check
+          any number of programs; the returned list is not reused
         """
-        self.errors.clear()
+        self.reset()
         try:
             self._analyze_program(ast)
         except Exception as e:
             # Convert unexpected errors to semantic errors for consistent error handling
             self.errors.append(SemanticError(f"Internal analysis error: {e}"))
 
-        return self.errors
+        # Drop the memoized entries so they do not keep the AST alive
+        stats = self.expression_memo.stats()
+        self.expression_memo.discard_entries()
+        self.comptime_analyzer.block_eval.clear_summaries()
+        if self.stats_hook is not None:
+            self.stats_hook(stats)
+
+        return list(self.errors)
+
+    def reset(self) -> None:
+        """
+        Return to the state of a newly constructed analyzer.
+
+        Clears the per-program state (symbols and functions, errors, function
+        and block context, mut parameter tracking and memoized results) in
+        place, keeping the wired-up sub-analyzers, so reusing an instance is
+        much cheaper than building a new one.
+        """
+        self.symbol_table.reset()
+        self.errors.clear()
+        self.current_function_return_type = None
+        self.block_context.clear()
+        self.modified_mut_parameters.clear()
+        self.expression_memo.reset()
+        self.comptime_analyzer.block_eval.clear_summaries()
 
     def _error(self, message: str, node: Optional[Dict] = None):
         """
@@ -204,13 +300,35 @@ class SemanticAnalyzer:
             return
 
         # Analyze all functions in the program using unified declaration analysis
-        for func in node.get("functions", []):
-            self._analyze_declaration(func)
+        functions = node.get("functions", [])
+        if self.incremental is not None:
+            self.incremental.analyze_functions(self, functions)
+        elif self.workers > 1 and len(functions) >= self.PARALLEL_MIN_FUNCTIONS:
+            self._analyze_functions_parallel(functions)
+        else:
+            for func in functions:
+                self._analyze_declaration(func)
 
         # Analyze top-level statements (val/mut declarations, etc.)
         for stmt in node.get("statements", []):
             self._analyze_statement(stmt)
 
+    def _analyze_functions_parallel(self, functions: List[Dict]) -> None:
+        """
+        Analyze function bodies in a process pool.
+
+        Signatures are declared here first, so top-level statements (analyzed
+        next, in this process) see the same functions as after sequential
+        analysis. Errors are merged in source order.
+        """
+        declared = collect_signatures(functions, self.symbol_table)
+        errors, chunk_stats = analyze_functions_in_pool(
+            functions, declared, self.workers
+        )
+        self.errors.extend(errors)
+        for stats in chunk_stats:
+            self.expression_memo.merge(stats)
+
     # =============================================================================
     # UNIFIED DECLARATION ANALYSIS FRAMEWORK
     # =============================================================================
@@ -251,28 +369,11 @@ class SemanticAnalyzer:
         - while_statement: Loop execution
         - function_call_statement: Function call evaluation
         """
-        stmt_type = node.get("type")
-
-        if stmt_type in [
-            NodeType.VAL_DECLARATION.value,
-            NodeType.MUT_DECLARATION.value,
-        ]:
-            self.declaration_analyzer.analyze_declaration(node)
-        elif stmt_type == NodeType.RETURN_STATEMENT.value:
-            self.return_analyzer.analyze_return_statement(node)
-        elif stmt_type == NodeType.ASSIGN_STATEMENT.value:
-            self._analyze_assign_statement(node)
-        elif stmt_type == NodeType.ASSIGNMENT_STATEMENT.value:
-            self.assignment_analyzer.analyze_assignment_statement(node)
-        elif stmt_type == NodeType.BLOCK.value:
-            # Statement block - standalone execution (like void functions)
-            self._analyze_block(node, node, context="statement")
-        elif stmt_type == NodeType.CONDITIONAL_STATEMENT.value:
-            self._analyze_conditional_statement(node)
-        elif stmt_type == NodeType.FUNCTION_CALL_STATEMENT.value:
-            self._analyze_function_call_statement(node)
-        else:
-            self._error(f"Unknown statement type: {stmt_type}", node)
+        handler = self._statement_handlers.get(node.get("type"))
+        if handler is None:
+            self._error(f"Unknown statement type: {node.get('type')}", node)
+            return
+        handler(node)
 
     def _analyze_expression(
         self, node: Dict, target_type: Optional[HexenType] = None
@@ -18,7 +18,15 @@ import math
 from .error_messages import ArrayErrorMessages
 from .multidim_analyzer import MultidimensionalArrayAnalyzer
 from ..type_util import is_array_type, get_type_name_for_error, is_range_type
-from ..types import HexenType, ArrayType, ComptimeArrayType, RangeType, ComptimeRangeType
+from ..types import (
+    HexenType,
+    ArrayType,
+    ComptimeArrayType,
+    RangeType,
+    ComptimeRangeType,
+    intern_array_type,
+    intern_comptime_array_type,
+)
 from ...ast_nodes import NodeType
 
 
@@ -155,13 +163,13 @@ class ArrayLiteralAnalyzer:
             element_type = list(unique_types)[0]
             if element_type == HexenType.COMPTIME_INT:
                 # CHANGE: Return ComptimeArrayType with size information
-                return ComptimeArrayType(
+                return intern_comptime_array_type(
                     element_comptime_type=HexenType.COMPTIME_INT,
                     dimensions=[array_size]
                 )
             elif element_type == HexenType.COMPTIME_FLOAT:
                 # CHANGE: Return ComptimeArrayType with size information
-                return ComptimeArrayType(
+                return intern_comptime_array_type(
                     element_comptime_type=HexenType.COMPTIME_FLOAT,
                     dimensions=[array_size]
                 )
@@ -177,7 +185,7 @@ class ArrayLiteralAnalyzer:
         if unique_types <= {HexenType.COMPTIME_INT, HexenType.COMPTIME_FLOAT}:
             # Mixed comptime int/float -> promote to comptime array float
             # CHANGE: Return ComptimeArrayType with size information
-            return ComptimeArrayType(
+            return intern_comptime_array_type(
                 element_comptime_type=HexenType.COMPTIME_FLOAT,
                 dimensions=[array_size]
             )
@@ -269,7 +277,7 @@ class ArrayLiteralAnalyzer:
         elements = node.get("elements", [])
 
         # Each element should be an array literal matching the inner dimensions
-        inner_target_type = ArrayType(
+        inner_target_type = intern_array_type(
             target_type.element_type,
             target_type.dimensions[1:],  # Remove first dimension
         )
@@ -437,7 +445,7 @@ class ArrayLiteralAnalyzer:
             else:
                 # Multidimensional comptime array access reduces by one dimension
                 new_dimensions = array_type.dimensions[1:]
-                return ComptimeArrayType(array_type.element_comptime_type, new_dimensions)
+                return intern_comptime_array_type(array_type.element_comptime_type, new_dimensions)
 
         # Handle concrete array types (ConcreteArrayType instances)
         elif hasattr(array_type, "element_type") and hasattr(array_type, "dimensions"):
@@ -449,7 +457,7 @@ class ArrayLiteralAnalyzer:
                 # Multidimensional array access reduces by one dimension
                 # ConcreteArrayType already imported at top of file
                 new_dimensions = array_type.dimensions[1:]  # Remove first dimension
-                return ArrayType(array_type.element_type, new_dimensions)
+                return intern_array_type(array_type.element_type, new_dimensions)
 
         # Handle basic HexenType array access
         elif array_type in [
@@ -675,13 +683,13 @@ class ArrayLiteralAnalyzer:
         # 5. Create appropriate array type
         if element_type in {HexenType.COMPTIME_INT, HexenType.COMPTIME_FLOAT}:
             # Comptime range materializes to comptime array
-            return ComptimeArrayType(
+            return intern_comptime_array_type(
                 element_comptime_type=element_type,
                 dimensions=[array_size]
             )
         else:
             # Concrete range materializes to concrete array
-            return ArrayType(
+            return intern_array_type(
                 element_type=element_type,
                 dimensions=[array_size]
             )
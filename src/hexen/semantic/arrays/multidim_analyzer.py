@@ -14,7 +14,7 @@ from typing import Dict, List, Any, Optional, Callable, Union
 
 from .array_types import ArrayTypeInfo
 from .error_messages import ArrayErrorMessages
-from ..types import HexenType, ComptimeArrayType
+from ..types import HexenType, ComptimeArrayType, intern_comptime_array_type
 
 
 class MultidimensionalArrayAnalyzer:
@@ -65,7 +65,7 @@ class MultidimensionalArrayAnalyzer:
         if not self._is_array_literal(first_element):
             # This is actually a 1D array, delegate back to regular analysis
             # CHANGE: Return ComptimeArrayType with 1D dimensions
-            return ComptimeArrayType(
+            return intern_comptime_array_type(
                 element_comptime_type=HexenType.COMPTIME_INT, dimensions=[len(elements)]
             )
 
@@ -82,7 +82,7 @@ class MultidimensionalArrayAnalyzer:
         dimensions = self._calculate_dimensions(elements)
         element_type = self._determine_element_type(elements)
 
-        return ComptimeArrayType(
+        return intern_comptime_array_type(
             element_comptime_type=element_type, dimensions=dimensions
         )
 
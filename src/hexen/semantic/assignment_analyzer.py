@@ -9,7 +9,7 @@ Handles analysis of assignment statements including:
 - Explicit conversion support for precision loss operations
 """
 
-from typing import Dict, Optional, Callable
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .type_util import (
     can_coerce,
@@ -38,6 +38,9 @@ class AssignmentAnalyzer:
         is_parameter_callback: Optional[Callable[[str], bool]] = None,
         get_parameter_info_callback: Optional[Callable[[str], Optional[object]]] = None,
         track_parameter_modification_callback: Optional[Callable[[str], None]] = None,
+        resolve_operand_types_callback: Optional[
+            Callable[[Dict, List[HexenType], Optional[HexenType]], HexenType]
+        ] = None,
     ):
         """
         Initialize the assignment analyzer.
@@ -50,6 +53,7 @@ class AssignmentAnalyzer:
             is_parameter_callback: Function to check if a name is a parameter
             get_parameter_info_callback: Function to get parameter info
             track_parameter_modification_callback: Function to track parameter modifications
+            resolve_operand_types_callback: Function to fold operand types of an n-ary operation
         """
         self._error = error_callback
         self._analyze_expression = analyze_expression_callback
@@ -58,6 +62,7 @@ class AssignmentAnalyzer:
         self._is_parameter = is_parameter_callback
         self._get_parameter_info = get_parameter_info_callback
         self._track_parameter_modification = track_parameter_modification_callback
+        self._resolve_operand_types = resolve_operand_types_callback
 
     def analyze_assignment_statement(self, node: Dict) -> None:
         """
@@ -116,22 +121,9 @@ class AssignmentAnalyzer:
             # If we get here without errors, either it's a safe operation or it was explicitly converted
             # For complex expressions (like binary operations), check what the natural type would be
             # without target type influence to detect precision loss scenarios
-            if value.get("type") == "binary_operation":
+            if value.get("type") in ("binary_operation", "nary_operation"):
                 # Use centralized comptime operand analysis from ComptimeAnalyzer
-                left = value.get("left", {})
-                right = value.get("right", {})
-
-                # Get operand types
-                left_type = (
-                    self._analyze_expression(left, symbol.type)
-                    if left
-                    else HexenType.UNKNOWN
-                )
-                right_type = (
-                    self._analyze_expression(right, symbol.type)
-                    if right
-                    else HexenType.UNKNOWN
-                )
+                left_type, right_type = self._last_operand_types(value, symbol.type)
 
                 # Use centralized logic to determine if precision loss check should be skipped
                 should_skip_check = (
@@ -183,6 +175,40 @@ class AssignmentAnalyzer:
         # Mark the symbol as initialized (assignment initializes uninitialized variables)
         symbol.initialized = True
 
+    def _last_operand_types(
+        self, value: Dict, target_type: HexenType
+    ) -> Tuple[HexenType, HexenType]:
+        """
+        Types of the (left, right) operands of a binary or n-ary operation.
+
+        An n-ary chain is split as its left-deep binary form would be: the
+        last operand on the right, the fold of the remaining operand types
+        on the left. Operands were already analyzed with the same target, so
+        their types come from the expression memo.
+        """
+        if value.get("type") != "nary_operation":
+            left, right = value.get("left"), value.get("right")
+            left_type = (
+                self._analyze_expression(left, target_type)
+                if left
+                else HexenType.UNKNOWN
+            )
+            right_type = (
+                self._analyze_expression(right, target_type)
+                if right
+                else HexenType.UNKNOWN
+            )
+            return left_type, right_type
+
+        operands = value.get("operands") or []
+        if len(operands) < 2 or self._resolve_operand_types is None:
+            return HexenType.UNKNOWN, HexenType.UNKNOWN
+        operand_types = [
+            self._analyze_expression(operand, target_type) for operand in operands
+        ]
+        left_type = self._resolve_operand_types(value, operand_types[:-1], target_type)
+        return left_type, operand_types[-1]
+
     def _check_precision_loss_in_binary_op(self, value, symbol, node):
         """Helper method to check precision loss in binary operations."""
         # Analyze the expression without target context to get its natural type
@@ -10,7 +10,7 @@ Handles analysis of binary operations including:
 - Mixed type operations with explicit type requirements
 """
 
-from typing import Dict, Optional, Callable, Set
+from typing import Dict, Optional, Callable, List, Sequence, Set
 
 from .type_util import (
     is_numeric_type,
@@ -21,6 +21,7 @@ from .type_util import (
     is_integer_type,
 )
 from .types import HexenType
+from ..ast_nodes import NodeType
 
 # Set of comparison operators
 COMPARISON_OPERATORS: Set[str] = {"<", ">", "<=", ">=", "==", "!="}
@@ -66,24 +67,92 @@ class BinaryOpsAnalyzer:
         """
         Analyze a binary operation with context-guided type resolution.
 
+        Also accepts n-ary operation nodes (flattened same-operator chains).
+
         Args:
-            node: Binary operation AST node
+            node: Binary or n-ary operation AST node
             target_type: Optional target type for context-guided resolution
 
         Returns:
             The resolved type of the operation
         """
-        operator = node.get("operator")
-        left = node.get("left")
-        right = node.get("right")
-
-        if not operator or not left or not right:
-            self._error("Invalid binary operation", node)
+        operands = self.binary_operands(node)
+        if operands is None:
             return HexenType.UNKNOWN
 
         # Analyze operands (with context if provided)
-        left_type = self._analyze_expression(left, target_type)
-        right_type = self._analyze_expression(right, target_type)
+        operand_types = [
+            self._analyze_expression(operand, target_type) for operand in operands
+        ]
+
+        return self.resolve_operand_types(node, operand_types, target_type)
+
+    def binary_operands(self, node: Dict) -> Optional[Sequence[Dict]]:
+        """
+        Return the operands of a well-formed binary or n-ary operation.
+
+        Binary operations yield (left, right). Reports an error and returns
+        None for malformed nodes.
+        """
+        if node.get("type") == NodeType.NARY_OPERATION.value:
+            operands = node.get("operands")
+            if node.get("operator") and operands and len(operands) >= 2:
+                if all(operands):
+                    return operands
+        else:
+            left = node.get("left")
+            right = node.get("right")
+            if node.get("operator") and left and right:
+                return left, right
+        self._error("Invalid binary operation", node)
+        return None
+
+    def resolve_operand_types(
+        self,
+        node: Dict,
+        operand_types: List[HexenType],
+        target_type: Optional[HexenType] = None,
+    ) -> HexenType:
+        """
+        Resolve a binary or n-ary operation from its analyzed operand types.
+
+        N-ary operations are a left fold: each step resolves the type so far
+        with the next operand exactly as the left-deep binary tree would, so
+        both forms yield the same type and errors in a single pass.
+
+        A step only depends on the operator, target type and the two operand
+        types, and every error resolves to UNKNOWN (which ends the fold), so
+        each distinct type pair of a chain is resolved once.
+        """
+        resolved = {}
+        result_type = operand_types[0]
+        for index in range(1, len(operand_types)):
+            operand_type = operand_types[index]
+            step_type = resolved.get((result_type, operand_type))
+            if step_type is None:
+                step_type = self.resolve_binary_operation(
+                    node, result_type, operand_type, target_type
+                )
+                if step_type == HexenType.UNKNOWN:
+                    return HexenType.UNKNOWN
+                resolved[(result_type, operand_type)] = step_type
+            result_type = step_type
+        return result_type
+
+    def resolve_binary_operation(
+        self,
+        node: Dict,
+        left_type: HexenType,
+        right_type: HexenType,
+        target_type: Optional[HexenType] = None,
+    ) -> HexenType:
+        """
+        Resolve the type of a binary operation from its analyzed operand types.
+
+        Operands are analyzed by the caller (with the same target_type), which
+        lets ExpressionAnalyzer analyze long operator chains iteratively.
+        """
+        operator = node.get("operator")
 
         if left_type == HexenType.UNKNOWN or right_type == HexenType.UNKNOWN:
             return HexenType.UNKNOWN
@@ -329,8 +398,8 @@ class BinaryOpsAnalyzer:
             # Note: Operand type validation is done in analyze_binary_operation
             return HexenType.BOOL
 
-        # For arithmetic operations
-        if operator in ["+", "-", "*"]:
+        # For arithmetic operations (% takes its operands' type like + - *)
+        if operator in ["+", "-", "*", "%"]:
             # Handle string concatenation for + operator
             if (
                 operator == "+"
@@ -23,7 +23,7 @@ Usage:
 from typing import Dict, List, Optional, Union, Any
 
 from .binary_operations import BinaryOperations
-from .block_evaluation import BlockEvaluation
+from .block_evaluation import BlockEvaluation, BlockFlags
 from .declaration_support import DeclarationSupport
 from .literal_validation import LiteralValidation
 
@@ -212,6 +212,10 @@ class ComptimeAnalyzer:
         """Classify block as compile-time or runtime evaluable."""
         return self.block_eval.classify_block_evaluability(statements)
 
+    def summarize_block(self, statements: List[Dict]) -> BlockFlags:
+        """Compute the memoized bit-flag summary of a block."""
+        return self.block_eval.summarize_block(statements)
+
     def should_preserve_comptime_types(self, evaluability: BlockEvaluability) -> bool:
         """Determine if comptime types should be preserved based on evaluability."""
         return self.block_eval.should_preserve_comptime_types(evaluability)
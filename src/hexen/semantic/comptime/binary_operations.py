@@ -72,6 +72,12 @@ class BinaryOperations:
             if right and self.has_comptime_operands(right):
                 return True
 
+        # N-ary operations: check every operand
+        elif expr_type == NodeType.NARY_OPERATION.value:
+            for operand in expression.get("operands") or ():
+                if operand and self.has_comptime_operands(operand):
+                    return True
+
         # Unary operations: check operand
         elif expr_type == NodeType.UNARY_OPERATION.value:
             operand = expression.get("operand")
@@ -245,7 +251,7 @@ class BinaryOperations:
         Returns None if not a comptime-specific case (caller should handle normally).
 
         Args:
-            operator: Arithmetic operator (+, -, *)
+            operator: Arithmetic operator (+, -, *, %)
             left_type: Left operand type
             right_type: Right operand type
             target_type: Optional target type for context
@@ -253,7 +259,7 @@ class BinaryOperations:
         Returns:
             Resolved type for comptime operations, None for non-comptime cases
         """
-        if operator not in ["+", "-", "*"]:
+        if operator not in ["+", "-", "*", "%"]:
             return None  # Not an arithmetic operator we handle
 
         # Handle comptime type promotion first (Pattern 1)
@@ -359,7 +365,7 @@ class BinaryOperations:
             return HexenType.BOOL
 
         # Arithmetic operators follow promotion rules
-        if operator in {"+", "-", "*", "/", "\\"}:
+        if operator in {"+", "-", "*", "/", "\\", "%"}:
             return self.type_ops.get_comptime_promotion_result(left_type, right_type)
 
         return HexenType.UNKNOWN
@@ -13,16 +13,108 @@ Responsibilities:
 
 This module centralizes all the block evaluation logic that was extracted
 during the centralization effort.
+
+All detections share one fused walk: each statement list, statement and
+expression is summarized once into bit flags plus the variable names whose
+types matter, and statement-level summaries are memoized per node. Variable
+names are resolved against the symbol table at query time, so answers still
+follow the current scope.
 """
 
-from typing import Dict, List, Optional
+from collections.abc import Mapping
+from enum import IntFlag
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from .type_operations import TypeOperations
 from ..symbol_table import SymbolTable
-from ..types import HexenType, BlockEvaluability
+from ..types import HexenType, BlockEvaluability, ComptimeArrayType
 from ...ast_nodes import NodeType
 
 
+class BlockFlags(IntFlag):
+    """Bit-flag summary of a block (see BlockEvaluation.summarize_block)"""
+
+    NONE = 0
+    FUNCTION_CALLS = 1
+    CONDITIONALS = 2
+    RUNTIME_VARIABLES = 4
+    NOT_COMPTIME_ONLY = 8
+
+
+# Plain ints for the walk itself (IntFlag arithmetic is comparatively slow)
+_FUNCTION_CALLS = BlockFlags.FUNCTION_CALLS.value
+_CONDITIONALS = BlockFlags.CONDITIONALS.value
+_RUNTIME_VARIABLES = BlockFlags.RUNTIME_VARIABLES.value
+_NOT_COMPTIME_ONLY = BlockFlags.NOT_COMPTIME_ONLY.value
+_RUNTIME_OPERATIONS = _FUNCTION_CALLS | _CONDITIONALS
+
+_NO_NAMES: FrozenSet[str] = frozenset()
+
+
+class _Summary:
+    """
+    Structural summary of an AST subtree.
+
+    flags holds everything that does not depend on variable types. The two
+    name sets hold the variables reached by runtime-variable detection and
+    by comptime-only detection respectively; they are resolved per query.
+    """
+
+    __slots__ = ("flags", "runtime_names", "comptime_names")
+
+    def __init__(
+        self,
+        flags: int = 0,
+        runtime_names: FrozenSet[str] = _NO_NAMES,
+        comptime_names: FrozenSet[str] = _NO_NAMES,
+    ):
+        self.flags = flags
+        self.runtime_names = runtime_names
+        self.comptime_names = comptime_names
+
+    @staticmethod
+    def combine(summaries: Sequence["_Summary"]) -> "_Summary":
+        """Summary of sibling subtrees: union of flags and names"""
+        if not summaries:
+            return _EMPTY_SUMMARY
+        if len(summaries) == 1:
+            return summaries[0]
+        flags = 0
+        runtime_names = _NO_NAMES
+        comptime_names = _NO_NAMES
+        for summary in summaries:
+            flags |= summary.flags
+            if summary.runtime_names:
+                runtime_names = runtime_names | summary.runtime_names
+            if summary.comptime_names:
+                comptime_names = comptime_names | summary.comptime_names
+        return _Summary(flags, runtime_names, comptime_names)
+
+    def without_runtime_operations(self) -> "_Summary":
+        """Same summary, hidden from function call / conditional detection"""
+        if not self.flags & _RUNTIME_OPERATIONS:
+            return self
+        return _Summary(
+            self.flags & ~_RUNTIME_OPERATIONS, self.runtime_names, self.comptime_names
+        )
+
+
+_EMPTY_SUMMARY = _Summary()
+_NOT_COMPTIME_SUMMARY = _Summary(_NOT_COMPTIME_ONLY)
+
+# How a node's summary combines its children's (see _expression_children)
+_COMBINED = 0
+_HIDDEN = 1
+_PARTIAL = 2
+
+
+def _is_comptime_type(var_type) -> bool:
+    """Comptime variables never make a block runtime"""
+    if isinstance(var_type, ComptimeArrayType):
+        return True
+    return var_type in [HexenType.COMPTIME_INT, HexenType.COMPTIME_FLOAT]
+
+
 class BlockEvaluation:
     """
     Block evaluability classification and comptime context analysis.
@@ -43,6 +135,11 @@ class BlockEvaluation:
         self.symbol_table = symbol_table
         self.type_ops = type_ops
 
+        # Memoized structural summaries, keyed by id(); each entry keeps its
+        # node alive so ids are never reused while cached
+        self._statement_list_summaries: Dict[int, Tuple[List[Dict], _Summary]] = {}
+        self._statement_summaries: Dict[int, Tuple[Dict, _Summary]] = {}
+
     # =========================================================================
     # COMPTIME TYPE PRESERVATION LOGIC
     # =========================================================================
@@ -91,6 +188,10 @@ class BlockEvaluation:
                 # This is a simplified check - would need full type analysis
                 return True  # Conservative: assume binary ops need context
 
+        elif expr_type == NodeType.NARY_OPERATION.value:
+            if expression.get("operands"):
+                return True
+
         return False
 
     # =========================================================================
@@ -123,266 +224,353 @@ class BlockEvaluation:
             BlockEvaluability.COMPILE_TIME if block can preserve comptime types
             BlockEvaluability.RUNTIME if block requires explicit context
         """
-        # Enhanced detection with function calls and conditionals
+        # One fused summary answers every check below
+        flags = self.summarize_block(statements)
 
         # Priority 1: Check for runtime operations (function calls, conditionals)
-        if self._contains_runtime_operations(statements):
+        if flags & (BlockFlags.FUNCTION_CALLS | BlockFlags.CONDITIONALS):
             return BlockEvaluability.RUNTIME
 
         # Priority 2: Check for concrete variable usage (mixing comptime + concrete = runtime)
-        if self.has_runtime_variables(statements):
+        if flags & BlockFlags.RUNTIME_VARIABLES:
             return BlockEvaluability.RUNTIME
 
         # Priority 3: If all operations are comptime-only, block is compile-time evaluable
-        if self.has_comptime_only_operations(statements):
+        if not flags & BlockFlags.NOT_COMPTIME_ONLY:
             return BlockEvaluability.COMPILE_TIME
 
         # Default to runtime for safety (unknown cases should require explicit context)
         return BlockEvaluability.RUNTIME
 
     # =========================================================================
-    # RUNTIME OPERATION DETECTION
+    # FUSED BLOCK SUMMARY
     # =========================================================================
 
-    def _contains_runtime_operations(self, statements: List[Dict]) -> bool:
+    def summarize_block(self, statements: List[Dict]) -> BlockFlags:
         """
-        Detect runtime operations that trigger runtime classification.
+        Compute the bit-flag summary of a block's statements.
 
-        Runtime operations include:
-        - Function calls (functions always return concrete types)
-        - Conditional expressions (all conditionals are runtime per CONDITIONAL_SYSTEM.md)
-        - Runtime variable usage (concrete types) - handled by existing logic
-
-        This enhances the block evaluability system with comprehensive runtime detection.
+        The structural part of the summary is computed in a single walk and
+        memoized per statement list and per statement, so nested expression
+        blocks are only walked once. Flags that depend on variable types are
+        resolved against the current symbol table on every call, which costs
+        one lookup per distinct variable name in the block.
 
         Args:
-            statements: List of statements to analyze
+            statements: List of statements in the block
 
         Returns:
-            True if any runtime operations found, False if all operations are comptime
-        """
-        return self._contains_function_calls(statements) or self._contains_conditionals(
-            statements
+            BlockFlags describing function calls, conditionals, runtime
+            variable usage and non-comptime operations in the block
+        """
+        return BlockFlags(self._resolve(self._summarize_statements(statements)))
+
+    def clear_summaries(self) -> None:
+        """Drop memoized summaries (they keep their AST nodes alive)"""
+        self._statement_list_summaries.clear()
+        self._statement_summaries.clear()
+
+    def _resolve(self, summary: "_Summary") -> int:
+        """Add the flags contributed by variable references to a summary"""
+        flags = summary.flags
+        lookup = self.symbol_table.lookup_symbol
+
+        # Unknown names are forward references within the block being
+        # classified: treated as comptime, never as runtime variables
+        if not flags & _RUNTIME_VARIABLES:
+            for name in summary.runtime_names:
+                symbol = lookup(name)
+                if symbol is not None and not _is_comptime_type(symbol.type):
+                    flags |= _RUNTIME_VARIABLES
+                    break
+        if not flags & _NOT_COMPTIME_ONLY:
+            for name in summary.comptime_names:
+                symbol = lookup(name)
+                if symbol is not None and not _is_comptime_type(symbol.type):
+                    flags |= _NOT_COMPTIME_ONLY
+                    break
+        return flags
+
+    def _summarize_statements(self, statements: List[Dict]) -> "_Summary":
+        """Summary of a statement list (memoized by list identity)"""
+        cached = self._statement_list_summaries.get(id(statements))
+        if cached is not None:
+            return cached[1]
+
+        summary = _Summary.combine(
+            [self._summarize_statement(statement) for statement in statements]
         )
+        # Keep the list alive so its id cannot be reused by another list
+        self._statement_list_summaries[id(statements)] = (statements, summary)
+        return summary
 
-    def _contains_function_calls(self, statements: List[Dict]) -> bool:
-        """
-        Recursively detect function calls in block statements.
-
-        Function calls always trigger runtime classification because:
-        1. Functions always return concrete types (never comptime types)
-        2. Function execution happens at runtime
-        3. Results cannot be computed at compile-time
-
-        Args:
-            statements: List of statements to analyze
-
-        Returns:
-            True if any function calls found in statements or sub-expressions
-        """
-        for statement in statements:
-            if self._statement_contains_function_calls(statement):
-                return True
-        return False
+    def _summarize_statement(self, statement: Dict) -> "_Summary":
+        """Summary of a single statement (memoized by node identity)"""
+        cached = self._statement_summaries.get(id(statement))
+        if cached is not None:
+            return cached[1]
 
-    def _contains_conditionals(self, statements: List[Dict]) -> bool:
-        """
-        Recursively detect conditional expressions in block statements.
+        summary = self._compute_statement_summary(statement)
+        self._statement_summaries[id(statement)] = (statement, summary)
+        return summary
 
-        Conditionals always trigger runtime classification per CONDITIONAL_SYSTEM.md:
-        1. All conditionals are runtime (specification requirement)
-        2. Condition evaluation happens at runtime
-        3. Branch selection cannot be determined at compile-time
-
-        Args:
-            statements: List of statements to analyze
-
-        Returns:
-            True if any conditionals found in statements or sub-expressions
-        """
-        for statement in statements:
-            if self._statement_contains_conditionals(statement):
-                return True
-        return False
-
-    def _statement_contains_function_calls(self, statement: Dict) -> bool:
-        """
-        Check if a single statement contains function calls.
-
-        Args:
-            statement: Statement AST node to analyze
-
-        Returns:
-            True if statement contains function calls, False otherwise
-        """
+    def _compute_statement_summary(self, statement: Dict) -> "_Summary":
         stmt_type = statement.get("type")
 
-        # Function call statements are direct function calls
+        # Direct runtime operations
         if stmt_type == NodeType.FUNCTION_CALL_STATEMENT.value:
-            return True
-
-        # Check expressions in declaration statements
-        if stmt_type in [
-            NodeType.VAL_DECLARATION.value,
-            NodeType.MUT_DECLARATION.value,
-        ]:
-            value = statement.get("value")
-            if value and value != "undef":
-                return self._expression_contains_function_calls(value)
-
-        # Check expressions in assign/assignment statements
-        elif stmt_type in [
-            NodeType.ASSIGN_STATEMENT.value,
-            NodeType.ASSIGNMENT_STATEMENT.value,
-        ]:
-            value = statement.get("value")
-            if value:
-                return self._expression_contains_function_calls(value)
-
-        # Check expressions in return statements
-        elif stmt_type == NodeType.RETURN_STATEMENT.value:
-            value = statement.get("value")
-            if value:
-                return self._expression_contains_function_calls(value)
-
-        return False
-
-    def _statement_contains_conditionals(self, statement: Dict) -> bool:
-        """
-        Check if a single statement contains conditionals.
-
-        Args:
-            statement: Statement AST node to analyze
-
-        Returns:
-            True if statement contains conditionals, False otherwise
-        """
-        stmt_type = statement.get("type")
-
-        # Direct conditional statements
+            return _Summary(_FUNCTION_CALLS | _NOT_COMPTIME_ONLY)
         if stmt_type == NodeType.CONDITIONAL_STATEMENT.value:
-            return True
+            return _Summary(_CONDITIONALS | _NOT_COMPTIME_ONLY)
 
-        # Check expressions in declaration statements
+        # Variable declarations: an explicit concrete type annotation makes
+        # the declaration runtime on its own, and then the initializer is not
+        # consulted for runtime variables
         if stmt_type in [
             NodeType.VAL_DECLARATION.value,
             NodeType.MUT_DECLARATION.value,
         ]:
+            type_annotation = statement.get("type_annotation")
             value = statement.get("value")
             if value and value != "undef":
-                return self._expression_contains_conditionals(value)
+                summary = self._summarize_expression(value)
+            else:
+                summary = _EMPTY_SUMMARY  # undef is considered comptime
+            if type_annotation:
+                from ..type_util import is_concrete_type
 
-        # Check expressions in assign/assignment statements
+                # Array/range annotations are nodes: judge their element type
+                if isinstance(type_annotation, Mapping):
+                    type_annotation = type_annotation.get("element_type")
+                flags = summary.flags & ~_RUNTIME_VARIABLES
+                if isinstance(type_annotation, str) and is_concrete_type(
+                    type_annotation
+                ):
+                    flags |= _RUNTIME_VARIABLES
+                return _Summary(flags, _NO_NAMES, summary.comptime_names)
+            return summary
+
+        # Assign and assignment statements: check the assigned expression
         elif stmt_type in [
             NodeType.ASSIGN_STATEMENT.value,
             NodeType.ASSIGNMENT_STATEMENT.value,
         ]:
             value = statement.get("value")
             if value:
-                return self._expression_contains_conditionals(value)
+                return self._summarize_expression(value)
+            return _NOT_COMPTIME_SUMMARY
 
-        # Check expressions in return statements
+        # Return statements: check the returned expression
         elif stmt_type == NodeType.RETURN_STATEMENT.value:
             value = statement.get("value")
             if value:
-                return self._expression_contains_conditionals(value)
-
-        return False
+                return self._summarize_expression(value)
+            return _EMPTY_SUMMARY  # bare return is comptime
+
+        # Other statement types: assume runtime if not explicitly comptime
+        return _NOT_COMPTIME_SUMMARY
+
+    def _summarize_expression(self, expression: Dict) -> "_Summary":
+        """
+        Summary of an expression subtree.
+
+        Function call and conditional detection only looks through operators,
+        conversions and nested blocks, while runtime variable and comptime-only
+        detection also look into array literals, indexing, copies and property
+        access, so those children contribute everything but call and
+        conditional flags.
+
+        Long operator chains parse into trees as deep as the chain is long,
+        so the subtree is walked with an explicit work stack in post-order
+        (like ExpressionAnalyzer._analyze_operation_chain) rather than
+        recursively.
+        """
+        # Work items are nodes to visit or (arity, combination) tuples marking
+        # a node whose children's summaries are on top of the results stack
+        work = [expression]
+        results: List[_Summary] = []
+        while work:
+            item = work.pop()
+            if type(item) is tuple:
+                arity, combination = item
+                children = results[len(results) - arity :]
+                del results[len(results) - arity :]
+                if combination == _PARTIAL:
+                    # Incomplete node: only runtime operations in its operands
+                    flags = _NOT_COMPTIME_ONLY
+                    for child in children:
+                        flags |= child.flags & _RUNTIME_OPERATIONS
+                    results.append(_Summary(flags))
+                elif combination == _HIDDEN:
+                    results.append(
+                        _Summary.combine(children).without_runtime_operations()
+                    )
+                else:
+                    results.append(_Summary.combine(children))
+                continue
 
-    def _expression_contains_function_calls(self, expression: Dict) -> bool:
-        """
-        Recursively analyze expression for function calls.
+            children, combination = self._expression_children(item)
+            if children is None:
+                results.append(combination)
+            elif combination == _COMBINED and len(children) == 1:
+                # Unary operations and conversions: the operand's summary
+                work.append(children[0])
+            else:
+                work.append((len(children), combination))
+                work.extend(reversed(children))
 
-        This performs deep analysis of expression trees to find any nested
-        function calls that would trigger runtime classification.
+        return results[0]
 
-        Args:
-            expression: Expression AST node to analyze
+    def _expression_children(self, expression: Dict):
+        """
+        How an expression node is summarized.
 
-        Returns:
-            True if expression contains function calls, False otherwise
+        Returns (None, summary) for nodes summarized on their own, or
+        (children, combination) for nodes whose summary combines their
+        children's: _COMBINED unions them, _HIDDEN also hides them from
+        function call and conditional detection, and _PARTIAL (incomplete
+        nodes) keeps only their runtime operations.
         """
         expr_type = expression.get("type")
 
-        # Direct function call expression
+        # Direct runtime operations
         if expr_type == NodeType.FUNCTION_CALL.value:
-            return True
+            return None, _Summary(_FUNCTION_CALLS | _NOT_COMPTIME_ONLY)
+        if expr_type == NodeType.CONDITIONAL_STATEMENT.value:
+            # Per CONDITIONAL_SYSTEM.md: all conditionals are runtime
+            return None, _Summary(_CONDITIONALS | _NOT_COMPTIME_ONLY)
+
+        # Literals (comptime, string and bool) are comptime-only
+        if expr_type in [
+            NodeType.COMPTIME_INT.value,
+            NodeType.COMPTIME_FLOAT.value,
+            NodeType.LITERAL.value,
+        ]:
+            return None, _EMPTY_SUMMARY
 
-        # Binary operations: check both operands
+        # Variable references are resolved against the symbol table per query
+        elif expr_type == NodeType.IDENTIFIER.value:
+            var_name = expression.get("name")
+            if var_name:
+                names = frozenset((var_name,))
+                return None, _Summary(0, names, names)
+            return None, _NOT_COMPTIME_SUMMARY
+
+        # Binary operations: both operands
         elif expr_type == NodeType.BINARY_OPERATION.value:
             left = expression.get("left")
             right = expression.get("right")
-            if left and self._expression_contains_function_calls(left):
-                return True
-            if right and self._expression_contains_function_calls(right):
-                return True
+            if left and right:
+                return (left, right), _COMBINED
+            operand = left or right
+            return (operand,) if operand else (), _PARTIAL
+
+        # N-ary operations: every operand
+        elif expr_type == NodeType.NARY_OPERATION.value:
+            operands = expression.get("operands") or ()
+            if operands and all(operands):
+                return operands, _COMBINED
+            return [operand for operand in operands if operand], _PARTIAL
+
+        # Unary operations and explicit conversions: the operand
+        elif expr_type in [
+            NodeType.UNARY_OPERATION.value,
+            NodeType.EXPLICIT_CONVERSION_EXPRESSION.value,
+        ]:
+            key = "operand" if expr_type == NodeType.UNARY_OPERATION.value else "expression"
+            operand = expression.get(key)
+            if operand:
+                return (operand,), _COMBINED
+            return None, _NOT_COMPTIME_SUMMARY
 
-        # Unary operations: check operand
-        elif expr_type == NodeType.UNARY_OPERATION.value:
-            operand = expression.get("operand")
-            if operand and self._expression_contains_function_calls(operand):
-                return True
+        # Block expressions: nested expression blocks (memoized)
+        elif expr_type == NodeType.BLOCK.value:
+            return None, self._summarize_statements(expression.get("statements", []))
 
-        # Explicit conversions: check operand
-        elif expr_type == NodeType.EXPLICIT_CONVERSION_EXPRESSION.value:
-            operand = expression.get("expression")
-            if operand and self._expression_contains_function_calls(operand):
-                return True
+        # Array literals: all elements (empty arrays are comptime)
+        elif expr_type == NodeType.ARRAY_LITERAL.value:
+            return expression.get("elements", []), _HIDDEN
 
-        # Block expressions: recursively analyze (nested expression blocks)
-        elif expr_type == NodeType.BLOCK.value:
-            statements = expression.get("statements", [])
-            return self._contains_function_calls(statements)
+        # Array access: both array and index
+        elif expr_type == NodeType.ARRAY_ACCESS.value:
+            array_expr = expression.get("array")
+            index_expr = expression.get("index")
+            if array_expr and index_expr:
+                return (array_expr, index_expr), _HIDDEN
+            return None, _NOT_COMPTIME_SUMMARY
 
-        return False
+        # Array copy and property access: the array / object expression
+        elif expr_type in [
+            NodeType.ARRAY_COPY.value,
+            NodeType.PROPERTY_ACCESS.value,
+        ]:
+            key = "array" if expr_type == NodeType.ARRAY_COPY.value else "object"
+            operand = expression.get(key)
+            if operand:
+                return (operand,), _HIDDEN
+            return None, _NOT_COMPTIME_SUMMARY
 
-    def _expression_contains_conditionals(self, expression: Dict) -> bool:
+        # Anything else: assume runtime if not explicitly comptime
+        return None, _NOT_COMPTIME_SUMMARY
+
+    # =========================================================================
+    # RUNTIME OPERATION DETECTION
+    # =========================================================================
+
+    def _contains_runtime_operations(self, statements: List[Dict]) -> bool:
         """
-        Recursively analyze expression for conditionals.
+        Detect runtime operations that trigger runtime classification.
 
-        This performs deep analysis of expression trees to find any nested
-        conditionals that would trigger runtime classification.
+        Runtime operations include:
+        - Function calls (functions always return concrete types)
+        - Conditional expressions (all conditionals are runtime per CONDITIONAL_SYSTEM.md)
+        - Runtime variable usage (concrete types) - handled by existing logic
 
         Args:
-            expression: Expression AST node to analyze
+            statements: List of statements to analyze
 
         Returns:
-            True if expression contains conditionals, False otherwise
+            True if any runtime operations found, False if all operations are comptime
         """
-        expr_type = expression.get("type")
+        return bool(self._summarize_statements(statements).flags & _RUNTIME_OPERATIONS)
 
-        # Direct conditional expression (if-expressions used as values)
-        # Per CONDITIONAL_SYSTEM.md: All conditionals are runtime, even with comptime branches
-        if expr_type == NodeType.CONDITIONAL_STATEMENT.value:
-            return True
+    def _contains_function_calls(self, statements: List[Dict]) -> bool:
+        """
+        Detect function calls in block statements and nested expression blocks.
 
-        # Binary operations: check both operands
-        if expr_type == NodeType.BINARY_OPERATION.value:
-            left = expression.get("left")
-            right = expression.get("right")
-            if left and self._expression_contains_conditionals(left):
-                return True
-            if right and self._expression_contains_conditionals(right):
-                return True
+        Function calls always trigger runtime classification because:
+        1. Functions always return concrete types (never comptime types)
+        2. Function execution happens at runtime
+        3. Results cannot be computed at compile-time
+        """
+        return bool(self._summarize_statements(statements).flags & _FUNCTION_CALLS)
 
-        # Unary operations: check operand
-        elif expr_type == NodeType.UNARY_OPERATION.value:
-            operand = expression.get("operand")
-            if operand and self._expression_contains_conditionals(operand):
-                return True
+    def _contains_conditionals(self, statements: List[Dict]) -> bool:
+        """
+        Detect conditional expressions in block statements and nested blocks.
 
-        # Explicit conversions: check operand
-        elif expr_type == NodeType.EXPLICIT_CONVERSION_EXPRESSION.value:
-            operand = expression.get("expression")
-            if operand and self._expression_contains_conditionals(operand):
-                return True
+        Conditionals always trigger runtime classification per CONDITIONAL_SYSTEM.md:
+        1. All conditionals are runtime (specification requirement)
+        2. Condition evaluation happens at runtime
+        3. Branch selection cannot be determined at compile-time
+        """
+        return bool(self._summarize_statements(statements).flags & _CONDITIONALS)
 
-        # Block expressions: recursively analyze (nested expression blocks)
-        elif expr_type == NodeType.BLOCK.value:
-            statements = expression.get("statements", [])
-            return self._contains_conditionals(statements)
+    def _statement_contains_function_calls(self, statement: Dict) -> bool:
+        """Check if a single statement contains function calls."""
+        return bool(self._summarize_statement(statement).flags & _FUNCTION_CALLS)
 
-        return False
+    def _statement_contains_conditionals(self, statement: Dict) -> bool:
+        """Check if a single statement contains conditionals."""
+        return bool(self._summarize_statement(statement).flags & _CONDITIONALS)
+
+    def _expression_contains_function_calls(self, expression: Dict) -> bool:
+        """Check if an expression contains function calls."""
+        return bool(self._summarize_expression(expression).flags & _FUNCTION_CALLS)
+
+    def _expression_contains_conditionals(self, expression: Dict) -> bool:
+        """Check if an expression contains conditionals."""
+        return bool(self._summarize_expression(expression).flags & _CONDITIONALS)
 
     # =========================================================================
     # COMPTIME-ONLY OPERATION DETECTION
@@ -396,7 +584,8 @@ class BlockEvaluation:
         - Literal values (42, 3.14, "string", true/false)
         - Arithmetic on comptime types (42 + 100, 3.14 * 2.0)
         - Variable declarations with comptime initializers
-        - Variable references to other comptime-only variables
+        - Variable references to other comptime-only variables (variables not
+          yet in the symbol table are assumed comptime: forward references)
 
         Args:
             statements: List of statements to analyze
@@ -404,170 +593,18 @@ class BlockEvaluation:
         Returns:
             True if all operations are comptime-only, False otherwise
         """
-        for statement in statements:
-            if not self.statement_has_comptime_only_operations(statement):
-                return False
-        return True
+        summary = self._summarize_statements(statements)
+        return not self._resolve(summary) & _NOT_COMPTIME_ONLY
 
     def statement_has_comptime_only_operations(self, statement: Dict) -> bool:
-        """
-        Check if a single statement contains only comptime operations.
-
-        Args:
-            statement: Statement AST node to analyze
-
-        Returns:
-            True if statement uses only comptime operations, False otherwise
-        """
-        stmt_type = statement.get("type")
-
-        # Variable declarations: check initializer
-        if stmt_type in [
-            NodeType.VAL_DECLARATION.value,
-            NodeType.MUT_DECLARATION.value,
-        ]:
-            value = statement.get("value")
-            if value and value != "undef":
-                return self.expression_has_comptime_only_operations(value)
-            return True  # undef is considered comptime
-
-        # Assign statements: check the assigned expression
-        elif stmt_type == NodeType.ASSIGN_STATEMENT.value:
-            value = statement.get("value")
-            if value:
-                return self.expression_has_comptime_only_operations(value)
-            return False
-
-        # Assignment statements: check the assigned expression
-        elif stmt_type == NodeType.ASSIGNMENT_STATEMENT.value:
-            value = statement.get("value")
-            if value:
-                return self.expression_has_comptime_only_operations(value)
-            return False
-
-        # Return statements: check the returned expression
-        elif stmt_type == NodeType.RETURN_STATEMENT.value:
-            value = statement.get("value")
-            if value:
-                return self.expression_has_comptime_only_operations(value)
-            return True  # bare return is comptime
-
-        # Other statement types are handled by runtime operation detection
-        # For safety, assume they're runtime if not explicitly comptime
-        return False
+        """Check if a single statement contains only comptime operations."""
+        summary = self._summarize_statement(statement)
+        return not self._resolve(summary) & _NOT_COMPTIME_ONLY
 
     def expression_has_comptime_only_operations(self, expression: Dict) -> bool:
-        """
-        Check if an expression contains only comptime operations.
-
-        Args:
-            expression: Expression AST node to analyze
-
-        Returns:
-            True if expression is comptime-only, False otherwise
-        """
-        expr_type = expression.get("type")
-
-        # Comptime literals
-        if expr_type in [NodeType.COMPTIME_INT.value, NodeType.COMPTIME_FLOAT.value]:
-            return True
-
-        # Other literals (string, bool) are concrete but considered comptime for this analysis
-        if expr_type == NodeType.LITERAL.value:
-            return True
-
-        # Variable references: check if variable has comptime type
-        elif expr_type == NodeType.IDENTIFIER.value:
-            var_name = expression.get("name")
-            if var_name:
-                symbol_info = self.symbol_table.lookup_symbol(var_name)
-                if symbol_info:
-                    # If variable has comptime type (including ComptimeArrayType instances), it's comptime-only
-                    var_type = symbol_info.type
-                    # Check for ComptimeArrayType instances
-                    from ..types import ComptimeArrayType
-                    if isinstance(var_type, ComptimeArrayType):
-                        return True  # ComptimeArrayType is comptime-only
-                    return var_type in [
-                        HexenType.COMPTIME_INT,
-                        HexenType.COMPTIME_FLOAT,
-                    ]
-                else:
-                    # FORWARD REFERENCE FIX: If symbol not found, assume it's comptime
-                    # This handles cases where variables are referenced within the same block
-                    # before they're declared in the symbol table during classification
-                    # Better to be conservative and allow these through classification,
-                    # then catch real errors during actual analysis
-                    return True
-            return False
-
-        # Binary operations: both operands must be comptime-only
-        elif expr_type == NodeType.BINARY_OPERATION.value:
-            left = expression.get("left")
-            right = expression.get("right")
-            if left and right:
-                return self.expression_has_comptime_only_operations(
-                    left
-                ) and self.expression_has_comptime_only_operations(right)
-            return False
-
-        # Unary operations: operand must be comptime-only
-        elif expr_type == NodeType.UNARY_OPERATION.value:
-            operand = expression.get("operand")
-            if operand:
-                return self.expression_has_comptime_only_operations(operand)
-            return False
-
-        # Array literals: elements must all be comptime-only
-        elif expr_type == NodeType.ARRAY_LITERAL.value:
-            elements = expression.get("elements", [])
-            # Empty arrays are considered comptime (will require explicit context anyway)
-            if not elements:
-                return True
-            # All elements must be comptime-only
-            return all(
-                self.expression_has_comptime_only_operations(elem) for elem in elements
-            )
-
-        # Array access: both array and index must be comptime-only
-        elif expr_type == NodeType.ARRAY_ACCESS.value:
-            array_expr = expression.get("array")
-            index_expr = expression.get("index")
-            if array_expr and index_expr:
-                return self.expression_has_comptime_only_operations(
-                    array_expr
-                ) and self.expression_has_comptime_only_operations(index_expr)
-            return False
-
-        # Array copy: array expression must be comptime-only
-        elif expr_type == NodeType.ARRAY_COPY.value:
-            array_expr = expression.get("array")
-            if array_expr:
-                return self.expression_has_comptime_only_operations(array_expr)
-            return False
-
-        # Property access: object expression must be comptime-only
-        elif expr_type == NodeType.PROPERTY_ACCESS.value:
-            object_expr = expression.get("object")
-            if object_expr:
-                return self.expression_has_comptime_only_operations(object_expr)
-            return False
-
-        # Explicit conversions: operand must be comptime-only (though result becomes concrete)
-        elif expr_type == NodeType.EXPLICIT_CONVERSION_EXPRESSION.value:
-            operand = expression.get("expression")
-            if operand:
-                return self.expression_has_comptime_only_operations(operand)
-            return False
-
-        # Block expressions: recursively analyze (this enables nested expression blocks)
-        elif expr_type == NodeType.BLOCK.value:
-            statements = expression.get("statements", [])
-            return self.has_comptime_only_operations(statements)
-
-        # Function calls and conditionals are handled by runtime operation detection
-        # For safety, assume they're runtime if not explicitly comptime
-        return False
+        """Check if an expression contains only comptime operations."""
+        summary = self._summarize_expression(expression)
+        return not self._resolve(summary) & _NOT_COMPTIME_ONLY
 
     # =========================================================================
     # RUNTIME VARIABLE DETECTION
@@ -586,158 +623,18 @@ class BlockEvaluation:
         Returns:
             True if block uses concrete variables, False if only comptime variables
         """
-        for statement in statements:
-            if self.statement_has_runtime_variables(statement):
-                return True
-        return False
+        summary = self._summarize_statements(statements)
+        return bool(self._resolve(summary) & _RUNTIME_VARIABLES)
 
     def statement_has_runtime_variables(self, statement: Dict) -> bool:
-        """
-        Check if a statement uses concrete (runtime) variables.
-
-        Args:
-            statement: Statement AST node to analyze
-
-        Returns:
-            True if statement uses concrete variables, False otherwise
-        """
-        stmt_type = statement.get("type")
-
-        # Variable declarations: check if explicitly typed with concrete type
-        if stmt_type in [
-            NodeType.VAL_DECLARATION.value,
-            NodeType.MUT_DECLARATION.value,
-        ]:
-            # If explicit type annotation is concrete, it's runtime
-            type_annotation = statement.get("type_annotation")
-            if type_annotation:
-                # Parse type annotation to check if it's concrete
-                from ..type_util import is_concrete_type
-
-                return is_concrete_type(type_annotation)
-
-            # Check initializer expression for concrete variable usage
-            value = statement.get("value")
-            if value and value != "undef":
-                return self.expression_has_runtime_variables(value)
-            return False
-
-        # Assign and assignment statements: check expressions
-        elif stmt_type in [
-            NodeType.ASSIGN_STATEMENT.value,
-            NodeType.ASSIGNMENT_STATEMENT.value,
-        ]:
-            value = statement.get("value")
-            if value:
-                return self.expression_has_runtime_variables(value)
-            return False
-
-        # Return statements: check expression
-        elif stmt_type == NodeType.RETURN_STATEMENT.value:
-            value = statement.get("value")
-            if value:
-                return self.expression_has_runtime_variables(value)
-            return False
-
-        return False
+        """Check if a statement uses concrete (runtime) variables."""
+        summary = self._summarize_statement(statement)
+        return bool(self._resolve(summary) & _RUNTIME_VARIABLES)
 
     def expression_has_runtime_variables(self, expression: Dict) -> bool:
-        """
-        Check if an expression uses concrete (runtime) variables.
-
-        Args:
-            expression: Expression AST node to analyze
-
-        Returns:
-            True if expression uses concrete variables, False otherwise
-        """
-        expr_type = expression.get("type")
-
-        # Literals are not runtime variables
-        if expr_type in [
-            NodeType.COMPTIME_INT.value,
-            NodeType.COMPTIME_FLOAT.value,
-            NodeType.LITERAL.value,
-        ]:
-            return False
-
-        # Variable references: check if variable has concrete type
-        elif expr_type == NodeType.IDENTIFIER.value:
-            var_name = expression.get("name")
-            if var_name:
-                symbol_info = self.symbol_table.lookup_symbol(var_name)
-                if symbol_info:
-                    var_type = symbol_info.type
-                    # Comptime types (including ComptimeArrayType instances) are not runtime variables
-                    from ..types import ComptimeArrayType
-                    if isinstance(var_type, ComptimeArrayType):
-                        return False  # ComptimeArrayType is not a runtime variable
-                    comptime_types = {
-                        HexenType.COMPTIME_INT,
-                        HexenType.COMPTIME_FLOAT,
-                    }
-                    return var_type not in comptime_types
-            return False
-
-        # Binary operations: check both operands
-        elif expr_type == NodeType.BINARY_OPERATION.value:
-            left = expression.get("left")
-            right = expression.get("right")
-            if left and right:
-                return self.expression_has_runtime_variables(
-                    left
-                ) or self.expression_has_runtime_variables(right)
-            return False
-
-        # Unary operations: check operand
-        elif expr_type == NodeType.UNARY_OPERATION.value:
-            operand = expression.get("operand")
-            if operand:
-                return self.expression_has_runtime_variables(operand)
-            return False
-
-        # Explicit conversions: check operand
-        elif expr_type == NodeType.EXPLICIT_CONVERSION_EXPRESSION.value:
-            operand = expression.get("expression")
-            if operand:
-                return self.expression_has_runtime_variables(operand)
-            return False
-
-        # Block expressions: recursively analyze
-        elif expr_type == NodeType.BLOCK.value:
-            statements = expression.get("statements", [])
-            return self.has_runtime_variables(statements)
-
-        # Array literals: check all elements for runtime variables
-        elif expr_type == NodeType.ARRAY_LITERAL.value:
-            elements = expression.get("elements", [])
-            return any(self.expression_has_runtime_variables(elem) for elem in elements)
-
-        # Array access: check both array and index for runtime variables
-        elif expr_type == NodeType.ARRAY_ACCESS.value:
-            array_expr = expression.get("array")
-            index_expr = expression.get("index")
-            if array_expr and index_expr:
-                return self.expression_has_runtime_variables(
-                    array_expr
-                ) or self.expression_has_runtime_variables(index_expr)
-            return False
-
-        # Array copy: check array expression for runtime variables
-        elif expr_type == NodeType.ARRAY_COPY.value:
-            array_expr = expression.get("array")
-            if array_expr:
-                return self.expression_has_runtime_variables(array_expr)
-            return False
-
-        # Property access: check object expression for runtime variables
-        elif expr_type == NodeType.PROPERTY_ACCESS.value:
-            object_expr = expression.get("object")
-            if object_expr:
-                return self.expression_has_runtime_variables(object_expr)
-            return False
-
-        return False
+        """Check if an expression uses concrete (runtime) variables."""
+        summary = self._summarize_expression(expression)
+        return bool(self._resolve(summary) & _RUNTIME_VARIABLES)
 
     # =========================================================================
     # RUNTIME OPERATION CONTEXT VALIDATION
@@ -763,23 +660,25 @@ class BlockEvaluation:
         if evaluability != BlockEvaluability.RUNTIME:
             return None  # Compile-time blocks don't need validation
 
+        flags = self.summarize_block(statements)
+
         # Generate enhanced error messages with actionable guidance
         reasons = []
 
         # Check for function calls with enhanced messaging
-        if self._contains_function_calls(statements):
+        if flags & BlockFlags.FUNCTION_CALLS:
             reasons.append(
                 "contains function calls (functions always return concrete types)"
             )
 
         # Check for conditionals with enhanced messaging
-        if self._contains_conditionals(statements):
+        if flags & BlockFlags.CONDITIONALS:
             reasons.append(
                 "contains conditional expressions (all conditionals are runtime per specification)"
             )
 
         # Check for concrete variable usage with enhanced messaging
-        if self.has_runtime_variables(statements):
+        if flags & BlockFlags.RUNTIME_VARIABLES:
             reasons.append("uses concrete type variables")
 
         if reasons:
@@ -805,11 +704,12 @@ class BlockEvaluation:
         Returns:
             Enhanced human-readable string explaining the runtime classification reason
         """
+        flags = self.summarize_block(statements)
         reasons = []
         explanations = []
 
         # Check for function calls with enhanced explanations
-        if self._contains_function_calls(statements):
+        if flags & BlockFlags.FUNCTION_CALLS:
             reasons.append(
                 "Function calls detected (functions always return concrete types)"
             )
@@ -818,7 +718,7 @@ class BlockEvaluation:
             explanations.append(BlockAnalysisError.function_call_runtime_explanation())
 
         # Check for conditionals with enhanced explanations
-        if self._contains_conditionals(statements):
+        if flags & BlockFlags.CONDITIONALS:
             reasons.append(
                 "Conditional expressions detected (all conditionals are runtime per CONDITIONAL_SYSTEM.md)"
             )
@@ -827,7 +727,7 @@ class BlockEvaluation:
             explanations.append(BlockAnalysisError.conditional_runtime_explanation())
 
         # Check for concrete variable usage with enhanced explanations
-        if self.has_runtime_variables(statements):
+        if flags & BlockFlags.RUNTIME_VARIABLES:
             reasons.append(
                 "Concrete type variables detected (mixing comptime and concrete types)"
             )
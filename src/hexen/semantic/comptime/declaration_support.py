@@ -195,7 +195,12 @@ class DeclarationSupport:
         if inferred_type == HexenType.UNKNOWN:
             # Check if this is likely an operation that already reported a specific error
             node_type = value_node.get("type")
-            if node_type in ["binary_operation", "array_literal", "array_access"]:
+            if node_type in [
+                "binary_operation",
+                "nary_operation",
+                "array_literal",
+                "array_access",
+            ]:
                 # These analyzers already provided specific errors about the issue
                 # Don't add a generic "Cannot infer type" error - just return
                 return True
@@ -355,27 +355,27 @@ class TypeOperations:
         - Mixed comptime int/float → ComptimeArrayType(COMPTIME_FLOAT, [num_elements])
         - Any concrete types → None (requires explicit context)
         """
-        from ..types import ComptimeArrayType
+        from ..types import intern_comptime_array_type
 
         if not element_types:
             return None
 
         # Check for all comptime_int
         if all(t == HexenType.COMPTIME_INT for t in element_types):
-            return ComptimeArrayType(
+            return intern_comptime_array_type(
                 HexenType.COMPTIME_INT, [num_elements or len(element_types)]
             )
 
         # Check for all comptime_float
         if all(t == HexenType.COMPTIME_FLOAT for t in element_types):
-            return ComptimeArrayType(
+            return intern_comptime_array_type(
                 HexenType.COMPTIME_FLOAT, [num_elements or len(element_types)]
             )
 
         # Mixed comptime types → comptime_float (promotion)
         comptime_types = {HexenType.COMPTIME_INT, HexenType.COMPTIME_FLOAT}
         if all(t in comptime_types for t in element_types):
-            return ComptimeArrayType(
+            return intern_comptime_array_type(
                 HexenType.COMPTIME_FLOAT, [num_elements or len(element_types)]
             )
 
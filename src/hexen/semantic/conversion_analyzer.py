@@ -11,10 +11,18 @@ This analyzer handles:
 - Cost transparency for all concrete type conversions
 """
 
+from collections.abc import Mapping
 from typing import Dict, Optional, Callable, Union
 
-from .type_util import parse_type
-from .types import HexenType, ArrayType, RangeType, ComptimeRangeType
+from .type_util import build_scalar_table, parse_type
+from .types import (
+    HexenType,
+    ArrayType,
+    RangeType,
+    ComptimeRangeType,
+    intern_array_type,
+    intern_range_type,
+)
 
 
 class ConversionAnalyzer:
@@ -87,7 +95,16 @@ class ConversionAnalyzer:
         ):
             # Array-to-array conversion
             if self._is_valid_array_conversion(source_type, target_type, node):
-                return target_type
+                # Inferred target dimensions [_] take the source sizes
+                return intern_array_type(
+                    target_type.element_type,
+                    [
+                        src_dim if tgt_dim == "_" else tgt_dim
+                        for src_dim, tgt_dim in zip(
+                            source_type.dimensions, target_type.dimensions
+                        )
+                    ],
+                )
             else:
                 # Error already reported in _is_valid_array_conversion
                 return HexenType.UNKNOWN
@@ -98,7 +115,7 @@ class ConversionAnalyzer:
             if self._is_valid_range_conversion(source_type, target_type, node):
                 # Preserve source metadata (has_step, has_start, has_end, inclusive)
                 # Only change the element type to the target
-                return RangeType(
+                return intern_range_type(
                     element_type=target_type.element_type,
                     has_start=source_type.has_start,
                     has_end=source_type.has_end,
@@ -137,48 +154,10 @@ class ConversionAnalyzer:
         - string → Any numeric (use parsing functions)
         - f32, f64, comptime_float → usize (float indices forbidden)
         """
-        # Identity conversion always valid
-        if source == target:
-            return True
-
-        # Comptime type conversions (following TYPE_SYSTEM.md table)
-        if source == HexenType.COMPTIME_INT:
-            # comptime_int can convert to any numeric type (including usize)
-            return target in [
-                HexenType.I32,
-                HexenType.I64,
-                HexenType.F32,
-                HexenType.F64,
-                HexenType.USIZE,  # NEW: comptime_int → usize (ergonomic!)
-            ]
-        elif source == HexenType.COMPTIME_FLOAT:
-            # comptime_float can convert to numeric types EXCEPT usize
-            return target in [
-                HexenType.I32,  # Explicit conversion (data loss)
-                HexenType.I64,  # Explicit conversion (data loss)
-                HexenType.F32,
-                HexenType.F64,
-                # NOTE: usize NOT included - float → usize forbidden
-            ]
-
-        # Concrete type conversions (all explicit per TYPE_SYSTEM.md)
-        numeric_types = {
-            HexenType.I32,
-            HexenType.I64,
-            HexenType.F32,
-            HexenType.F64,
-            HexenType.USIZE,  # NEW: usize in numeric types
-        }
-
-        if source in numeric_types and target in numeric_types:
-            # VALIDATION: Float → usize conversion forbidden
-            if source in {HexenType.F32, HexenType.F64} and target == HexenType.USIZE:
-                return False  # Forbidden: float → usize
-            # All other numeric → numeric conversions valid with explicit syntax
-            return True
-
-        # Forbidden conversions per TYPE_SYSTEM.md
-        return False
+        if type(source) is HexenType and type(target) is HexenType:
+            return _CONVERSION_TABLE[source.ordinal][target.ordinal]
+        # Array/range types only convert to themselves on this path
+        return source == target
 
     def _report_conversion_error(
         self, source: HexenType, target: HexenType, node: Dict
@@ -259,8 +238,8 @@ class ConversionAnalyzer:
                 self._error(f"Invalid target type: {target_type_spec}", node)
             return target_type
 
-        # Handle dict types (array or range)
-        if isinstance(target_type_spec, dict):
+        # Handle node types (array or range), dict-based or typed
+        if isinstance(target_type_spec, Mapping):
             # Check if it's a range type
             if target_type_spec.get("type") == "range_type" and self._parse_range_type:
                 return self._parse_range_type(target_type_spec)
@@ -357,8 +336,7 @@ class ConversionAnalyzer:
             zip(source.dimensions, target.dimensions)
         ):
             if tgt_dim == "_":  # Inferred dimension [_]
-                # Accept any source dimension size and infer target size
-                target.dimensions[i] = src_dim
+                # Accept any source dimension size (resolved by the caller)
                 continue
             if src_dim != tgt_dim:
                 self._error(
@@ -437,3 +415,53 @@ class ConversionAnalyzer:
 
         # All other conversions follow standard type conversion rules
         return self._is_valid_conversion(from_elem, to_elem)
+
+
+def _explicit_conversion_rule(source: HexenType, target: HexenType) -> bool:
+    """Explicit conversion rule between HexenTypes (tabulated below)"""
+    # Identity conversion always valid
+    if source == target:
+        return True
+
+    # Comptime type conversions (following TYPE_SYSTEM.md table)
+    if source == HexenType.COMPTIME_INT:
+        # comptime_int can convert to any numeric type (including usize)
+        return target in [
+            HexenType.I32,
+            HexenType.I64,
+            HexenType.F32,
+            HexenType.F64,
+            HexenType.USIZE,  # NEW: comptime_int → usize (ergonomic!)
+        ]
+    elif source == HexenType.COMPTIME_FLOAT:
+        # comptime_float can convert to numeric types EXCEPT usize
+        return target in [
+            HexenType.I32,  # Explicit conversion (data loss)
+            HexenType.I64,  # Explicit conversion (data loss)
+            HexenType.F32,
+            HexenType.F64,
+            # NOTE: usize NOT included - float → usize forbidden
+        ]
+
+    # Concrete type conversions (all explicit per TYPE_SYSTEM.md)
+    numeric_types = {
+        HexenType.I32,
+        HexenType.I64,
+        HexenType.F32,
+        HexenType.F64,
+        HexenType.USIZE,  # NEW: usize in numeric types
+    }
+
+    if source in numeric_types and target in numeric_types:
+        # VALIDATION: Float → usize conversion forbidden
+        if source in {HexenType.F32, HexenType.F64} and target == HexenType.USIZE:
+            return False  # Forbidden: float → usize
+        # All other numeric → numeric conversions valid with explicit syntax
+        return True
+
+    # Forbidden conversions per TYPE_SYSTEM.md
+    return False
+
+
+# Precomputed at import: conversion checks run on every `value:type`
+_CONVERSION_TABLE = build_scalar_table(_explicit_conversion_rule)
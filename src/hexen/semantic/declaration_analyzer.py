@@ -9,6 +9,7 @@ Handles analysis of declarations including:
 - Mutability enforcement
 """
 
+from collections.abc import Mapping
 from typing import Dict, Optional, Callable, Tuple
 
 from .symbol_table import (
@@ -20,7 +21,13 @@ from .symbol_table import (
 from .type_util import (
     parse_type,
 )
-from .types import HexenType, Mutability, ArrayType
+from .types import (
+    HexenType,
+    Mutability,
+    ArrayType,
+    intern_array_type,
+    intern_range_type,
+)
 from .arrays.multidim_analyzer import MultidimensionalArrayAnalyzer
 from ..ast_nodes import NodeType
 
@@ -464,7 +471,7 @@ class DeclarationAnalyzer:
             return parse_type(type_annotation)
 
         # Handle complex AST node types (like array types, range types)
-        if isinstance(type_annotation, dict):
+        if isinstance(type_annotation, Mapping):
             node_type = type_annotation.get("type")
 
             if node_type == "array_type":
@@ -556,7 +563,7 @@ class DeclarationAnalyzer:
 
         # Create and return concrete array type
         try:
-            return ArrayType(element_type, dimensions)
+            return intern_array_type(element_type, dimensions)
         except ValueError as e:
             self._error(f"Invalid array type: {e}", array_type_node)
             return HexenType.UNKNOWN
@@ -574,8 +581,6 @@ class DeclarationAnalyzer:
         Returns:
             RangeType instance representing the explicit range type
         """
-        from .types import RangeType
-
         # Extract element type
         element_type_str = range_type_node.get("element_type", "unknown")
         element_type = parse_type(element_type_str)
@@ -599,7 +604,7 @@ class DeclarationAnalyzer:
         # Create range type annotation
         # Type annotation doesn't specify bounds/step, so we use generic values
         # Actual bounds will be determined by the range expression
-        return RangeType(
+        return intern_range_type(
             element_type=element_type,
             has_start=True,  # Annotation doesn't specify, assume generic bounded
             has_end=True,
@@ -7,7 +7,10 @@ Provides structured error handling with optional AST node context.
 Enhanced with Session 4 context-specific error messages for the unified block system.
 """
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from ..source_map import SourceMap
 
 
 class SemanticError(Exception):
@@ -19,21 +22,36 @@ class SemanticError(Exception):
     - Provide context when available for better error messages
     - Separate from syntax errors (which are caught by parser)
 
+    Positions are not stored on the error: format() resolves the node's
+    line/column from the parser's SourceMap only when the error is rendered.
+
     Future enhancements:
-    - Line/column information
     - Error severity levels
     - Suggested fixes
     """
 
     def __init__(self, message: str, node: Optional[Dict] = None):
         self.message = message
-        self.node = node  # AST node where error occurred (for future line/col info)
+        self.node = node  # AST node where error occurred (located via a SourceMap)
         super().__init__(message)
 
     def __str__(self) -> str:
         """Return the error message for string operations."""
         return self.message
 
+    def format(self, source_map: Optional["SourceMap"] = None) -> str:
+        """
+        Render the error as "line:column: message".
+
+        Falls back to the bare message when there is no source map or the
+        node's position is unknown (e.g. errors raised without a node).
+        """
+        location = source_map.location(self.node) if source_map else None
+        if location is None:
+            return self.message
+        line, column = location
+        return f"{line}:{column}: {self.message}"
+
     def lower(self) -> str:
         """Support .lower() calls on error objects for test compatibility."""
         return self.message.lower()
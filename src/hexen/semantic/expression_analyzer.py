@@ -21,6 +21,16 @@ from .type_util import (
 from .types import HexenType, ComptimeArrayType, ArrayType, RangeType, ComptimeRangeType
 from ..ast_nodes import NodeType
 
+# Childless expressions are cheaper to re-analyze than to memoize
+_LEAF_EXPRESSION_TYPES = frozenset(
+    {
+        NodeType.LITERAL.value,
+        NodeType.COMPTIME_INT.value,
+        NodeType.COMPTIME_FLOAT.value,
+        NodeType.IDENTIFIER.value,
+    }
+)
+
 
 class ExpressionAnalyzer:
     """
@@ -51,8 +61,20 @@ class ExpressionAnalyzer:
         ],
         conversion_analyzer,
         comptime_analyzer=None,
+        binary_ops_analyzer=None,
+        unary_ops_analyzer=None,
+        expression_memo=None,
     ):
-        """Initialize with callbacks to main analyzer functionality."""
+        """
+        Initialize with callbacks to main analyzer functionality.
+
+        When binary_ops_analyzer and unary_ops_analyzer are given, nested
+        operations are analyzed iteratively (see _analyze_operation_chain)
+        instead of through the recursive operation callbacks.
+
+        When an ExpressionMemo is given, non-leaf expressions are analyzed
+        once per target type; repeats replay the cached type and errors.
+        """
         self._error = error_callback
         self._analyze_block = analyze_block_callback
         self._analyze_binary_operation = analyze_binary_operation_callback
@@ -61,6 +83,9 @@ class ExpressionAnalyzer:
         self._analyze_function_call = analyze_function_call_callback
         self._conversion_analyzer = conversion_analyzer
         self.comptime_analyzer = comptime_analyzer
+        self._binary_ops = binary_ops_analyzer
+        self._unary_ops = unary_ops_analyzer
+        self._memo = expression_memo
 
         # Initialize range analyzer (needed by array analyzer)
         self.range_analyzer = RangeAnalyzer(
@@ -78,6 +103,54 @@ class ExpressionAnalyzer:
         # Set the expression analysis callback after initialization
         self.array_literal_analyzer._analyze_expression = self.analyze_expression
 
+        # Dispatch table: node type -> handler(node, target_type), built once
+        self._handlers = self._build_dispatch_table()
+
+    def _build_dispatch_table(self) -> Dict[str, Callable]:
+        """
+        Map each expression node type to its handler.
+
+        Handlers are bound methods of the analyzers that do the work, so a
+        dispatch is one dict lookup and one call with no wrapper hops.
+        """
+        array_analyzer = self.array_literal_analyzer
+        if self._binary_ops is not None and self._unary_ops is not None:
+            analyze_binary = analyze_unary = self._analyze_operation_chain
+        else:
+            analyze_binary = self._analyze_binary_operation
+            analyze_unary = self._analyze_unary_operation
+        return {
+            # Explicit conversion - implements TYPE_SYSTEM.md rules
+            NodeType.EXPLICIT_CONVERSION_EXPRESSION.value: (
+                self._conversion_analyzer.analyze_conversion
+            ),
+            # Non-numeric literals (string, bool) - delegates to type_util
+            NodeType.LITERAL.value: lambda node, target_type: infer_type_from_value(
+                node
+            ),
+            # Comptime literals - adaptive type resolution
+            NodeType.COMPTIME_INT.value: lambda node, target_type: (
+                HexenType.COMPTIME_INT
+            ),
+            NodeType.COMPTIME_FLOAT.value: lambda node, target_type: (
+                HexenType.COMPTIME_FLOAT
+            ),
+            NodeType.IDENTIFIER.value: self._analyze_identifier,
+            NodeType.BLOCK.value: lambda node, target_type: self._analyze_block(
+                node, node, "expression"
+            ),
+            NodeType.BINARY_OPERATION.value: analyze_binary,
+            NodeType.NARY_OPERATION.value: analyze_binary,
+            NodeType.UNARY_OPERATION.value: analyze_unary,
+            NodeType.FUNCTION_CALL.value: self._analyze_function_call,
+            NodeType.CONDITIONAL_STATEMENT.value: self._analyze_conditional_expression,
+            NodeType.ARRAY_LITERAL.value: array_analyzer.analyze_array_literal,
+            NodeType.ARRAY_ACCESS.value: array_analyzer.analyze_array_access,
+            NodeType.ARRAY_COPY.value: array_analyzer.analyze_array_copy,
+            NodeType.PROPERTY_ACCESS.value: array_analyzer.analyze_property_access,
+            NodeType.RANGE_EXPR.value: self.range_analyzer.analyze_range_expr,
+        }
+
     def analyze_expression(
         self,
         node: Dict,
@@ -96,8 +169,112 @@ class ExpressionAnalyzer:
 
         Implements context-guided resolution strategy from TYPE_SYSTEM.md.
         """
-        expr_type = node.get("type")
-        return self._dispatch_expression_analysis(expr_type, node, target_type)
+        node_type = node.get("type")
+        handler = self._handlers.get(node_type)
+        if handler is None:
+            self._error(f"Unknown expression type: {node_type}", node)
+            return HexenType.UNKNOWN
+
+        memo = self._memo
+        if memo is None or node_type in _LEAF_EXPRESSION_TYPES:
+            return handler(node, target_type)
+        entry = memo.lookup(node, target_type)
+        if entry is not None:
+            return memo.replay(entry)
+        mark = memo.mark()
+        result = handler(node, target_type)
+        memo.store(node, target_type, result, mark)
+        return result
+
+    def _analyze_operation_chain(
+        self, node: Dict, target_type: Optional[HexenType] = None
+    ) -> HexenType:
+        """
+        Analyze nested binary/unary operations with an explicit work stack.
+
+        Long operator chains (a + b + c + ...) parse into trees as deep as the
+        chain is long, so recursing through the operation analyzers would hit
+        Python's recursion limit. Operation nodes (binary, n-ary and unary)
+        are instead expanded here in post-order: operands are analyzed left
+        to right with the same target_type, then the operation is resolved
+        from their types. Other operands go through analyze_expression as
+        usual.
+
+        Visit order and errors are the same as the recursive analysis. With
+        an expression memo, nested operations are looked up and stored like
+        any expression passed to analyze_expression.
+        """
+        binary_ops = self._binary_ops
+        unary_ops = self._unary_ops
+        memo = self._memo
+        binary_operations = {
+            NodeType.BINARY_OPERATION.value,
+            NodeType.NARY_OPERATION.value,
+        }
+        unary_operation = NodeType.UNARY_OPERATION.value
+
+        # Work items are nodes to visit or (node, arity, error mark) tuples
+        # marking an operation whose operand types are on top of the results
+        # stack. The root was already looked up by analyze_expression.
+        work = [node]
+        results = []
+        while work:
+            item = work.pop()
+            if type(item) is tuple:
+                operation, arity, mark = item
+                if arity == 1:
+                    results.append(
+                        unary_ops.resolve_unary_operation(
+                            operation, results.pop(), target_type
+                        )
+                    )
+                elif arity == 2:
+                    right_type = results.pop()
+                    left_type = results.pop()
+                    results.append(
+                        binary_ops.resolve_binary_operation(
+                            operation, left_type, right_type, target_type
+                        )
+                    )
+                else:
+                    operand_types = results[-arity:]
+                    del results[-arity:]
+                    results.append(
+                        binary_ops.resolve_operand_types(
+                            operation, operand_types, target_type
+                        )
+                    )
+                if memo is not None and operation is not node:
+                    memo.store(operation, target_type, results[-1], mark)
+                continue
+
+            node_type = item.get("type")
+            if node_type in binary_operations or node_type == unary_operation:
+                mark = -1
+                if memo is not None and item is not node:
+                    entry = memo.lookup(item, target_type)
+                    if entry is not None:
+                        results.append(memo.replay(entry))
+                        continue
+                    mark = memo.mark()
+                if node_type == unary_operation:
+                    operand = unary_ops.unary_operand(item)
+                    if operand is None:
+                        results.append(HexenType.UNKNOWN)
+                        continue
+                    work.append((item, 1, mark))
+                    work.append(operand)
+                    continue
+                operands = binary_ops.binary_operands(item)
+                if operands is None:
+                    results.append(HexenType.UNKNOWN)
+                    continue
+                work.append((item, len(operands), mark))
+                work.extend(reversed(operands))
+            else:
+                results.append(self.analyze_expression(item, target_type))
+
+        return results[0]
 
     def _dispatch_expression_analysis(
         self,
@@ -108,6 +285,8 @@ class ExpressionAnalyzer:
         """
         Dispatch expression analysis to appropriate handler.
 
+        analyze_expression() inlines this lookup; see _build_dispatch_table().
+
         Expression types handled:
         - EXPLICIT_CONVERSION_EXPRESSION: Explicit conversion
         - LITERAL: Non-numeric literals (string, bool)
@@ -115,7 +294,7 @@ class ExpressionAnalyzer:
         - COMPTIME_FLOAT: Comptime float literals with adaptive resolution
         - IDENTIFIER: Symbol lookup and validation
         - BLOCK: Expression blocks (delegate to block analyzer)
-        - BINARY_OPERATION: Delegate to binary ops analyzer
+        - BINARY_OPERATION / NARY_OPERATION: Delegate to binary ops analyzer
         - UNARY_OPERATION: Delegate to unary ops analyzer
         - FUNCTION_CALL: Delegate to function call analyzer
         - ARRAY_LITERAL: Delegate to array literal analyzer
@@ -124,57 +303,14 @@ class ExpressionAnalyzer:
         - PROPERTY_ACCESS: Delegate to property access analyzer (.length, etc)
         - RANGE_EXPR: Delegate to range analyzer
         """
-        if expr_type == NodeType.EXPLICIT_CONVERSION_EXPRESSION.value:
-            # Handle explicit conversion expressions - implements TYPE_SYSTEM.md rules
-            return self._conversion_analyzer.analyze_conversion(node, target_type)
-        elif expr_type == NodeType.LITERAL.value:
-            # Non-numeric literals (string, bool) - delegates to type_util
-            return infer_type_from_value(node)
-        elif expr_type == NodeType.COMPTIME_INT.value:
-            # Comptime integer literals - adaptive type resolution
-            return HexenType.COMPTIME_INT
-        elif expr_type == NodeType.COMPTIME_FLOAT.value:
-            # Comptime float literals - adaptive type resolution
-            return HexenType.COMPTIME_FLOAT
-        elif expr_type == NodeType.IDENTIFIER.value:
-            # Symbol lookup and validation
-            return self._analyze_identifier(node)
-        elif expr_type == NodeType.BLOCK.value:
-            # Expression blocks - delegate to block analyzer
-            return self._analyze_block(node, node, context="expression")
-        elif expr_type == NodeType.BINARY_OPERATION.value:
-            # Binary operations - delegate to binary ops analyzer
-            return self._analyze_binary_operation(node, target_type)
-        elif expr_type == NodeType.UNARY_OPERATION.value:
-            # Unary operations - delegate to unary ops analyzer
-            return self._analyze_unary_operation(node, target_type)
-        elif expr_type == NodeType.FUNCTION_CALL.value:
-            # Function calls - delegate to function call analyzer
-            return self._analyze_function_call(node, target_type)
-        elif expr_type == NodeType.CONDITIONAL_STATEMENT.value:
-            # Conditional expressions - analyze as expression context
-            return self._analyze_conditional_expression(node, target_type)
-        elif expr_type == NodeType.ARRAY_LITERAL.value:
-            # Array literals - delegate to array literal analyzer
-            return self.array_literal_analyzer.analyze_array_literal(node, target_type)
-        elif expr_type == NodeType.ARRAY_ACCESS.value:
-            # Array access expressions - delegate to array access analyzer
-            return self.array_literal_analyzer.analyze_array_access(node, target_type)
-        elif expr_type == NodeType.ARRAY_COPY.value:
-            # Array copy expressions - delegate to array copy analyzer
-            return self.array_literal_analyzer.analyze_array_copy(node, target_type)
-        elif expr_type == NodeType.PROPERTY_ACCESS.value:
-            # Property access expressions - delegate to property access analyzer
-            return self.array_literal_analyzer.analyze_property_access(node, target_type)
-        elif expr_type == NodeType.RANGE_EXPR.value:
-            # Range expressions - delegate to range analyzer
-            return self.range_analyzer.analyze_range_expr(node, target_type)
-        else:
+        handler = self._handlers.get(expr_type)
+        if handler is None:
             self._error(f"Unknown expression type: {expr_type}", node)
             return HexenType.UNKNOWN
+        return handler(node, target_type)
 
     def _analyze_identifier(
-        self, node: Dict
+        self, node: Dict, target_type: Optional[HexenType] = None
     ) -> Union[HexenType, ArrayType, ComptimeArrayType]:
         """
         Analyze an identifier reference (variable usage).
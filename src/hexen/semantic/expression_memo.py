@@ -0,0 +1,116 @@
+"""
+Per-Analysis Expression Memo for Hexen Language
+
+Several analysis paths revisit subtrees that were already type-checked:
+assignment checks re-analyze the operands of the value, comptime helpers
+re-inspect operands, and conditional branches are re-examined after their
+analysis. The memo caches, per (node identity, target type), the resolved
+type and the errors reported while resolving it, so a repeated analysis
+replays those errors instead of walking the subtree again.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .errors import SemanticError
+
+# Cache entry: (node, resolved type, errors reported while resolving it).
+# The node is kept so its id() cannot be reused while the entry exists.
+MemoEntry = Tuple[Any, Any, Tuple[SemanticError, ...]]
+
+
+@dataclass(frozen=True)
+class MemoStats:
+    """Snapshot of the memo counters for one analysis"""
+
+    hits: int
+    misses: int
+    entries: int
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the memo (0.0 without lookups)"""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class ExpressionMemo:
+    """
+    Cache of expression types keyed by (node identity, target type).
+
+    Resolution only depends on the node, the target type and the symbol
+    table, whose bindings are fixed for a node's position in the program,
+    so a second analysis of the same node in the same context yields the
+    same type and errors. Replaying the recorded errors keeps the reported
+    error list identical to analyzing the subtree again.
+
+    Usage (see ExpressionAnalyzer.analyze_expression):
+        entry = memo.lookup(node, target_type)
+        if entry is not None:
+            return memo.replay(entry)
+        mark = memo.mark()
+        result = ...  # analyze
+        memo.store(node, target_type, result, mark)
+    """
+
+    def __init__(self, errors: List[SemanticError]):
+        # The analyzer's error list (cleared in place between analyses)
+        self._errors = errors
+        self._entries: Dict[Tuple[int, Any], MemoEntry] = {}
+        self.hits = 0
+        self.misses = 0
+        # Entries of analyses merged from elsewhere (see merge)
+        self._merged_entries = 0
+
+    def reset(self) -> None:
+        """Forget all entries and counters (start of an analysis)"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self._merged_entries = 0
+
+    def discard_entries(self) -> None:
+        """Drop the cached entries (and AST references) but keep the counters"""
+        self._entries.clear()
+        self._merged_entries = 0
+
+    def lookup(self, node: Any, target_type: Any) -> Optional[MemoEntry]:
+        """Return the entry for node in this target context, or None"""
+        entry = self._entries.get((id(node), target_type))
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def replay(self, entry: MemoEntry) -> Any:
+        """Re-report the entry's errors and return its type"""
+        if entry[2]:
+            self._errors.extend(entry[2])
+        return entry[1]
+
+    def mark(self) -> int:
+        """Position in the error list where a new analysis starts"""
+        return len(self._errors)
+
+    def store(self, node: Any, target_type: Any, result: Any, mark: int) -> None:
+        """Record result and the errors reported since mark"""
+        self._entries[(id(node), target_type)] = (
+            node,
+            result,
+            tuple(self._errors[mark:]),
+        )
+
+    def merge(self, stats: MemoStats) -> None:
+        """Add the counters of an analysis run elsewhere (a worker process)"""
+        self.hits += stats.hits
+        self.misses += stats.misses
+        self._merged_entries += stats.entries
+
+    def stats(self) -> MemoStats:
+        return MemoStats(
+            self.hits, self.misses, len(self._entries) + self._merged_entries
+        )
@@ -437,6 +437,10 @@ class FunctionAnalyzer:
         Returns:
             True if dimensions compatible, False if mismatch (error already reported)
         """
+        # Fast path: compatible shapes (the common case) need no mismatch report
+        if comptime_type.can_materialize_to(target_type):
+            return True
+
         # Check dimension count
         if len(comptime_type.dimensions) != len(target_type.dimensions):
             # Report dimension mismatch error
@@ -0,0 +1,157 @@
+"""
+Incremental Semantic Re-checking for Hexen Language
+
+An IncrementalSession remembers, for every function of the last analyzed
+program, the hash of its AST, the signature it declared, its errors and the
+function signatures it depended on. Passing the session to a new
+SemanticAnalyzer makes analyze() re-check only the functions whose AST
+changed or whose dependencies changed, and replay the cached results for
+the rest:
+
+    session = IncrementalSession()
+    errors = SemanticAnalyzer(incremental=session).analyze(ast)
+    ...  # edit, re-parse
+    errors = SemanticAnalyzer(incremental=session).analyze(new_ast)
+
+A function's result only depends on its own AST and on the signatures
+visible under the names it looks up: the functions declared above it (its
+own name included, which decides redeclaration errors). Function bodies
+cannot see top-level declarations, which are analyzed after them, so top-level
+statements are simply re-analyzed on every check.
+"""
+
+import hashlib
+import marshal
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from .errors import SemanticError
+from .parallel_analysis import NodePath, node_at, node_paths
+from .symbol_table import FunctionSignature
+
+if TYPE_CHECKING:
+    from .analyzer import SemanticAnalyzer
+
+
+@dataclass(slots=True)
+class FunctionResult:
+    """Cached analysis of one function"""
+
+    # Signature visible under each name the function looked up (its own name
+    # included) when it was analyzed; None for undefined names
+    dependencies: Dict[str, Optional[FunctionSignature]]
+    # Signature the function declared (None if it declared nothing)
+    signature: Optional[FunctionSignature]
+    # (message, path of the error node in the function or None), in order
+    errors: List[Tuple[str, Optional[NodePath]]]
+
+
+def function_hash(function: Any) -> bytes:
+    """Digest of a function's AST (dict ASTs and typed ASTs)"""
+    if type(function) is dict:
+        # Version 2 has no back-references, whose flags depend on refcounts
+        data = marshal.dumps(function, 2)
+    else:
+        data = repr(function).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class IncrementalSession:
+    """
+    Function results kept between analyses of successive program versions.
+
+    Only the results of the latest analysis are kept, so the session does
+    not grow with edits. reused and rechecked count the functions replayed
+    from the session and analyzed again during the latest analysis.
+    """
+
+    def __init__(self):
+        self._results: Dict[bytes, List[FunctionResult]] = {}
+        self.reused = 0
+        self.rechecked = 0
+
+    def __len__(self) -> int:
+        return sum(len(results) for results in self._results.values())
+
+    def analyze_functions(
+        self, analyzer: "SemanticAnalyzer", functions: Sequence[Dict]
+    ) -> None:
+        """
+        Analyze functions in source order, replaying unchanged results.
+
+        Called by SemanticAnalyzer._analyze_program in place of analyzing
+        every function declaration; leaves the analyzer's symbol table and
+        error list as a full analysis would.
+        """
+        declared = analyzer.symbol_table.functions
+        function_analyzer = analyzer.function_analyzer
+        lookup_function = function_analyzer._lookup_function
+        referenced = set()
+
+        def recording_lookup(name):
+            referenced.add(name)
+            return lookup_function(name)
+
+        results: Dict[bytes, List[FunctionResult]] = {}
+        self.reused = 0
+        self.rechecked = 0
+        function_analyzer._lookup_function = recording_lookup
+        try:
+            for function in functions:
+                key = function_hash(function)
+                result = self._find_result(key, declared)
+                if result is not None:
+                    self._replay(analyzer, function, result)
+                    self.reused += 1
+                else:
+                    referenced.clear()
+                    result = self._analyze(analyzer, function, referenced)
+                    self.rechecked += 1
+                results.setdefault(key, []).append(result)
+        finally:
+            function_analyzer._lookup_function = lookup_function
+        self._results = results
+
+    def _find_result(
+        self, key: bytes, declared: Dict[str, FunctionSignature]
+    ) -> Optional[FunctionResult]:
+        """A cached result for this AST whose dependencies are unchanged"""
+        for result in self._results.get(key, ()):
+            if all(
+                declared.get(name) == signature
+                for name, signature in result.dependencies.items()
+            ):
+                return result
+        return None
+
+    def _replay(
+        self, analyzer: "SemanticAnalyzer", function: Dict, result: FunctionResult
+    ) -> None:
+        if result.signature is not None:
+            analyzer.symbol_table.declare_function(result.signature)
+        analyzer.errors.extend(
+            SemanticError(message, node_at(function, path))
+            for message, path in result.errors
+        )
+
+    def _analyze(
+        self, analyzer: "SemanticAnalyzer", function: Dict, referenced: set
+    ) -> FunctionResult:
+        declared = analyzer.symbol_table.functions
+        name = function.get("name")
+        dependencies = {name: declared.get(name)}
+        mark = len(analyzer.errors)
+
+        analyzer._analyze_declaration(function)
+
+        # Only the function's own name can have been declared meanwhile
+        signature = declared.get(name)
+        if signature is dependencies[name]:
+            signature = None
+        for referenced_name in referenced:
+            dependencies.setdefault(referenced_name, declared.get(referenced_name))
+
+        new_errors = analyzer.errors[mark:]
+        paths = node_paths(function, [error.node for error in new_errors])
+        errors = [(error.message, paths.get(id(error.node))) for error in new_errors]
+        return FunctionResult(dependencies, signature, errors)
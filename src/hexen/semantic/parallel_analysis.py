@@ -0,0 +1,185 @@
+"""
+Parallel Function Analysis for Hexen Language
+
+Function bodies only depend on the function signatures declared before them
+(a function sees the functions above it, as in sequential analysis) and on
+the global scope, which is still empty while functions are analyzed. The
+program can therefore be checked in two phases:
+
+1. collect_signatures() declares every signature in the parent's symbol
+   table, exactly as sequential analysis would leave it.
+2. Contiguous chunks of functions are analyzed in a process pool by
+   analyze_function_chunk(); each worker starts from a fresh analyzer that
+   knows the signatures declared before its chunk.
+
+Errors cannot carry AST nodes across processes (the parent locates them by
+identity through its SourceMap), so workers report each error node as its
+key path within the function and the parent maps it back to its own node.
+Chunks are merged in source order, so the error list is the same as the
+sequential one.
+"""
+
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .errors import SemanticError
+from .expression_memo import MemoStats
+from .symbol_table import (
+    FunctionSignature,
+    SymbolTable,
+    create_function_signature_from_ast,
+    validate_function_parameters,
+)
+
+# Chunks per worker: enough to balance uneven function sizes without paying
+# the per-task overhead for every function
+CHUNKS_PER_WORKER = 4
+
+# Keys leading from a function node to a node inside it (see node_paths)
+NodePath = Tuple[Any, ...]
+
+# Error reported by a worker: (function offset in the chunk, message,
+# path of the error node in that function or None)
+ChunkError = Tuple[int, str, Optional[NodePath]]
+
+
+def collect_signatures(
+    functions: Sequence[Dict], symbol_table: SymbolTable
+) -> List[Tuple[int, FunctionSignature]]:
+    """
+    Declare the signatures sequential analysis would declare (phase one).
+
+    Mirrors DeclarationAnalyzer._analyze_function_declaration: a function is
+    declared unless its signature is invalid, its parameters are invalid or
+    its name is already taken. Errors are left to the workers, which report
+    them while analyzing the function.
+
+    Returns (function index, signature) for every declared function.
+    """
+    declared = []
+    for index, function in enumerate(functions):
+        try:
+            signature = create_function_signature_from_ast(function)
+        except (KeyError, ValueError):
+            continue
+        if validate_function_parameters(signature.parameters):
+            continue
+        if symbol_table.declare_function(signature):
+            declared.append((index, signature))
+    return declared
+
+
+def function_chunks(count: int, workers: int) -> List[Tuple[int, int]]:
+    """Split count functions into contiguous [start, end) ranges"""
+    chunk_count = min(count, workers * CHUNKS_PER_WORKER) or 1
+    size, extra = divmod(count, chunk_count)
+    chunks = []
+    start = 0
+    for chunk in range(chunk_count):
+        end = start + size + (chunk < extra)
+        chunks.append((start, end))
+        start = end
+    return chunks
+
+
+def analyze_function_chunk(
+    functions: Sequence[Dict], signatures: Sequence[FunctionSignature]
+) -> Tuple[List[ChunkError], MemoStats]:
+    """
+    Analyze consecutive functions in a fresh analyzer (runs in a worker).
+
+    Args:
+        functions: The chunk's function nodes, in source order
+        signatures: Signatures declared before the chunk, in source order
+
+    Returns the chunk's errors in order and the expression memo statistics.
+    """
+    from .analyzer import SemanticAnalyzer
+
+    analyzer = SemanticAnalyzer()
+    for signature in signatures:
+        analyzer.symbol_table.declare_function(signature)
+
+    errors: List[ChunkError] = []
+    for offset, function in enumerate(functions):
+        mark = len(analyzer.errors)
+        analyzer._analyze_declaration(function)
+        new_errors = analyzer.errors[mark:]
+        if not new_errors:
+            continue
+        paths = node_paths(function, [error.node for error in new_errors])
+        for error in new_errors:
+            errors.append((offset, error.message, paths.get(id(error.node))))
+    return errors, analyzer.expression_memo.stats()
+
+
+def analyze_functions_in_pool(
+    functions: Sequence[Dict],
+    declared: Sequence[Tuple[int, FunctionSignature]],
+    workers: int,
+) -> Tuple[List[SemanticError], List[MemoStats]]:
+    """
+    Analyze function bodies in a process pool (phase two).
+
+    Args:
+        functions: All function nodes of the program
+        declared: Result of collect_signatures() for these functions
+        workers: Number of worker processes
+
+    Returns the errors, located on the given function nodes and in source
+    order, and the memo statistics of every chunk.
+    """
+    chunks = function_chunks(len(functions), workers)
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        futures = [
+            pool.submit(
+                analyze_function_chunk,
+                functions[start:end],
+                [signature for index, signature in declared if index < start],
+            )
+            for start, end in chunks
+        ]
+
+        errors = []
+        chunk_stats = []
+        for (start, _), future in zip(chunks, futures):
+            chunk_errors, stats = future.result()
+            chunk_stats.append(stats)
+            for offset, message, path in chunk_errors:
+                node = node_at(functions[start + offset], path)
+                errors.append(SemanticError(message, node))
+    return errors, chunk_stats
+
+
+def node_paths(root: Any, nodes: List[Any]) -> Dict[int, NodePath]:
+    """
+    Map id() of each given node to its key path from root.
+
+    A path is the sequence of mapping keys and list indices leading from root
+    to the node, so it also locates the node in any copy of the tree (a
+    pickled copy, or the same function parsed again).
+    """
+    wanted = {id(node) for node in nodes if node is not None}
+    paths = {}
+    stack = [(root, ())]
+    while stack and wanted:
+        value, path = stack.pop()
+        if isinstance(value, Mapping):
+            if id(value) in wanted:
+                wanted.discard(id(value))
+                paths[id(value)] = path
+            stack.extend((child, path + (key,)) for key, child in value.items())
+        elif isinstance(value, list):
+            stack.extend((child, path + (index,)) for index, child in enumerate(value))
+    return paths
+
+
+def node_at(root: Any, path: Optional[NodePath]) -> Any:
+    """The node at path below root (None for errors without a node)"""
+    if path is None:
+        return None
+    node = root
+    for key in path:
+        node = node[key]
+    return node
@@ -10,7 +10,13 @@ Handles semantic analysis of range expressions and types:
 """
 
 from typing import Dict, Optional, Union
-from .types import HexenType, RangeType, ComptimeRangeType
+from .types import (
+    HexenType,
+    RangeType,
+    ComptimeRangeType,
+    intern_comptime_range_type,
+    intern_range_type,
+)
 from .type_util import (
     resolve_range_element_type,
     can_convert_to_usize,
@@ -78,7 +84,7 @@ class RangeAnalyzer:
                 "Inclusive range operator '..=' requires an end bound. Use '..' for unbounded ranges.",
                 node,
             )
-            return RangeType(
+            return intern_range_type(
                 element_type=HexenType.UNKNOWN,
                 has_start=has_start,
                 has_end=False,
@@ -93,7 +99,7 @@ class RangeAnalyzer:
                 "Step not allowed on unbounded ranges without start",
                 node,
             )
-            return RangeType(
+            return intern_range_type(
                 element_type=HexenType.UNKNOWN,
                 has_start=False,
                 has_end=has_end,
@@ -148,7 +154,7 @@ class RangeAnalyzer:
             )
         except (TypeError, ValueError) as e:
             self._error(str(e), node)
-            return RangeType(
+            return intern_range_type(
                 element_type=HexenType.UNKNOWN,
                 has_start=has_start,
                 has_end=has_end,
@@ -168,7 +174,7 @@ class RangeAnalyzer:
         # Create appropriate range type
         if element_type in {HexenType.COMPTIME_INT, HexenType.COMPTIME_FLOAT}:
             # Comptime range - preserves flexibility
-            return ComptimeRangeType(
+            return intern_comptime_range_type(
                 element_comptime_type=element_type,
                 has_start=has_start,
                 has_end=has_end,
@@ -177,7 +183,7 @@ class RangeAnalyzer:
             )
         else:
             # Concrete range type
-            return RangeType(
+            return intern_range_type(
                 element_type=element_type,
                 has_start=has_start,
                 has_end=has_end,
@@ -216,7 +222,7 @@ class RangeAnalyzer:
             element_type = HexenType.UNKNOWN
 
         # Create range type (bounds unknown from annotation alone)
-        return RangeType(
+        return intern_range_type(
             element_type=element_type,
             has_start=True,  # Annotation doesn't specify bounds
             has_end=True,
@@ -3,16 +3,29 @@ Hexen Symbol Table Management
 
 Symbol table implementation for managing variable declarations, scoping,
 and symbol lookup during semantic analysis.
+
+Lookups are flat: every name maps to a stack of its visible bindings, so
+resolving an identifier costs one dict lookup regardless of how deeply the
+current block is nested.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any, Union
 
 from .type_util import parse_type
-from .types import HexenType, Mutability, ArrayType, ComptimeArrayType, RangeType, ComptimeRangeType
-
-
-@dataclass
+from .types import (
+    HexenType,
+    Mutability,
+    ArrayType,
+    ComptimeArrayType,
+    RangeType,
+    ComptimeRangeType,
+    intern_array_type,
+)
+
+
+@dataclass(slots=True)
 class Parameter:
     """
     Represents a function parameter with type and mutability information.
@@ -26,8 +39,13 @@ class Parameter:
     param_type: Union[HexenType, ArrayType, RangeType]
     is_mutable: bool
 
+    def __reduce__(self):
+        # Rebuild through the constructor: much faster to unpickle than the
+        # generic slots state (signatures are sent to analysis workers)
+        return Parameter, (self.name, self.param_type, self.is_mutable)
+
 
-@dataclass
+@dataclass(slots=True)
 class FunctionSignature:
     """
     Represents a function signature for symbol table storage.
@@ -46,8 +64,16 @@ class FunctionSignature:
     return_type: Union[HexenType, ArrayType, RangeType]
     declared_line: Optional[int] = None  # For better error reporting (future)
 
+    def __reduce__(self):
+        return FunctionSignature, (
+            self.name,
+            self.parameters,
+            self.return_type,
+            self.declared_line,
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """
     Represents a symbol in the symbol table with full metadata.
@@ -58,8 +84,8 @@ class Symbol:
     - Initialization state for use-before-def checking
     - Usage tracking for dead code elimination
 
-    Design note: Using dataclass for clean syntax while maintaining
-    the ability to add computed properties later.
+    Design note: Using a slotted dataclass for clean syntax and compact
+    instances (one Symbol is created per declaration).
 
     CHANGE (Phase 2): Extended type field to support ComptimeArrayType
     for preserving dimensional information in comptime arrays.
@@ -80,16 +106,22 @@ class SymbolTable:
     Manages symbols and scopes using a scope stack.
 
     Implementation details:
-    - Stack-based scope management (LIFO)
     - Inner scopes shadow outer scopes
     - Lexical scoping rules (can access outer scope variables)
+    - Flat lookup: each name maps to a stack of bindings (innermost last),
+      so lookup_symbol() is O(1) instead of a scan over every open scope
+    - Each scope dict doubles as the undo log of that scope: exit_scope()
+      pops exactly the bindings the scope declared
 
     Scope lifecycle:
     1. enter_scope() - push new scope (function entry, block entry)
     2. declare_symbol() - add symbols to current scope
-    3. lookup_symbol() - search from inner to outer scopes
+    3. lookup_symbol() - innermost visible binding of a name
     4. exit_scope() - pop current scope (function/block exit)
 
+    Invariant: scopes must only be modified through these methods, since
+    the binding stacks mirror their contents.
+
     Future extensions:
     - Nested function support
     - Module-level scopes
@@ -101,6 +133,9 @@ class SymbolTable:
         # Index 0 is global scope, higher indices are inner scopes
         self.scopes: List[Dict[str, Symbol]] = [{}]  # Start with global scope
 
+        # Visible bindings of each name across all scopes, innermost last
+        self._bindings: Dict[str, List[Symbol]] = {}
+
         # Function signature storage (global namespace)
         # Functions exist in a separate namespace from variables
         self.functions: Dict[str, FunctionSignature] = {}
@@ -108,6 +143,22 @@ class SymbolTable:
         # Current function context for analysis
         self.current_function: Optional[str] = None  # Track current function context
         self.current_function_signature: Optional[FunctionSignature] = None
+        self._current_parameters: Dict[str, Parameter] = {}
+
+    def reset(self) -> None:
+        """
+        Forget every symbol and function (back to an empty global scope).
+
+        Clears in place: analyzers hold references to this table, so one
+        table can serve successive programs.
+        """
+        del self.scopes[1:]
+        self.scopes[0].clear()
+        self._bindings.clear()
+        self.functions.clear()
+        self.current_function = None
+        self.current_function_signature = None
+        self._current_parameters = {}
 
     def enter_scope(self):
         """
@@ -124,11 +175,19 @@ class SymbolTable:
         """
         Exit current scope and return to parent scope.
 
+        Unwinds the bindings declared in the scope, which is amortized O(1)
+        per declaration.
+
         Note: Never pop the global scope (index 0) to prevent stack underflow.
         This is a safety measure against malformed ASTs.
         """
         if len(self.scopes) > 1:
-            self.scopes.pop()
+            bindings = self._bindings
+            for name in self.scopes.pop():
+                stack = bindings[name]
+                stack.pop()
+                if not stack:
+                    del bindings[name]
 
     def declare_symbol(self, symbol: Symbol) -> bool:
         """
@@ -141,26 +200,28 @@ class SymbolTable:
         the same scope for clarity.
         """
         current_scope = self.scopes[-1]
-        if symbol.name in current_scope:
+        name = symbol.name
+        if name in current_scope:
             return False  # Already declared in this scope
-        current_scope[symbol.name] = symbol
+        current_scope[name] = symbol
+        stack = self._bindings.get(name)
+        if stack is None:
+            self._bindings[name] = [symbol]
+        else:
+            stack.append(symbol)
         return True
 
     def lookup_symbol(self, name: str) -> Optional[Symbol]:
         """
-        Look up symbol in all scopes from innermost to outermost.
+        Look up the innermost visible symbol with the given name.
 
-        Implements lexical scoping:
-        - Search current scope first
-        - Then parent scopes in reverse order
-        - Return first match found
-        - Return None if not found in any scope
-
-        This allows inner scopes to shadow outer scopes naturally.
+        Implements lexical scoping: the top of the name's binding stack is
+        the declaration in the innermost scope that has one, so inner scopes
+        shadow outer scopes naturally. Returns None if no scope declares it.
         """
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return scope[name]
+        stack = self._bindings.get(name)
+        if stack:
+            return stack[-1]
         return None
 
     def mark_used(self, name: str) -> bool:
@@ -230,6 +291,10 @@ class SymbolTable:
         # Set current function context
         self.current_function = function_name
         self.current_function_signature = signature
+        self._current_parameters = {}
+        for param in signature.parameters:
+            # First wins on duplicate names (reported by the analyzer)
+            self._current_parameters.setdefault(param.name, param)
 
         # Enter new scope for function body
         self.enter_scope()
@@ -263,6 +328,7 @@ class SymbolTable:
         # Clear function context
         self.current_function = None
         self.current_function_signature = None
+        self._current_parameters = {}
 
     def get_current_function_signature(self) -> Optional[FunctionSignature]:
         """
@@ -280,13 +346,7 @@ class SymbolTable:
         Returns True if the symbol exists and is a parameter of the current
         function, False otherwise. Used for parameter-specific validation.
         """
-        if not self.current_function_signature:
-            return False
-
-        for param in self.current_function_signature.parameters:
-            if param.name == name:
-                return True
-        return False
+        return self.get_parameter_info(name) is not None
 
     def get_parameter_info(self, name: str) -> Optional[Parameter]:
         """
@@ -297,11 +357,7 @@ class SymbolTable:
         """
         if not self.current_function_signature:
             return None
-
-        for param in self.current_function_signature.parameters:
-            if param.name == name:
-                return param
-        return None
+        return self._current_parameters.get(name)
 
 
 # =============================================================================
@@ -371,7 +427,7 @@ def _parse_parameter_type(param_type_raw):
         return parse_type(param_type_raw)
 
     # Handle complex AST node types (like array types)
-    if isinstance(param_type_raw, dict):
+    if isinstance(param_type_raw, Mapping):
         node_type = param_type_raw.get("type")
 
         if node_type == "array_type":
@@ -390,8 +446,6 @@ def _parse_array_parameter_type(array_type_node: Dict) -> ArrayType:
 
     Similar to DeclarationAnalyzer._parse_array_type_annotation but without error reporting.
     """
-    from .types import ArrayType  # Import here to avoid circular imports
-
     # Extract element type
     element_type_str = array_type_node.get("element_type", "unknown")
     element_type = parse_type(element_type_str)
@@ -433,7 +487,7 @@ def _parse_array_parameter_type(array_type_node: Dict) -> ArrayType:
 
     # Create and return concrete array type
     try:
-        return ArrayType(element_type, dimensions)
+        return intern_array_type(element_type, dimensions)
     except ValueError:
         return HexenType.UNKNOWN
 
@@ -6,9 +6,16 @@ Provides type checking, coercion, and resolution utilities used across
 the semantic analysis phase.
 """
 
-from typing import Optional, Dict, FrozenSet, Union
-
-from .types import HexenType, ArrayType, ComptimeArrayType, RangeType, ComptimeRangeType
+from typing import Callable, Optional, Dict, FrozenSet, Tuple, TypeVar, Union
+
+from .types import (
+    HexenType,
+    ArrayType,
+    ComptimeArrayType,
+    RangeType,
+    ComptimeRangeType,
+    intern_range_type,
+)
 
 # Module-level constants for type sets and maps
 NUMERIC_TYPES: FrozenSet[HexenType] = frozenset(
@@ -95,6 +102,22 @@ TYPE_RANGES: Dict[HexenType, tuple[Union[int, float], Union[int, float]]] = {
     HexenType.F64: (-1.7976931348623157e308, 1.7976931348623157e308),
 }
 
+_T = TypeVar("_T")
+
+
+def build_scalar_table(
+    relation: Callable[[HexenType, HexenType], _T],
+) -> Tuple[Tuple[_T, ...], ...]:
+    """
+    Precompute a relation over every pair of HexenType members.
+
+    HexenType is a small closed enum, so relations evaluated on every binary
+    operation, assignment and argument are tabulated once at import. The
+    result is indexed as table[left.ordinal][right.ordinal].
+    """
+    members = tuple(HexenType)
+    return tuple(tuple(relation(left, right) for right in members) for left in members)
+
 
 def parse_type(type_str: str) -> HexenType:
     """
@@ -180,6 +203,10 @@ def can_coerce(
     Returns:
         True if coercion is allowed
     """
+    # Scalar types: precomputed table lookup
+    if type(from_type) is HexenType and type(to_type) is HexenType:
+        return _COERCION_TABLE[from_type.ordinal][to_type.ordinal]
+
     # Identity coercion - type can always coerce to itself
     if from_type == to_type:
         return True
@@ -315,13 +342,16 @@ def can_coerce(
         # ConcreteArrayType only coerces to identical ConcreteArrayType (handled by identity above)
         return False
 
-    # ConcreteArrayType cannot coerce to HexenType
-    if isinstance(from_type, ArrayType):
-        return False
+    # Remaining combinations mix a scalar with an array type, or involve
+    # unrecognized types: no coercion (HexenType pairs use the table above)
+    return False
 
-    # Standard HexenType coercion rules
-    if not isinstance(from_type, HexenType) or not isinstance(to_type, HexenType):
-        return False
+
+def _can_coerce_scalar(from_type: HexenType, to_type: HexenType) -> bool:
+    """Coercion rule between two HexenTypes (tabulated in _COERCION_TABLE)"""
+    # Identity coercion - type can always coerce to itself
+    if from_type == to_type:
+        return True
 
     # comptime type coercion (ergonomic literals)
     if from_type == HexenType.COMPTIME_INT:
@@ -375,6 +405,13 @@ def get_wider_type(left_type: HexenType, right_type: HexenType) -> HexenType:
     Returns:
         The wider of the two types
     """
+    if type(left_type) is HexenType and type(right_type) is HexenType:
+        return _WIDER_TYPE_TABLE[left_type.ordinal][right_type.ordinal]
+    return _wider_type_rule(left_type, right_type)
+
+
+def _wider_type_rule(left_type: HexenType, right_type: HexenType) -> HexenType:
+    """Widening rule behind get_wider_type (tabulated in _WIDER_TYPE_TABLE)"""
     if is_float_type(left_type) or is_float_type(right_type):
         # If either is float, result is float
         return (
@@ -473,6 +510,14 @@ def is_precision_loss_operation(from_type: HexenType, to_type: HexenType) -> boo
     Returns:
         True if the operation could lose precision and requires explicit conversion
     """
+    if type(from_type) is HexenType and type(to_type) is HexenType:
+        return _PRECISION_LOSS_TABLE[from_type.ordinal][to_type.ordinal]
+    # Array/range types never take part in scalar precision loss
+    return False
+
+
+def _precision_loss_rule(from_type: HexenType, to_type: HexenType) -> bool:
+    """Precision loss rule (tabulated in _PRECISION_LOSS_TABLE)"""
     return (
         # Integer truncation
         (from_type == HexenType.I64 and to_type == HexenType.I32)
@@ -492,6 +537,12 @@ def is_precision_loss_operation(from_type: HexenType, to_type: HexenType) -> boo
     )
 
 
+# Scalar relations, precomputed at import (see build_scalar_table)
+_COERCION_TABLE = build_scalar_table(_can_coerce_scalar)
+_WIDER_TYPE_TABLE = build_scalar_table(_wider_type_rule)
+_PRECISION_LOSS_TABLE = build_scalar_table(_precision_loss_rule)
+
+
 def validate_literal_range(
     value: Union[int, float], target_type: HexenType, source_text: str = None
 ) -> None:
@@ -651,7 +702,7 @@ def adapt_comptime_range_to_concrete(
     Returns:
         A new RangeType with the target element type and comptime range's metadata
     """
-    return RangeType(
+    return intern_range_type(
         element_type=target_type.element_type,
         has_start=comptime_range.has_start,
         has_end=comptime_range.has_end,
@@ -4,9 +4,17 @@ Hexen Type System
 Core type definitions and enums for the Hexen semantic analyzer.
 Defines the fundamental types and mutability concepts used throughout
 the semantic analysis phase.
+
+Array and range types are hash-consed: the intern_array_type(),
+intern_comptime_array_type(), intern_range_type() and
+intern_comptime_range_type() factories return one shared instance per
+structural type, so equality between interned types is an identity check.
+Interned instances are shared and must be treated as immutable.
 """
 
+import weakref
 from enum import Enum
+from typing import Any, Callable, Tuple
 
 
 class HexenType(Enum):
@@ -54,6 +62,14 @@ class HexenType(Enum):
         return self.value
 
 
+# Dense 0-based index of every HexenType member. The type relations in
+# type_util are precomputed into tables indexed by it, which avoids hashing
+# enum members on the hot paths.
+for _ordinal, _member in enumerate(HexenType):
+    _member.ordinal = _ordinal
+del _ordinal, _member
+
+
 class Mutability(Enum):
     """
     Variable mutability levels following Rust's ownership model.
@@ -127,6 +143,9 @@ class ComptimeArrayType:
         [[[1]], [[2]]]      → ComptimeArrayType(COMPTIME_INT, [2, 1, 1])
     """
 
+    # True for the shared instances returned by the interning factories
+    _interned = False
+
     def __init__(self, element_comptime_type: HexenType, dimensions: list[int]):
         """
         Create a comptime array type.
@@ -162,6 +181,15 @@ class ComptimeArrayType:
         self.element_comptime_type = element_comptime_type
         self.dimensions = dimensions
 
+    def __reduce_ex__(self, protocol):
+        # Interned instances unpickle to the shared instance of this process
+        if self._interned:
+            return intern_comptime_array_type, (
+                self.element_comptime_type,
+                self.dimensions,
+            )
+        return super().__reduce_ex__(protocol)
+
     def __str__(self) -> str:
         """Human-readable string representation"""
         dims_str = "".join(f"[{d}]" for d in self.dimensions)
@@ -175,8 +203,12 @@ class ComptimeArrayType:
         return f"ComptimeArrayType({self.element_comptime_type!r}, {self.dimensions!r})"
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ComptimeArrayType):
             return False
+        if self._interned and other._interned:
+            return False  # Equal interned types are the same object
         return (
             self.element_comptime_type == other.element_comptime_type
             and self.dimensions == other.dimensions
@@ -298,6 +330,9 @@ class ArrayType:
     - Size inference in array type conversions
     """
 
+    # True for the shared instances returned by the interning factories
+    _interned = False
+
     def __init__(self, element_type: HexenType, dimensions: list[int | str]):
         """
         Create a concrete array type.
@@ -324,6 +359,12 @@ class ArrayType:
         self.element_type = element_type
         self.dimensions = dimensions
 
+    def __reduce_ex__(self, protocol):
+        # Interned instances unpickle to the shared instance of this process
+        if self._interned:
+            return intern_array_type, (self.element_type, self.dimensions)
+        return super().__reduce_ex__(protocol)
+
     def __str__(self) -> str:
         """String representation: [3]i32, [2][4]f64"""
         dim_str = "".join(f"[{dim}]" for dim in self.dimensions)
@@ -333,8 +374,12 @@ class ArrayType:
         return f"ConcreteArrayType({self.element_type!r}, {self.dimensions!r})"
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ArrayType):
             return False
+        if self._interned and other._interned:
+            return False  # Equal interned types are the same object
         return (
             self.element_type == other.element_type
             and self.dimensions == other.dimensions
@@ -416,6 +461,9 @@ class RangeType:
         range[f64]   → User type range (iteration only, step required)
     """
 
+    # True for the shared instances returned by the interning factories
+    _interned = False
+
     def __init__(
         self,
         element_type: HexenType,
@@ -506,6 +554,22 @@ class RangeType:
         """Check if this is a comptime range (flexible adaptation)"""
         return self.element_type in {HexenType.COMPTIME_INT, HexenType.COMPTIME_FLOAT}
 
+    def __reduce_ex__(self, protocol):
+        # Interned instances unpickle to the shared instance of this process
+        if self._interned:
+            return self._intern_factory(), (
+                self.element_type,
+                self.has_start,
+                self.has_end,
+                self.has_step,
+                self.inclusive,
+            )
+        return super().__reduce_ex__(protocol)
+
+    @staticmethod
+    def _intern_factory():
+        return intern_range_type
+
     def __str__(self) -> str:
         """Human-readable string representation"""
         elem_str = self.element_type.value
@@ -531,8 +595,12 @@ class RangeType:
         )
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, RangeType):
             return False
+        if self._interned and other._interned and type(self) is type(other):
+            return False  # Equal interned types are the same object
         return (
             self.element_type == other.element_type
             and self.has_start == other.has_start
@@ -608,6 +676,10 @@ class ComptimeRangeType(RangeType):
             inclusive=inclusive,
         )
 
+    @staticmethod
+    def _intern_factory():
+        return intern_comptime_range_type
+
     def can_adapt_to(self, target_type: HexenType) -> bool:
         """
         Check if this comptime range can adapt to target concrete type.
@@ -652,3 +724,81 @@ class ComptimeRangeType(RangeType):
         inclusive_str = "inclusive" if self.inclusive else "exclusive"
 
         return f"comptime_range[{elem_str}]({bounds_str},{inclusive_str})"
+
+
+# =============================================================================
+# Type Interning
+# =============================================================================
+
+# Structural key -> canonical instance. Values are weak so types that are no
+# longer referenced anywhere drop out of the table.
+_interned_types: "weakref.WeakValueDictionary[Tuple, Any]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _intern(key: Tuple, create: Callable[[], Any]) -> Any:
+    instance = _interned_types.get(key)
+    if instance is None:
+        # Constructors validate, so invalid types raise before being interned
+        instance = create()
+        instance._interned = True
+        _interned_types[key] = instance
+    return instance
+
+
+def intern_comptime_array_type(
+    element_comptime_type: HexenType, dimensions: list[int]
+) -> ComptimeArrayType:
+    """Return the shared ComptimeArrayType for this element type and shape"""
+    key = (ComptimeArrayType, element_comptime_type, *dimensions)
+    return _intern(
+        key, lambda: ComptimeArrayType(element_comptime_type, list(dimensions))
+    )
+
+
+def intern_array_type(
+    element_type: HexenType, dimensions: list[int | str]
+) -> ArrayType:
+    """Return the shared ArrayType for this element type and shape"""
+    key = (ArrayType, element_type, *dimensions)
+    return _intern(key, lambda: ArrayType(element_type, list(dimensions)))
+
+
+def intern_range_type(
+    element_type: HexenType,
+    has_start: bool,
+    has_end: bool,
+    has_step: bool,
+    inclusive: bool,
+) -> RangeType:
+    """Return the shared RangeType with this element type and structure"""
+    key = (RangeType, element_type, has_start, has_end, has_step, inclusive)
+    return _intern(
+        key,
+        lambda: RangeType(element_type, has_start, has_end, has_step, inclusive),
+    )
+
+
+def intern_comptime_range_type(
+    element_comptime_type: HexenType,
+    has_start: bool,
+    has_end: bool,
+    has_step: bool,
+    inclusive: bool,
+) -> ComptimeRangeType:
+    """Return the shared ComptimeRangeType with this element type and structure"""
+    key = (
+        ComptimeRangeType,
+        element_comptime_type,
+        has_start,
+        has_end,
+        has_step,
+        inclusive,
+    )
+    return _intern(
+        key,
+        lambda: ComptimeRangeType(
+            element_comptime_type, has_start, has_end, has_step, inclusive
+        ),
+    )
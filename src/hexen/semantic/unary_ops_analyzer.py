@@ -58,16 +58,41 @@ class UnaryOpsAnalyzer:
         Returns:
             The resolved type of the operation
         """
-        operator = node.get("operator")
-        operand = node.get("operand")
-
-        if not operator or not operand:
-            self._error("Invalid unary operation", node)
+        operand = self.unary_operand(node)
+        if operand is None:
             return HexenType.UNKNOWN
 
         # Analyze operand with context
         operand_type = self._analyze_expression(operand, target_type)
 
+        return self.resolve_unary_operation(node, operand_type, target_type)
+
+    def unary_operand(self, node: Dict) -> Optional[Dict]:
+        """
+        Return the operand of a well-formed unary operation.
+
+        Reports an error and returns None for malformed nodes.
+        """
+        operand = node.get("operand")
+        if not node.get("operator") or not operand:
+            self._error("Invalid unary operation", node)
+            return None
+        return operand
+
+    def resolve_unary_operation(
+        self,
+        node: Dict,
+        operand_type: HexenType,
+        target_type: Optional[HexenType] = None,
+    ) -> HexenType:
+        """
+        Resolve the type of a unary operation from its analyzed operand type.
+
+        The operand is analyzed by the caller (with the same target_type),
+        which lets ExpressionAnalyzer analyze nested operations iteratively.
+        """
+        operator = node.get("operator")
+
         if operand_type == HexenType.UNKNOWN:
             return HexenType.UNKNOWN
 
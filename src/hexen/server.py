@@ -0,0 +1,224 @@
+"""
+Hexen Compile Server
+
+`hexen serve` keeps a parser and a semantic analyzer warm in one long-lived
+process and answers parse/check requests over a Unix domain socket, so
+repeated CLI runs (editor integrations, watch loops) skip importing lark,
+building the parser and constructing the analyzer. Each file checked keeps
+an IncrementalSession, so re-checking an edited file only re-analyzes the
+functions that changed.
+
+Protocol: newline-delimited JSON. Every request is one JSON object on one
+line and is answered by one JSON object on one line; a connection may send
+any number of requests.
+
+    {"command": "ping"}
+    {"command": "parse", "path": "/abs/file.hxn"}
+    {"command": "check", "path": "/abs/file.hxn", "parser": "lalr",
+     "ast_cache": true, "jobs": 4}
+    {"command": "shutdown"}
+
+parse and check read the file at path, or take the text of an unsaved
+buffer from an optional "source" field. Responses have a "status":
+
+    {"status": "ok", "ast": {...}}                  (parse)
+    {"status": "ok", "errors": ["3:5: ...", ...]}   (check)
+    {"status": "syntax_error", "message": "Parse error ..."}
+    {"status": "usage", "message": "Parser modes: ..."}
+    {"status": "error", "message": "..."}
+
+The CLI answers single-file parse/check requests through CompileService
+itself when no server is running, so its output is the same either way.
+"""
+
+import json
+import os
+import socketserver
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .ast_cache import ASTCache
+from .client import default_socket_path, server_running
+from .parser import HexenParser
+from .semantic import IncrementalSession, SemanticAnalyzer
+from .typed_ast import Node
+
+# Parser mode used when a request does not name one (same as the CLI's)
+DEFAULT_PARSER_MODE = "lalr-treeless"
+
+# Files whose function results are kept for incremental re-checking
+MAX_SESSIONS = 256
+
+
+class CompileService:
+    """
+    Answers parse/check requests with warm parsers and one reused analyzer.
+
+    With incremental=True every checked path keeps an IncrementalSession
+    for the next check of the same path. Not thread-safe: CompileServer
+    serializes requests.
+    """
+
+    def __init__(self, incremental: bool = True):
+        self.incremental = incremental
+        self._parsers: Dict[Tuple[str, bool, bool], HexenParser] = {}
+        self._ast_cache: Optional[ASTCache] = None
+        self._analyzer = SemanticAnalyzer()
+        self._sessions: "OrderedDict[str, IncrementalSession]" = OrderedDict()
+
+    def warm_up(self, mode: str = DEFAULT_PARSER_MODE) -> None:
+        """Build the parser used by check requests ahead of the first one"""
+        # HexenParser only builds its Lark parser on first use
+        self._parser(mode, track_spans=True, ast_cache=False).parser
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one request (see the module docstring for the protocol)"""
+        command = request.get("command")
+        if command == "ping":
+            return {"status": "ok", "pid": os.getpid()}
+        if command not in ("parse", "check"):
+            return {"status": "error", "message": f"Unknown command: {command}"}
+
+        mode = request.get("parser") or DEFAULT_PARSER_MODE
+        if mode not in HexenParser.MODES:
+            return {
+                "status": "usage",
+                "message": f"Parser modes: {', '.join(HexenParser.MODES)}",
+            }
+
+        try:
+            # Spans only cost two offsets per node; positions are resolved
+            # lazily when an error is formatted
+            parser = self._parser(
+                mode,
+                track_spans=command == "check",
+                ast_cache=bool(request.get("ast_cache")),
+            )
+            if request.get("source") is not None:
+                ast = parser.parse(request["source"])
+            else:
+                ast = parser.parse_file(request["path"])
+
+            if command == "parse":
+                # Responses are JSON, so typed ASTs go back as dicts
+                if isinstance(ast, Node):
+                    ast = ast.to_dict()
+                return {"status": "ok", "ast": ast}
+
+            errors = self._analyze(ast, request.get("path"), request.get("jobs", 1))
+            return {
+                "status": "ok",
+                "errors": [error.format(parser.source_map) for error in errors],
+            }
+        except SyntaxError as e:
+            return {"status": "syntax_error", "message": str(e)}
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    def _parser(self, mode: str, track_spans: bool, ast_cache: bool) -> HexenParser:
+        key = (mode, track_spans, ast_cache)
+        parser = self._parsers.get(key)
+        if parser is None:
+            if ast_cache and self._ast_cache is None:
+                self._ast_cache = ASTCache()
+            parser = HexenParser(
+                mode=mode,
+                ast_cache=self._ast_cache if ast_cache else None,
+                track_spans=track_spans,
+            )
+            self._parsers[key] = parser
+        return parser
+
+    def _analyze(self, ast: Dict, path: Optional[str], jobs: int):
+        # Function bodies analyzed in a pool are not recorded in a session
+        if jobs > 1:
+            return SemanticAnalyzer(workers=jobs).analyze(ast)
+        self._analyzer.incremental = self._session(path)
+        return self._analyzer.analyze(ast)
+
+    def _session(self, path: Optional[str]) -> Optional[IncrementalSession]:
+        """The file's session, evicting the least recently checked file"""
+        if path is None or not self.incremental:
+            return None
+        session = self._sessions.pop(path, None)
+        if session is None:
+            session = IncrementalSession()
+            if len(self._sessions) >= MAX_SESSIONS:
+                self._sessions.popitem(last=False)
+        self._sessions[path] = session
+        return session
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads newline-delimited requests from one connection"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                request = None
+            if not isinstance(request, dict):
+                self._respond({"status": "error", "message": "Invalid request"})
+            elif request.get("command") == "shutdown":
+                self._respond({"status": "ok"})
+                # Only once answered: the process may exit as soon as serving
+                # stops. shutdown() waits for serve_forever(), hence the thread
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+            else:
+                self._respond(self.server.dispatch(request))
+
+    def _respond(self, response: Dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+        self.wfile.flush()
+
+
+class CompileServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server handing requests to one CompileService"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service: Optional[CompileService] = None):
+        self.service = service or CompileService()
+        self._lock = threading.Lock()
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_bind(self):
+        super().server_bind()
+        # Only the owner may send requests (which read files as the owner)
+        os.chmod(self.server_address, 0o600)
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            return self.service.handle(request)
+
+
+def create_server(socket_path: Optional[str] = None) -> CompileServer:
+    """
+    Create a warmed-up server listening on socket_path.
+
+    A socket left behind by a server that is no longer running is replaced;
+    raises RuntimeError if a server already answers on it.
+    """
+    socket_path = socket_path or default_socket_path()
+    if os.path.exists(socket_path):
+        if server_running(socket_path):
+            raise RuntimeError(f"A Hexen server is already running on {socket_path}")
+        os.unlink(socket_path)
+    service = CompileService()
+    service.warm_up()
+    return CompileServer(socket_path, service)
+
+
+def serve(server: CompileServer) -> None:
+    """Serve requests until a shutdown request, then remove the socket"""
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        try:
+            os.unlink(server.server_address)
+        except FileNotFoundError:
+            pass
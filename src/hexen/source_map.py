@@ -0,0 +1,193 @@
+"""
+Hexen Source Map
+
+Source positions for AST nodes, kept outside the AST itself.
+
+The parser records the start/end character offsets of every node in two
+compact parallel arrays, in the order nodes are built. Nothing else is
+computed up front: the node -> slot index and the line-start table are
+built the first time a position is actually asked for (typically when a
+diagnostic is rendered), so error-free runs only pay for the arrays.
+
+Usage:
+    parser = HexenParser(track_spans=True)
+    ast = parser.parse(source)
+    parser.source_map.span(ast["functions"][0])      # (start, end) offsets
+    parser.source_map.location(node)                 # (line, column), 1-based
+"""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Offset stored for nodes without a recorded span in serialized tables
+_NO_SPAN = 0xFFFFFFFF
+
+
+class SourceMap:
+    """
+    Span table for the nodes of one parsed source.
+
+    Design:
+    - Offsets are 0-based character offsets into the source text; spans are
+      half-open [start, end)
+    - Nodes are matched by identity, so the map only applies to the AST
+      object it was built with (not to copies or re-parsed trees)
+    - A node recorded twice (a rule passing its child through, e.g. a
+      parenthesized expression) keeps the outermost span
+    - Nodes built without a grammar rule of their own (the inner nodes of
+      an `a + b + c` chain) get a span derived from their first and last
+      child nodes on lookup
+    - Lines and columns are 1-based and computed lazily via a bisected
+      line-start index
+    """
+
+    __slots__ = ("source", "_nodes", "_starts", "_ends", "_index", "_line_starts")
+
+    def __init__(self, source: str):
+        self.source = source
+        self._nodes: List[Any] = []
+        self._starts = array("I")
+        self._ends = array("I")
+        self._index: Optional[Dict[int, int]] = None
+        self._line_starts: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def record(self, node: Any, start: int, end: int) -> None:
+        """Record the span of a node built after all of its children"""
+        nodes = self._nodes
+        if nodes and nodes[-1] is node:
+            # Pass-through rule: widen the span of the node just recorded
+            self._starts[-1] = start
+            self._ends[-1] = end
+            return
+        nodes.append(node)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._index = None
+
+    def rekey(self, convert: Callable[[Any], Any]) -> None:
+        """Replace every recorded node by convert(node), keeping its span"""
+        self._nodes = [convert(node) for node in self._nodes]
+        self._index = None
+
+    def dump(self, ast: Any) -> Tuple[bytes, bytes]:
+        """
+        Serialize the spans of ast's nodes, listed in AST walk order.
+
+        Node identity does not survive serialization, so spans are stored
+        by position in a preorder walk, which load() replays on the
+        deserialized AST.
+        """
+        self._build_index()
+        starts = array("I")
+        ends = array("I")
+        for node in _walk(ast):
+            slot = self._index.get(id(node))
+            if slot is None:
+                starts.append(_NO_SPAN)
+                ends.append(_NO_SPAN)
+            else:
+                starts.append(self._starts[slot])
+                ends.append(self._ends[slot])
+        return starts.tobytes(), ends.tobytes()
+
+    def load(self, ast: Any, starts: bytes, ends: bytes) -> bool:
+        """Record spans produced by dump() for an equal AST; False on mismatch"""
+        start_array = array("I")
+        end_array = array("I")
+        try:
+            start_array.frombytes(starts)
+            end_array.frombytes(ends)
+        except ValueError:
+            return False
+        nodes = list(_walk(ast))
+        if not len(nodes) == len(start_array) == len(end_array):
+            return False
+        for node, start, end in zip(nodes, start_array, end_array):
+            if start != _NO_SPAN:
+                self.record(node, start, end)
+        return True
+
+    # =========================================================================
+    # Lookups (lazy)
+    # =========================================================================
+
+    def span(self, node: Any) -> Optional[Tuple[int, int]]:
+        """Return the (start, end) offsets of a node, or None if unknown"""
+        if node is None:
+            return None
+        self._build_index()
+        slot = self._index.get(id(node))
+        if slot is not None:
+            return self._starts[slot], self._ends[slot]
+        if not isinstance(node, Mapping):
+            return None
+        start = self._derive_edge(node, self._starts, first=True)
+        end = self._derive_edge(node, self._ends, first=False)
+        if start is None or end is None:
+            return None
+        return start, end
+
+    def _build_index(self) -> None:
+        if self._index is None:
+            # Later records win, matching the widening done in record()
+            self._index = {id(n): slot for slot, n in enumerate(self._nodes)}
+
+    def _derive_edge(self, node: Mapping, edges: array, first: bool) -> Optional[int]:
+        """Walk down first (or last) child nodes until a recorded one"""
+        # Iterative: derived chains can be as long as an expression
+        while True:
+            children = list(_child_nodes(node))
+            if not children:
+                return None
+            node = children[0] if first else children[-1]
+            slot = self._index.get(id(node))
+            if slot is not None:
+                return edges[slot]
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """Convert a character offset to a 1-based (line, column) pair"""
+        if self._line_starts is None:
+            line_starts = array("I", [0])
+            source = self.source
+            position = source.find("\n")
+            while position != -1:
+                line_starts.append(position + 1)
+                position = source.find("\n", position + 1)
+            self._line_starts = line_starts
+        line = bisect_right(self._line_starts, offset)
+        return line, offset - self._line_starts[line - 1] + 1
+
+    def location(self, node: Any) -> Optional[Tuple[int, int]]:
+        """Return the 1-based (line, column) where a node starts"""
+        span = self.span(node)
+        if span is None:
+            return None
+        return self.line_col(span[0])
+
+
+def _child_nodes(node: Mapping):
+    """Direct child nodes of an AST node, in field order"""
+    for value in node.values():
+        if isinstance(value, Mapping):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, Mapping):
+                    yield item
+
+
+def _walk(ast: Any) -> Iterator[Mapping]:
+    """All nodes of an AST in preorder (iterative, for deep trees)"""
+    stack = [ast]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Mapping):
+            yield value
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
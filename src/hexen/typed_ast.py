@@ -0,0 +1,338 @@
+"""
+Typed AST Nodes for Hexen Language
+
+Compact alternative to the dict-based AST built by HexenTransformer: one
+__slots__ class per NodeType, each tagged with an integer NodeKind.
+
+Every node is also a read-only-by-default Mapping exposing exactly the keys
+of the equivalent dict node (including "type"), so the semantic analyzers
+keep working unchanged on typed ASTs while they migrate to attribute access
+and integer-kind dispatch.
+
+Usage:
+    ast = to_typed_ast(HexenParser().parse(source))
+    ast.kind == NodeKind.PROGRAM           # integer tag
+    ast["functions"][0].name               # mapping and attribute access
+    ast.to_dict() == HexenParser().parse(source)
+"""
+
+from collections.abc import Mapping
+from enum import IntEnum
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .ast_nodes import NodeType
+
+# Integer tag per NodeType, in NodeType declaration order
+NodeKind = IntEnum("NodeKind", [node_type.name for node_type in NodeType], start=0)
+
+# NodeType value ("literal", ...) -> node class, filled in by Node subclasses
+NODE_CLASSES: Dict[str, type] = {}
+
+
+class Node(Mapping):
+    """
+    Base class for slotted AST nodes.
+
+    Subclasses declare their fields with __slots__ and bind themselves to a
+    NodeType through the class keyword: `class X(Node, node_type=NodeType.X)`.
+    Fields left unset are absent from the mapping view, matching optional
+    keys of dict nodes (e.g. a program's "statements").
+    """
+
+    __slots__ = ()
+
+    # Per-class constants, set in __init_subclass__
+    type: str = ""
+    kind: int = -1
+    _keys: Tuple[str, ...] = ()
+    _key_set: frozenset = frozenset()
+
+    def __init_subclass__(cls, node_type: NodeType, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.type = node_type.value
+        cls.kind = NodeKind[node_type.name]
+        cls._keys = ("type",) + cls.__slots__
+        cls._key_set = frozenset(cls._keys)
+        NODE_CLASSES[node_type.value] = cls
+
+    def __init__(self, **fields: Any):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    # Mapping compatibility ---------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._key_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "type" or key not in self._key_set:
+            raise KeyError(f"{type(self).__name__} has no field '{key}'")
+        setattr(self, key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._key_set:
+            return getattr(self, key, default)
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._key_set and hasattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self._keys if hasattr(self, key))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={self[key]!r}" for key in self if key != "type")
+        return f"{type(self).__name__}({fields})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert this node and its sub-tree back to the dict-based AST"""
+        return _to_plain(self)
+
+
+# =============================================================================
+# Node classes (one per NodeType)
+# =============================================================================
+
+# Core AST Structure
+
+
+class ProgramNode(Node, node_type=NodeType.PROGRAM):
+    __slots__ = ("functions", "statements")
+
+
+class FunctionNode(Node, node_type=NodeType.FUNCTION):
+    __slots__ = ("name", "parameters", "return_type", "body")
+
+
+class BlockNode(Node, node_type=NodeType.BLOCK):
+    __slots__ = ("statements",)
+
+
+# Function System
+
+
+class ParameterNode(Node, node_type=NodeType.PARAMETER):
+    __slots__ = ("name", "param_type", "is_mutable")
+
+
+class ParameterListNode(Node, node_type=NodeType.PARAMETER_LIST):
+    # The transformer emits parameter lists as plain lists
+    __slots__ = ("parameters",)
+
+
+class FunctionCallNode(Node, node_type=NodeType.FUNCTION_CALL):
+    __slots__ = ("function_name", "arguments")
+
+
+class ArgumentListNode(Node, node_type=NodeType.ARGUMENT_LIST):
+    # The transformer emits argument lists as plain lists
+    __slots__ = ("arguments",)
+
+
+# Declarations
+
+
+class ValDeclarationNode(Node, node_type=NodeType.VAL_DECLARATION):
+    __slots__ = ("name", "type_annotation", "value")
+
+
+class MutDeclarationNode(Node, node_type=NodeType.MUT_DECLARATION):
+    __slots__ = ("name", "type_annotation", "value")
+
+
+# Statements
+
+
+class ReturnStatementNode(Node, node_type=NodeType.RETURN_STATEMENT):
+    __slots__ = ("value",)
+
+
+class AssignStatementNode(Node, node_type=NodeType.ASSIGN_STATEMENT):
+    __slots__ = ("value",)
+
+
+class AssignmentStatementNode(Node, node_type=NodeType.ASSIGNMENT_STATEMENT):
+    __slots__ = ("target", "value")
+
+
+class ConditionalStatementNode(Node, node_type=NodeType.CONDITIONAL_STATEMENT):
+    __slots__ = ("condition", "if_branch", "else_clauses")
+
+
+class ElseClauseNode(Node, node_type=NodeType.ELSE_CLAUSE):
+    __slots__ = ("condition", "branch")
+
+
+class FunctionCallStatementNode(Node, node_type=NodeType.FUNCTION_CALL_STATEMENT):
+    __slots__ = ("function_call",)
+
+
+# Expressions
+
+
+class LiteralNode(Node, node_type=NodeType.LITERAL):
+    __slots__ = ("value",)
+
+
+class IdentifierNode(Node, node_type=NodeType.IDENTIFIER):
+    __slots__ = ("name",)
+
+
+class BinaryOperationNode(Node, node_type=NodeType.BINARY_OPERATION):
+    __slots__ = ("operator", "left", "right")
+
+
+class NaryOperationNode(Node, node_type=NodeType.NARY_OPERATION):
+    __slots__ = ("operator", "operands")
+
+
+class UnaryOperationNode(Node, node_type=NodeType.UNARY_OPERATION):
+    __slots__ = ("operator", "operand")
+
+
+class ExplicitConversionNode(Node, node_type=NodeType.EXPLICIT_CONVERSION_EXPRESSION):
+    __slots__ = ("expression", "target_type")
+
+
+# Comptime Types
+
+
+class ComptimeIntNode(Node, node_type=NodeType.COMPTIME_INT):
+    __slots__ = ("value", "source_text")
+
+
+class ComptimeFloatNode(Node, node_type=NodeType.COMPTIME_FLOAT):
+    __slots__ = ("value", "source_text")
+
+
+# Array System
+
+
+class ArrayTypeNode(Node, node_type=NodeType.ARRAY_TYPE):
+    __slots__ = ("dimensions", "element_type")
+
+
+class ArrayDimensionNode(Node, node_type=NodeType.ARRAY_DIMENSION):
+    __slots__ = ("size",)
+
+
+class ArrayLiteralNode(Node, node_type=NodeType.ARRAY_LITERAL):
+    __slots__ = ("elements",)
+
+
+class ArrayAccessNode(Node, node_type=NodeType.ARRAY_ACCESS):
+    __slots__ = ("array", "index")
+
+
+class ArrayCopyNode(Node, node_type=NodeType.ARRAY_COPY):
+    __slots__ = ("array",)
+
+
+class PropertyAccessNode(Node, node_type=NodeType.PROPERTY_ACCESS):
+    __slots__ = ("object", "property")
+
+
+# Range System
+
+
+class RangeExprNode(Node, node_type=NodeType.RANGE_EXPR):
+    __slots__ = ("start", "end", "step", "inclusive")
+
+
+class RangeTypeNode(Node, node_type=NodeType.RANGE_TYPE):
+    __slots__ = ("element_type",)
+
+
+# =============================================================================
+# Conversion between dict-based and typed ASTs
+# =============================================================================
+
+
+def to_typed_ast(value: Any, converted: Optional[Dict[int, "Node"]] = None) -> Any:
+    """
+    Convert a dict-based AST (or any sub-tree / list of nodes) to typed nodes.
+
+    Dicts with a known "type" become Node instances, lists are converted
+    element-wise, and scalars (names, operators, primitive type strings)
+    are kept as-is. If converted is given, it is filled with
+    id(dict node) -> typed node (used to carry source spans over).
+
+    The walk uses an explicit stack, so arbitrarily deep ASTs convert
+    without hitting the recursion limit.
+
+    Raises:
+        ValueError: If a node has an unknown type or unexpected fields
+    """
+    root: List[Any] = [None]
+    # Pending conversions: store the converted value at parent[key], where
+    # parent is a list (index key) or a typed node (attribute key)
+    stack: List[tuple] = [(root, 0, value)]
+    while stack:
+        parent, key, item = stack.pop()
+        if isinstance(item, list):
+            result: Any = [None] * len(item)
+            stack.extend((result, index, element) for index, element in enumerate(item))
+        elif isinstance(item, dict):
+            node_class = NODE_CLASSES.get(item.get("type"))
+            if node_class is None:
+                raise ValueError(f"Unknown AST node type: {item.get('type')!r}")
+
+            result = node_class.__new__(node_class)
+            for field, field_value in item.items():
+                if field == "type":
+                    continue
+                if field not in node_class._key_set:
+                    raise ValueError(
+                        f"Unexpected field '{field}' on {node_class.type} node"
+                    )
+                if isinstance(field_value, (list, dict)):
+                    stack.append((result, field, field_value))
+                else:
+                    setattr(result, field, field_value)
+            if converted is not None:
+                converted[id(item)] = result
+        else:
+            result = item
+
+        if type(parent) is list:
+            parent[key] = result
+        else:
+            setattr(parent, key, result)
+    return root[0]
+
+
+def _to_plain(value: Any) -> Any:
+    """
+    Inverse of to_typed_ast for a node or field value. Like to_typed_ast,
+    the walk uses an explicit stack instead of recursion.
+    """
+    root: List[Any] = [None]
+    # Pending conversions: store the plain value at parent[key], where
+    # parent is a list or a dict node whose keys are already in order
+    stack: List[tuple] = [(root, 0, value)]
+    while stack:
+        parent, key, item = stack.pop()
+        if isinstance(item, Node):
+            result: Any = {}
+            for field in item:
+                field_value = item[field]
+                if isinstance(field_value, (Node, list)):
+                    result[field] = None
+                    stack.append((result, field, field_value))
+                else:
+                    result[field] = field_value
+        elif isinstance(item, list):
+            result = [None] * len(item)
+            stack.extend((result, index, element) for index, element in enumerate(item))
+        else:
+            result = item
+        parent[key] = result
+    return root[0]
@@ -0,0 +1,37 @@
+"""
+Code generation test package for Hexen
+
+Compiles Hexen source through the whole pipeline (parse, analyze, generate)
+and runs the generated functions in-process with llvmlite's MCJIT.
+"""
+
+import ctypes
+
+import llvmlite.binding as llvm
+
+from src.hexen.codegen import CodeGenerator, compile_module, host_target_machine
+from src.hexen.parser import HexenParser
+from src.hexen.semantic import SemanticAnalyzer
+
+
+def generate(source):
+    """The ir.Module of a program that must pass semantic analysis"""
+    ast = HexenParser().parse(source)
+    errors = SemanticAnalyzer().analyze(ast)
+    assert not errors, f"Unexpected semantic errors: {errors}"
+    return CodeGenerator().generate(ast)
+
+
+def jit(source):
+    """An execution engine with the program's functions compiled"""
+    machine = host_target_machine()
+    engine = llvm.create_mcjit_compiler(compile_module(generate(source)), machine)
+    engine.finalize_object()
+    return engine
+
+
+def run(source, function="main", restype=ctypes.c_int32, argtypes=(), args=()):
+    """Call a function of the program and return its result"""
+    engine = jit(source)
+    address = engine.get_function_address(function)
+    return ctypes.CFUNCTYPE(restype, *argtypes)(address)(*args)
@@ -0,0 +1,18 @@
+"""
+Pytest configuration for the code generation tests.
+
+llvmlite's IR objects point back at their parents, so every generated
+module is a reference cycle that outlives its test until a full garbage
+collection. Collect them when the tests here finish so that the timing
+benchmarks run later in the session do not pay for it.
+"""
+
+import gc
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="package")
+def collect_generated_modules():
+    yield
+    gc.collect()
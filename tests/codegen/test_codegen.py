@@ -0,0 +1,451 @@
+"""
+Test module for LLVM IR code generation
+
+Tests lowering of checked programs: integer, float and usize arithmetic,
+comptime folding and conversions, function calls and mut parameters,
+conditionals and expression blocks, fixed-size arrays with bounds checks,
+constant array globals and range materialization, unsupported constructs,
+and the `hexen build` command.
+"""
+
+import ctypes
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from src.hexen import cli
+from src.hexen.codegen import (
+    PASS_TIMING_SUPPORTED,
+    CodeGenerator,
+    CodegenError,
+    compile_module,
+)
+from src.hexen.parser import HexenParser
+
+from . import generate, run
+
+
+class TestScalarCodegen:
+    """Test arithmetic, comptime folding and conversions"""
+
+    def test_integer_arithmetic(self):
+        source = """
+        func calc(a : i32, b : i32) : i32 = {
+            return a * b - a \\ b + -a
+        }
+        """
+        args = (ctypes.c_int32, ctypes.c_int32)
+        assert run(source, "calc", argtypes=args, args=(7, 2)) == 14 - 3 - 7
+        # Integer division truncates toward zero
+        assert run(source, "calc", argtypes=args, args=(-7, 2)) == -14 + 3 + 7
+
+    def test_comptime_values_adapt_to_context(self):
+        source = """
+        func main() : i64 = {
+            val big = 3000000000
+            val k = big * 2 + 1
+            val small : i32 = 40 + 2
+            return k + small
+        }
+        """
+        assert run(source, restype=ctypes.c_int64) == 6000000001 + 42
+        # Comptime values are folded: no arithmetic is left in the IR
+        ir_text = str(generate(source))
+        assert "6000000001" in ir_text and "mul" not in ir_text
+
+    def test_mixed_arithmetic_widens_to_target(self):
+        source = """
+        func widen(x : i32) : i64 = {
+            val w : i64 = x + 42
+            return w
+        }
+        """
+        args = (ctypes.c_int32,)
+        assert run(source, "widen", ctypes.c_int64, args, (-50,)) == -8
+
+    def test_float_arithmetic_and_division(self):
+        source = """
+        func mean(a : i32, b : i32) : f64 = {
+            val total : f64 = a:f64 + b:f64
+            return total / 2
+        }
+        func half() : f32 = {
+            return 7 / 2
+        }
+        """
+        args = (ctypes.c_int32, ctypes.c_int32)
+        assert run(source, "mean", ctypes.c_double, args, (3, 4)) == 3.5
+        assert run(source, "half", ctypes.c_float) == 3.5
+
+    def test_explicit_conversions(self):
+        source = """
+        func truncate(x : f64) : i32 = {
+            return x:i32
+        }
+        func narrow(x : i64) : i32 = {
+            return x:i32
+        }
+        func folded() : i32 = {
+            return 3.9:i32
+        }
+        """
+        double = (ctypes.c_double,)
+        assert run(source, "truncate", argtypes=double, args=(-2.75,)) == -2
+        wide = (ctypes.c_int64,)
+        assert run(source, "narrow", argtypes=wide, args=(2**32 + 5,)) == 5
+        assert run(source, "folded") == 3
+
+    def test_usize_is_unsigned(self):
+        source = """
+        func above(x : usize, y : usize) : bool = {
+            return x > y
+        }
+        """
+        args = (ctypes.c_uint64, ctypes.c_uint64)
+        assert run(source, "above", ctypes.c_bool, args, (2**63, 1))
+
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [(-1, 6, 0b100011), (3, 6, 0b100011), (6, 6, 0b011010), (7, 2**63, 0b100011)],
+    )
+    def test_signed_usize_comparison(self, a, b, expected):
+        """i32/usize comparisons compare values, a negative i32 is smallest"""
+        source = """
+        func compare(a : i32, b : usize) : i32 = {
+            mut bits : i32 = 0
+            if a < b { bits = bits + 1 }
+            if a <= b { bits = bits + 2 }
+            if a > b { bits = bits + 4 }
+            if a >= b { bits = bits + 8 }
+            if a == b { bits = bits + 16 }
+            if b > a { bits = bits + 32 }
+            return bits
+        }
+        """
+        args = (ctypes.c_int32, ctypes.c_uint64)
+        assert run(source, "compare", argtypes=args, args=(a, b)) == expected
+
+    def test_long_operator_chain(self):
+        terms = " + ".join(["x"] * 3000)
+        source = f"""
+        func chain(x : i32) : i32 = {{
+            return {terms}
+        }}
+        """
+        args = (ctypes.c_int32,)
+        assert run(source, "chain", argtypes=args, args=(2,)) == 6000
+
+
+class TestFunctionCodegen:
+    """Test calls, parameters and returns"""
+
+    def test_calls_and_mut_parameters(self):
+        source = """
+        func bump(mut x : i64) : i64 = {
+            x = x + 1
+            return x
+        }
+        func main() : i64 = {
+            mut total : i64 = 10
+            total = bump(total) + bump(1)
+            return total
+        }
+        """
+        assert run(source, restype=ctypes.c_int64) == 13
+
+    def test_recursion(self):
+        source = """
+        func fib(n : i32) : i32 = {
+            if n < 2 {
+                return n
+            }
+            return fib(n - 1) + fib(n - 2)
+        }
+        """
+        args = (ctypes.c_int32,)
+        assert run(source, "fib", argtypes=args, args=(20,)) == 6765
+
+    def test_void_function(self):
+        source = """
+        func nothing() : void = {
+            val x : i32 = 1
+            return
+        }
+        func main() : i32 = {
+            nothing()
+            return 0
+        }
+        """
+        assert run(source) == 0
+
+
+class TestControlFlowCodegen:
+    """Test conditionals, expression blocks and logical operators"""
+
+    SIGN = """
+    func sign(x : i32) : i32 = {
+        val result : i32 = if x > 0 {
+            -> 1
+        } else if x == 0 {
+            -> 0
+        } else {
+            -> -1
+        }
+        return result
+    }
+    """
+
+    @pytest.mark.parametrize("value, expected", [(5, 1), (0, 0), (-3, -1)])
+    def test_conditional_expression(self, value, expected):
+        args = (ctypes.c_int32,)
+        assert run(self.SIGN, "sign", argtypes=args, args=(value,)) == expected
+
+    def test_conditional_branch_returns_early(self):
+        source = """
+        func clamp(x : i32) : i32 = {
+            val y : i32 = if x > 100 {
+                return 100
+            } else {
+                -> x * 2
+            }
+            return y
+        }
+        """
+        args = (ctypes.c_int32,)
+        assert run(source, "clamp", argtypes=args, args=(500,)) == 100
+        assert run(source, "clamp", argtypes=args, args=(7,)) == 14
+
+    def test_expression_block(self):
+        source = """
+        func area(w : i32, h : i32) : i32 = {
+            val result : i32 = {
+                val doubled : i32 = w * 2
+                -> doubled * h
+            }
+            return result
+        }
+        """
+        args = (ctypes.c_int32, ctypes.c_int32)
+        assert run(source, "area", argtypes=args, args=(3, 4)) == 24
+
+    def test_logical_operators_short_circuit(self):
+        source = """
+        func check(a : i32, b : i32) : bool = {
+            return a != 0 && 10 \\ a > b || !(b < 0)
+        }
+        """
+        args = (ctypes.c_int32, ctypes.c_int32)
+        # a == 0 must not evaluate 10 \\ a
+        assert run(source, "check", ctypes.c_bool, args, (0, -1)) is False
+        assert run(source, "check", ctypes.c_bool, args, (2, 3))
+        assert run(source, "check", ctypes.c_bool, args, (2, 7))
+
+
+class TestArrayCodegen:
+    """Test fixed-size arrays"""
+
+    def test_runtime_index_is_bounds_checked(self):
+        source = """
+        func pick(i : usize) : i32 = {
+            val values : [4]i32 = [10, 20, 30, 40]
+            return values[i]
+        }
+        """
+        args = (ctypes.c_uint64,)
+        assert run(source, "pick", argtypes=args, args=(2,)) == 30
+        ir_text = str(compile_module(generate(source)))
+        assert "icmp ult i64" in ir_text and "call void @llvm.trap()" in ir_text
+
+    def test_constant_index_is_checked_at_compile_time(self):
+        source = """
+        func main() : i32 = {
+            val values : [3]i32 = [1, 2, 3]
+            return values[2]
+        }
+        """
+        assert run(source) == 3
+        assert "llvm.trap" not in str(generate(source))
+
+        ast = HexenParser().parse(source.replace("values[2]", "values[5]"))
+        with pytest.raises(CodegenError, match="index 5 out of bounds for length 3"):
+            CodeGenerator().generate(ast)
+
+    def test_multidimensional_array_and_length(self):
+        source = """
+        func trace(i : i32) : f64 = {
+            val m : [2][2]f64 = [[1.5, 2.0], [3.0, 4.5]]
+            val n = m.length
+            return m[i][i] + m[0][1] * n
+        }
+        """
+        args = (ctypes.c_int32,)
+        assert run(source, "trace", ctypes.c_double, args, (1,)) == 4.5 + 4.0
+
+    def test_comptime_array_indexed_at_runtime(self):
+        source = """
+        func pick(i : i64) : i64 = {
+            val primes = [2, 3, 5, 7]
+            return primes[i]
+        }
+        """
+        args = (ctypes.c_int64,)
+        assert run(source, "pick", ctypes.c_int64, args, (3,)) == 7
+
+    def test_arrays_are_passed_and_copied_by_value(self):
+        source = """
+        func sum(values : [3]i32) : i32 = {
+            return values[0] + values[1] + values[2]
+        }
+        func main() : i32 = {
+            mut values : [3]i32 = [1, 2, 3]
+            val copy : [3]i32 = values[..]
+            values = [10, 20, 30]
+            return sum(copy[..]) * 100 + sum(values[..])
+        }
+        """
+        assert run(source) == 600 + 60
+
+    def test_constant_arrays_become_read_only_globals(self):
+        source = """
+        func pick(i : usize) : i64 = {
+            val table : [4]i64 = [10, 20, 30, 40]
+            val primes = [2, 3, 5, 7]
+            mut work : [4]i64 = [10, 20, 30, 40]
+            work = [1, 2, 3, 4]
+            return table[i] + primes[i] + work[i]
+        }
+        """
+        args = (ctypes.c_uint64,)
+        assert run(source, "pick", ctypes.c_int64, args, (2,)) == 30 + 5 + 3
+        ir_text = str(generate(source))
+        # table and the initial value of work share one global
+        assert ir_text.count("private unnamed_addr constant [4 x i64]") == 3
+        assert ir_text.count('call void @"llvm.memcpy.p0.p0.i64"') == 2
+        assert "insertvalue" not in ir_text and "store" not in ir_text
+        # The copy length comes from the target's data layout
+        assert "ptrtoint" in ir_text and "i64 32" not in ir_text
+
+    def test_range_materialization(self):
+        source = """
+        func at(i : usize) : f64 = {
+            val evens : [_]i64 = [0..10:2]
+            val odds = [1..=9:2]
+            val quarters : [_]f64 = [0.0..=1.0:0.25]
+            return evens[i]:f64 + odds[i]:f64 + quarters[i]
+        }
+        """
+        args = (ctypes.c_uint64,)
+        assert run(source, "at", ctypes.c_double, args, (3,)) == 6 + 7 + 0.75
+        assert "[5 x double]" in str(generate(source))
+
+    def test_large_lookup_table(self):
+        source = """
+        func lookup(i : usize) : i32 = {
+            val table : [_]i32 = [0..4096]
+            return table[i]
+        }
+        """
+        args = (ctypes.c_uint64,)
+        assert run(source, "lookup", argtypes=args, args=(4095,)) == 4095
+        # The table is data: the function body stays a bounds check and a load
+        function = str(generate(source)).split("define")[1].split("\n}")[0]
+        assert len(function.splitlines()) < 20
+
+
+class TestUnsupportedCodegen:
+    """Test constructs rejected by code generation"""
+
+    def test_strings_are_rejected(self):
+        source = """
+        func main() : i32 = {
+            val name : string = "hexen"
+            return 0
+        }
+        """
+        with pytest.raises(CodegenError, match="not supported"):
+            CodeGenerator().generate(HexenParser().parse(source))
+
+    def test_generator_is_reusable(self):
+        generator = CodeGenerator()
+        for source in (TestControlFlowCodegen.SIGN, "func f() : i32 = { return 1 }"):
+            module = generator.generate(HexenParser().parse(source))
+            compile_module(module)
+        assert [function.name for function in module.functions] == ["f"]
+
+
+class TestBuildCommand:
+    """Test `hexen build`"""
+
+    SOURCE = """
+    func square(x : i32) : i32 = {
+        return x * x
+    }
+    func main() : i32 = {
+        return square(6) - 1
+    }
+    """
+
+    def _build(self, monkeypatch, capsys, *args):
+        monkeypatch.setattr(sys, "argv", ["hexen", "build", *args])
+        code = 0
+        try:
+            cli.main()
+        except SystemExit as exit_info:
+            code = exit_info.code
+        return code, capsys.readouterr().out
+
+    def test_build_object_and_ir(self, tmp_path, monkeypatch, capsys):
+        source = tmp_path / "square.hxn"
+        source.write_text(self.SOURCE)
+
+        code, output = self._build(monkeypatch, capsys, str(source))
+        assert code == 0 and "✅ Wrote" in output
+        assert (tmp_path / "square.o").read_bytes()[:4] == b"\x7fELF"
+
+        ir_path = tmp_path / "out.ll"
+        code, _ = self._build(
+            monkeypatch, capsys, str(source), "--emit=llvm", f"--output={ir_path}"
+        )
+        assert code == 0
+        assert "define i32 @square(i32 %x)" in ir_path.read_text()
+
+    def test_optimization_level(self, tmp_path, monkeypatch, capsys):
+        source = tmp_path / "square.hxn"
+        source.write_text(self.SOURCE)
+        ir_path = tmp_path / "square.ll"
+
+        self._build(monkeypatch, capsys, str(source), "--emit=llvm", "-O0")
+        assert "call i32 @square(i32 6)" in ir_path.read_text()
+        # -O2 (the default) inlines the call and folds main to a constant
+        code, _ = self._build(monkeypatch, capsys, str(source), "--emit=llvm")
+        assert code == 0
+        assert "call i32 @square" not in ir_path.read_text()
+        assert "ret i32 35" in ir_path.read_text()
+
+    def test_time_passes(self, tmp_path, monkeypatch, capsys):
+        source = tmp_path / "square.hxn"
+        source.write_text(self.SOURCE)
+        code, output = self._build(monkeypatch, capsys, str(source), "--time-passes")
+        if PASS_TIMING_SUPPORTED:
+            assert code == 0 and "Pass execution timing report" in output
+        else:
+            assert code == 1 and "requires llvmlite 0.45" in output
+            assert not (tmp_path / "square.o").exists()
+
+    @pytest.mark.skipif(shutil.which("cc") is None, reason="no C compiler to link")
+    def test_linked_executable(self, tmp_path, monkeypatch, capsys):
+        source = tmp_path / "square.hxn"
+        source.write_text(self.SOURCE)
+        self._build(monkeypatch, capsys, str(source))
+        executable = tmp_path / "square"
+        subprocess.run(["cc", str(tmp_path / "square.o"), "-o", str(executable)])
+        assert subprocess.run([str(executable)]).returncode == 35
+
+    def test_semantic_errors_stop_the_build(self, tmp_path, monkeypatch, capsys):
+        source = tmp_path / "broken.hxn"
+        source.write_text(self.SOURCE.replace("square(6) - 1", "square(6):i64"))
+        code, output = self._build(monkeypatch, capsys, str(source))
+        assert code == 1 and "Semantic errors found" in output
+        assert not (tmp_path / "broken.o").exists()
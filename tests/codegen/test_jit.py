@@ -0,0 +1,157 @@
+"""
+Test module for JIT execution
+
+Tests JitProgram (calling generated functions in-process at every
+optimization level, with arguments and results of every scalar type,
+rejected calls) and the `hexen run` command with its entry option,
+optimization flags and timing reports.
+"""
+
+import sys
+
+import pytest
+
+from src.hexen import cli
+from src.hexen.codegen import (
+    OPT_LEVELS,
+    PASS_TIMING_SUPPORTED,
+    CodegenError,
+    JitProgram,
+    compile_module,
+    host_target_machine,
+    optimize,
+)
+from src.hexen.parser import HexenParser
+
+from . import generate
+
+SOURCE = """
+func fib(n : i32) : i32 = {
+    if n < 2 {
+        return n
+    }
+    return fib(n - 1) + fib(n - 2)
+}
+func scale(x : f64, factor : usize) : f64 = {
+    return x * factor:f64
+}
+func is_big(x : i64) : bool = {
+    return x > 1000000
+}
+func first(values : [3]i32) : i32 = {
+    return values[0]
+}
+func main() : i32 = {
+    return fib(10)
+}
+"""
+
+
+def _program(source, opt_level=None, cpu=""):
+    machine = host_target_machine(cpu)
+    compiled = compile_module(generate(source), machine)
+    if opt_level is not None:
+        optimize(compiled, machine, opt_level)
+    return JitProgram(compiled, HexenParser().parse(source), machine)
+
+
+class TestJitProgram:
+    """Test calling JIT-compiled functions"""
+
+    @pytest.mark.parametrize("opt_level", [None, *OPT_LEVELS])
+    def test_call_at_each_optimization_level(self, opt_level):
+        program = _program(SOURCE, opt_level)
+        assert program.call("main") == 55
+        assert program.call("fib", 20) == 6765
+
+    def test_native_cpu(self):
+        assert _program(SOURCE, "3", cpu="native").call("scale", 2.5, 2) == 5.0
+
+    def test_scalar_arguments_and_results(self):
+        program = _program(SOURCE)
+        assert program.call("scale", 1.5, 4) == 6.0
+        assert program.call("is_big", 2**40) is True
+        assert program.call("is_big", -(2**40)) is False
+
+    def test_remainder(self):
+        program = _program(
+            """
+            func srem(k : i32, d : i32) : i32 = {
+                return k % d
+            }
+            func urem(u : usize, d : usize) : usize = {
+                return u % d
+            }
+            func frem(f : f64) : f64 = {
+                return f % 2.0
+            }
+            func folded() : i32 = {
+                val k : i32 = -7
+                val m : i32 = k % 3
+                return m + -7 % 3
+            }
+            """
+        )
+        assert program.call("srem", -7, 3) == -1
+        assert program.call("srem", 7, -3) == 1
+        assert program.call("urem", 2**63 + 3, 4) == 3
+        assert program.call("frem", -7.5) == -1.5
+        assert program.call("folded") == -2
+
+    def test_rejected_calls(self):
+        program = _program(SOURCE)
+        with pytest.raises(CodegenError, match="No function named 'missing'"):
+            program.call("missing")
+        with pytest.raises(CodegenError, match="expects 1 argument"):
+            program.call("fib")
+        with pytest.raises(CodegenError, match="not supported at the entry point"):
+            program.call("first", [1, 2, 3])
+
+
+class TestRunCommand:
+    """Test `hexen run`"""
+
+    def _run(self, monkeypatch, capsys, *args):
+        monkeypatch.setattr(sys, "argv", ["hexen", "run", *args])
+        code = 0
+        try:
+            cli.main()
+        except SystemExit as exit_info:
+            code = exit_info.code
+        return code, capsys.readouterr().out
+
+    def test_run_entry_and_report_timings(self, tmp_path, monkeypatch, capsys):
+        source = tmp_path / "fib.hxn"
+        source.write_text(SOURCE)
+
+        code, output = self._run(monkeypatch, capsys, str(source))
+        assert code == 0 and "✅ main() returned 55" in output
+        for phase in ("parse", "check", "IR generation", "LLVM optimization"):
+            assert f"{phase}:" in output
+        assert "execution:" in output
+
+        code, output = self._run(monkeypatch, capsys, str(source), "--entry=fib")
+        assert code == 1 and "expects 1 argument(s), got 0" in output
+
+    def test_optimization_flags(self, tmp_path, monkeypatch, capsys):
+        source = tmp_path / "fib.hxn"
+        source.write_text(SOURCE)
+
+        args = (str(source), "-O3", "--mcpu=native")
+        code, output = self._run(monkeypatch, capsys, *args)
+        assert code == 0 and "Timings (-O3)" in output
+
+        code, output = self._run(monkeypatch, capsys, *args, "--time-passes")
+        if PASS_TIMING_SUPPORTED:
+            assert code == 0 and "Pass execution timing report" in output
+        else:
+            assert code == 1 and "requires llvmlite 0.45" in output
+
+        code, output = self._run(monkeypatch, capsys, str(source), "-O4")
+        assert code == 1 and "Optimization levels: -O0" in output
+
+    def test_void_entry(self, tmp_path, monkeypatch, capsys):
+        source = tmp_path / "void.hxn"
+        source.write_text("func main() : void = {\n    return\n}\n")
+        code, output = self._run(monkeypatch, capsys, str(source))
+        assert code == 0 and "✅ main() finished" in output
@@ -0,0 +1,154 @@
+"""
+Test module for the JIT object cache
+
+Tests that JitProgram loads cached machine code instead of compiling an
+unchanged module, that keys depend on the IR, target and optimization
+level, and that the cache survives damaged entries and evicts
+least-recently-used entries.
+"""
+
+import os
+import sys
+
+import pytest
+
+from src.hexen import cli
+from src.hexen.codegen import (
+    JitProgram,
+    ObjectCache,
+    compile_module,
+    host_target_machine,
+    optimize,
+)
+from src.hexen.parser import HexenParser
+
+from . import generate
+
+SOURCE = """
+func triple(x : i64) : i64 = {
+    return x * 3
+}
+func main() : i32 = {
+    return 14
+}
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ObjectCache(cache_dir=tmp_path / "jit")
+
+
+def _jit(source, cache):
+    """JIT a program through the cache, as `hexen run --jit-cache` does"""
+    machine = host_target_machine()
+    compiled = compile_module(generate(source), machine)
+    key = cache.key(str(compiled), machine.triple, opt_level="2")
+    object_code = cache.get(key)
+    if object_code is None:
+        optimize(compiled, machine)
+    program = JitProgram(
+        compiled,
+        HexenParser().parse(source),
+        machine,
+        object_code,
+        lambda code: cache.put(key, code),
+    )
+    return program, key
+
+
+class TestObjectCache:
+    """Test object cache storage, lookup and invalidation"""
+
+    def test_jit_stores_and_reuses_machine_code(self, cache):
+        """The second JIT of an unchanged module loads the cached object"""
+        program, key = _jit(SOURCE, cache)
+        assert program.call("triple", 5) == 15
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert cache.get(key)
+
+        program, _ = _jit(SOURCE, cache)
+        assert program.call("triple", 7) == 21 and program.call("main") == 14
+        assert cache.hits == 2
+
+    def test_cached_code_is_what_runs(self, cache):
+        """A hit runs the stored object, not the module handed to the JIT"""
+        _, key = _jit(SOURCE, cache)
+        machine = host_target_machine()
+        other = SOURCE.replace("x * 3", "x * 4")
+        compiled = compile_module(generate(other), machine)
+        program = JitProgram(
+            compiled, HexenParser().parse(other), machine, cache.get(key)
+        )
+        assert program.call("triple", 5) == 15
+
+    def test_key_depends_on_ir_target_and_level(self, cache):
+        """Any change to the module or the target gets its own entry"""
+        base = ("ir", "x86_64-unknown-linux-gnu", "skylake", "", "2")
+        changes = [
+            ("ir2", *base[1:]),
+            ("ir", "aarch64-unknown-linux-gnu", *base[2:]),
+            (*base[:2], "znver4", *base[3:]),
+            (*base[:3], "-avx", "2"),
+            (*base[:4], "3"),
+        ]
+        keys = {cache.key(*base), *(cache.key(*changed) for changed in changes)}
+        assert len(keys) == 1 + len(changes)
+
+    def test_damaged_entry_is_dropped(self, cache):
+        """Corrupted entries are treated as misses and removed"""
+        cache.put("key", b"object code")
+        entry = cache.cache_dir / "key.o"
+        data = bytearray(entry.read_bytes())
+        data[-1] ^= 0xFF
+        entry.write_bytes(bytes(data))
+
+        assert cache.get("key") is None
+        assert not entry.exists()
+
+    def test_lru_eviction_under_budget(self, tmp_path):
+        """Oldest entries are evicted once the size budget is exceeded"""
+        probe = ObjectCache(cache_dir=tmp_path / "probe")
+        probe.put("probe", b"x" * 100)
+        entry_size = (probe.cache_dir / "probe.o").stat().st_size
+
+        cache = ObjectCache(cache_dir=tmp_path / "jit", max_bytes=entry_size * 3)
+        for i in range(3):
+            cache.put(f"k{i}", b"x" * 100)
+            os.utime(cache.cache_dir / f"k{i}.o", (1000 + i, 1000 + i))
+
+        # Touch the oldest entry so the second one becomes least recent
+        assert cache.get("k0") is not None
+        cache.put("k3", b"x" * 100)
+
+        assert cache.get("k1") is None
+        assert all(cache.get(key) is not None for key in ("k0", "k2", "k3"))
+
+    def test_disabled_cache_is_noop(self, monkeypatch):
+        """Without a cache directory the cache never stores anything"""
+        monkeypatch.setenv("HEXEN_CACHE_DIR", "")
+        cache = ObjectCache()
+        cache.put("key", b"object code")
+        assert cache.get("key") is None
+
+
+class TestRunCaching:
+    """Test `hexen run --jit-cache`"""
+
+    def test_warm_run_uses_cached_machine_code(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("HEXEN_CACHE_DIR", str(tmp_path / "cache"))
+        source = tmp_path / "main.hxn"
+        source.write_text(SOURCE)
+        monkeypatch.setattr(sys, "argv", ["hexen", "run", str(source), "--jit-cache"])
+
+        cli.main()
+        assert "cached machine code" not in capsys.readouterr().out
+        cli.main()
+        output = capsys.readouterr().out
+        assert "✅ main() returned 14" in output
+        assert "Timings (-O2, cached machine code)" in output
+
+        # Another optimization level compiles afresh
+        monkeypatch.setattr(sys, "argv", [*sys.argv, "-O0"])
+        cli.main()
+        assert "cached machine code" not in capsys.readouterr().out
@@ -0,0 +1,49 @@
+"""
+Shared pytest configuration for the Hexen test suite.
+
+Adds the --parser-mode option so the whole suite can be run against the
+LALR parser, or in differential mode where every parse is done by both the
+LALR and the reference Earley parser and any disagreement fails the test:
+
+    pytest tests/parser --parser-mode=differential
+
+and the --typed-ast flag, which makes every parser return slotted typed
+nodes (hexen.typed_ast) so the analyzers are exercised on both AST forms.
+
+The --flatten-chains flag makes every parser build n-ary nodes for
+same-operator associative chains, so the analyzers are checked to give the
+same results on flattened ASTs.
+"""
+
+from src.hexen.parser import HexenParser
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--parser-mode",
+        choices=HexenParser.MODES,
+        default=None,
+        help="Parser mode used by every HexenParser() built in tests",
+    )
+    parser.addoption(
+        "--typed-ast",
+        action="store_true",
+        default=False,
+        help="Make every HexenParser() built in tests return typed AST nodes",
+    )
+    parser.addoption(
+        "--flatten-chains",
+        action="store_true",
+        default=False,
+        help="Make every HexenParser() built in tests flatten associative chains",
+    )
+
+
+def pytest_configure(config):
+    mode = config.getoption("--parser-mode")
+    if mode:
+        HexenParser.DEFAULT_MODE = mode
+    if config.getoption("--typed-ast"):
+        HexenParser.DEFAULT_TYPED_AST = True
+    if config.getoption("--flatten-chains"):
+        HexenParser.DEFAULT_FLATTEN_CHAINS = True
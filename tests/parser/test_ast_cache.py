@@ -0,0 +1,178 @@
+"""
+Test module for the content-addressed AST cache
+
+Tests that HexenParser.parse_file reuses cached ASTs for unchanged sources
+without invoking Lark, and that the cache invalidates on parser changes,
+survives damaged entries and evicts least-recently-used entries.
+"""
+
+import os
+
+import pytest
+
+from src.hexen import ast_cache as ast_cache_module
+from src.hexen.ast_cache import ASTCache
+from src.hexen.parser import HexenParser
+
+SOURCE = """
+func main() : i32 = {
+    val values : [3]i32 = [1, 2, 3]
+    val x : i32 = -values[0] * 2
+    return x
+}
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ASTCache(cache_dir=tmp_path / "ast")
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "main.hxn"
+    path.write_text(SOURCE)
+    return path
+
+
+class TestASTCache:
+    """Test AST cache storage, lookup and invalidation"""
+
+    def test_round_trip(self, cache):
+        """A stored AST loads back equal to the original"""
+        ast = HexenParser().parse(SOURCE)
+        assert cache.get(SOURCE) is None
+        cache.put(SOURCE, ast)
+        assert cache.get(SOURCE) == ast
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_depends_on_source(self, cache):
+        """Different sources never share an entry"""
+        assert cache.key(SOURCE) != cache.key(SOURCE + " ")
+
+    def test_key_depends_on_parser_fingerprint(self, cache, monkeypatch):
+        """A grammar or transformer change invalidates existing entries"""
+        cache.put(SOURCE, HexenParser().parse(SOURCE))
+        monkeypatch.setattr(ast_cache_module, "parser_fingerprint", lambda: "v2")
+        assert cache.get(SOURCE) is None
+
+    def test_damaged_entry_is_dropped(self, cache):
+        """Corrupted entries are treated as misses and removed"""
+        cache.put(SOURCE, HexenParser().parse(SOURCE))
+        entry = cache.cache_dir / f"{cache.key(SOURCE)}.ast"
+        data = bytearray(entry.read_bytes())
+        data[-1] ^= 0xFF
+        entry.write_bytes(bytes(data))
+
+        assert cache.get(SOURCE) is None
+        assert not entry.exists()
+
+    def test_lru_eviction_under_budget(self, tmp_path):
+        """Oldest entries are evicted once the size budget is exceeded"""
+        parser = HexenParser()
+        sources = [f"val x{i} : i32 = {i}" for i in range(4)]
+        asts = [parser.parse(source) for source in sources]
+
+        probe = ASTCache(cache_dir=tmp_path / "probe")
+        probe.put(sources[0], asts[0])
+        entry_size = next(probe.cache_dir.glob("*.ast")).stat().st_size
+
+        cache = ASTCache(cache_dir=tmp_path / "ast", max_bytes=entry_size * 3)
+        for i, (source, ast) in enumerate(zip(sources[:3], asts[:3])):
+            cache.put(source, ast)
+            entry = cache.cache_dir / f"{cache.key(source)}.ast"
+            os.utime(entry, (1000 + i, 1000 + i))
+
+        # Touch the oldest entry so the second one becomes least recent
+        assert cache.get(sources[0]) == asts[0]
+        cache.put(sources[3], asts[3])
+
+        assert cache.get(sources[1]) is None
+        assert cache.get(sources[0]) == asts[0]
+        assert cache.get(sources[2]) == asts[2]
+        assert cache.get(sources[3]) == asts[3]
+
+    def test_directory_scanned_only_past_budget(self, cache, monkeypatch):
+        """Puts under the size budget do not rescan the cache directory"""
+        scans = []
+        scan = cache._scan
+        monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or scan())
+        parser = HexenParser()
+        for i in range(20):
+            source = f"val x{i} : i32 = {i}"
+            cache.put(source, parser.parse(source))
+        assert len(scans) == 1
+
+        cache.max_bytes = 0
+        cache.put(SOURCE, parser.parse(SOURCE))
+        assert len(scans) == 2
+        assert list(cache.cache_dir.glob("*.ast")) == []
+
+    def test_disabled_cache_is_noop(self, monkeypatch):
+        """Without a cache directory the cache never stores anything"""
+        monkeypatch.setenv("HEXEN_CACHE_DIR", "")
+        cache = ASTCache()
+        cache.put(SOURCE, {"type": "program", "functions": []})
+        assert cache.get(SOURCE) is None
+
+
+class TestParseFileCaching:
+    """Test parse_file integration with the AST cache"""
+
+    def test_parse_file_populates_and_reuses_cache(self, cache, source_file):
+        """A second parse_file of an unchanged file skips Lark entirely"""
+        parser = HexenParser(mode="lalr-treeless", ast_cache=cache)
+        first = parser.parse_file(str(source_file))
+
+        class ExplodingLark:
+            def parse(self, source_code):
+                raise AssertionError("source was re-parsed")
+
+        parser.parser = ExplodingLark()
+        assert parser.parse_file(str(source_file)) == first
+        assert cache.hits == 1
+
+    @pytest.mark.parametrize("mode", HexenParser.MODES)
+    def test_cache_hit_never_builds_a_parser(self, cache, source_file, mode):
+        """Lark parsers are only built on the first cache miss"""
+        for _ in range(2):
+            parser = HexenParser(mode=mode, ast_cache=cache, track_spans=True)
+            parser.parse_file(str(source_file))
+        assert cache.hits == 1
+        assert parser._parser is None
+        assert parser._reference_parser is None
+
+        parser.parse(SOURCE)
+        assert parser._parser is not None
+
+    def test_changed_file_is_reparsed(self, cache, source_file):
+        """Editing the file produces a fresh AST"""
+        parser = HexenParser(ast_cache=cache)
+        first = parser.parse_file(str(source_file))
+
+        source_file.write_text(SOURCE.replace("* 2", "* 3"))
+        second = parser.parse_file(str(source_file))
+
+        assert second != first
+        assert second == HexenParser().parse(source_file.read_text())
+
+    def test_parser_modes_do_not_share_entries(self, cache, tmp_path):
+        """Each parser mode stores and loads its own entry for a source"""
+        path = tmp_path / "bare_return.hxn"
+        path.write_text("func f() : void = {\n mut x : i32 = 0\n return\n x = 5\n}\n")
+        earley_ast = HexenParser(mode="earley", ast_cache=cache).parse_file(str(path))
+        lalr_ast = HexenParser(mode="lalr-treeless", ast_cache=cache).parse_file(
+            str(path)
+        )
+        assert lalr_ast == earley_ast
+        assert len(list(cache.cache_dir.glob("*.ast"))) == 2
+
+    def test_syntax_errors_are_not_cached(self, cache, tmp_path):
+        """Invalid sources raise every time and leave no entry behind"""
+        path = tmp_path / "broken.hxn"
+        path.write_text("func main() : i32 = { return 42")
+        parser = HexenParser(ast_cache=cache)
+        for _ in range(2):
+            with pytest.raises(SyntaxError):
+                parser.parse_file(str(path))
+        assert list(cache.cache_dir.glob("*.ast")) == []
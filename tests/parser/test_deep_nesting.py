@@ -0,0 +1,134 @@
+"""
+Test module for parsing very deeply nested sources
+
+Lark's default Transformer recurses once per parse-tree level. Tests that
+NonRecursiveHexenTransformer builds exactly the same AST as the recursive
+HexenTransformer, that the tree-building and typed-AST paths handle nesting
+far beyond the recursion limit, and stress-parses a program nested 50k
+levels deep under a fixed address-space budget.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.hexen.parser import (
+    HexenParser,
+    HexenTransformer,
+    NonRecursiveHexenTransformer,
+)
+from src.hexen.typed_ast import to_typed_ast
+
+from .test_parser_modes import PARITY_SOURCES
+
+STRESS_LEVELS = 50_000
+STRESS_MEMORY_BUDGET_MIB = 512
+
+
+def _nested_source(levels: int) -> str:
+    """A function nesting parentheses, expression blocks and conditionals"""
+    cycles = levels // 3
+    return (
+        "func main() : i32 = {\n"
+        + "val v : i32 = ({ if true { " * cycles
+        + "val w = 1"
+        + " } -> 1 })" * cycles
+        + "\nreturn 0\n}\n"
+    )
+
+
+def _nesting_depth(ast) -> int:
+    """Number of (block, conditional) cycles in a _nested_source AST"""
+    depth = 0
+    statement = ast["functions"][0]["body"]["statements"][0]
+    while statement["value"]["type"] == "block":
+        conditional = statement["value"]["statements"][0]
+        statement = conditional["if_branch"]["statements"][0]
+        depth += 1
+    return depth
+
+
+class TestNonRecursiveTransformer:
+    """Test that the non-recursive walk matches the recursive one"""
+
+    @pytest.mark.parametrize("mode", ["earley", "lalr"])
+    @pytest.mark.parametrize("source", PARITY_SOURCES)
+    def test_identical_ast(self, mode, source):
+        tree = HexenParser(mode=mode).parser.parse(source)
+        assert NonRecursiveHexenTransformer().transform(tree) == (
+            HexenTransformer().transform(tree)
+        )
+
+    def test_parser_uses_non_recursive_transformer(self):
+        parser = HexenParser(mode="lalr")
+        assert isinstance(parser.transformer, NonRecursiveHexenTransformer)
+
+    def test_identical_ast_for_nested_source(self):
+        # Shallow enough for the recursive transformer and for == on the ASTs
+        source = _nested_source(30)
+        tree = HexenParser(mode="lalr").parser.parse(source)
+        ast = NonRecursiveHexenTransformer().transform(tree)
+        assert ast == HexenTransformer().transform(tree)
+        assert ast == HexenParser(mode="lalr-treeless", typed_ast=False).parse(source)
+        assert HexenParser(mode="lalr", typed_ast=True).parse(source) == (
+            to_typed_ast(ast)
+        )
+
+    def test_nesting_beyond_recursion_limit(self):
+        levels = 3 * sys.getrecursionlimit()
+        source = _nested_source(levels)
+        tree = HexenParser(mode="lalr").parser.parse(source)
+        with pytest.raises(RecursionError):
+            HexenTransformer().transform(tree)
+
+        ast = HexenParser(mode="lalr", typed_ast=False).parse(source)
+        assert _nesting_depth(ast) == levels // 3
+
+        parser = HexenParser(mode="lalr", typed_ast=True, track_spans=True)
+        typed = parser.parse(source)
+        function = typed["functions"][0]
+        assert parser.source_map.span(function) == (0, len(source) - 1)
+        assert _nesting_depth(typed.to_dict()) == levels // 3
+
+
+class TestDeepNestingStress:
+    """Stress-parse 50k nesting levels within a fixed memory budget"""
+
+    def test_fifty_thousand_levels(self):
+        resource = pytest.importorskip("resource")
+        if not hasattr(resource, "RLIMIT_AS"):
+            pytest.skip("address-space limits are not supported")
+
+        # Run in a child process so the limit does not affect the test run
+        budget = STRESS_MEMORY_BUDGET_MIB << 20
+        script = f"""
+import resource
+resource.setrlimit(resource.RLIMIT_AS, ({budget}, {budget}))
+
+from src.hexen.parser import HexenParser
+from src.hexen.typed_ast import to_typed_ast
+from tests.parser.test_deep_nesting import _nested_source, _nesting_depth
+
+source = _nested_source({STRESS_LEVELS})
+ast = HexenParser(mode="lalr", typed_ast=False).parse(source)
+assert _nesting_depth(ast) == {STRESS_LEVELS // 3}
+to_typed_ast(ast)
+"""
+        start_time = time.time()
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            timeout=600,
+        )
+        elapsed = time.time() - start_time
+
+        assert result.returncode == 0, result.stderr
+        print(
+            f"✅ Parsed {STRESS_LEVELS} nesting levels (dict AST + typed "
+            f"conversion) in {elapsed:.2f}s within {STRESS_MEMORY_BUDGET_MIB} MiB"
+        )
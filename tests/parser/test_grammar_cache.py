@@ -0,0 +1,93 @@
+"""
+Test module for the compiled-grammar cache
+
+Tests that Lark parsers are built once per process and shared between
+HexenParser instances, and that LALR tables are persisted to a versioned
+on-disk cache that is reused across processes and invalidated on change.
+"""
+
+import lark
+import pytest
+
+from src.hexen import parser as parser_module
+from src.hexen.cache import get_cache_dir
+from src.hexen.parser import HexenParser
+
+SOURCE = """
+func main() : i32 = {
+    val x : i32 = -2 * 3
+    return x
+}
+"""
+
+
+@pytest.fixture
+def fresh_cache(tmp_path, monkeypatch):
+    """Point the grammar cache at an empty directory with no shared parsers"""
+    monkeypatch.setenv("HEXEN_CACHE_DIR", str(tmp_path))
+    parser_module._get_lalr_parser.cache_clear()
+    yield tmp_path
+    parser_module._get_lalr_parser.cache_clear()
+
+
+class TestSharedParsers:
+    """Test process-wide sharing of compiled Lark parsers"""
+
+    @pytest.mark.parametrize("mode", ["earley", "lalr", "lalr-treeless"])
+    def test_parsers_shared_between_instances(self, mode):
+        """Constructing another HexenParser reuses the compiled grammar"""
+        assert HexenParser(mode=mode).parser is HexenParser(mode=mode).parser
+
+    def test_tree_and_treeless_parsers_are_distinct(self):
+        """Only the tree-less parser carries an inline transformer"""
+        tree_parser = HexenParser(mode="lalr").parser
+        treeless_parser = HexenParser(mode="lalr-treeless").parser
+        assert tree_parser is not treeless_parser
+        assert tree_parser.options.transformer is None
+        assert treeless_parser.options.transformer is not None
+
+
+class TestGrammarDiskCache:
+    """Test the persistent LALR table cache"""
+
+    def test_cache_file_written_and_reused(self, fresh_cache):
+        """First build writes the cache; a rebuild loads identical tables"""
+        expected = HexenParser(mode="lalr-treeless").parse(SOURCE)
+
+        cache_files = list((fresh_cache / "grammar").glob("hexen_lalr-*.lark"))
+        assert len(cache_files) == 1
+
+        # Simulate a new process: drop the in-memory parsers and reload
+        parser_module._get_lalr_parser.cache_clear()
+        assert HexenParser(mode="lalr-treeless").parse(SOURCE) == expected
+        assert HexenParser(mode="lalr").parse(SOURCE) == expected
+        assert list((fresh_cache / "grammar").glob("*.lark")) == cache_files
+
+    def test_cache_key_tracks_grammar_and_lark_version(self, fresh_cache, monkeypatch):
+        """Editing the grammar or upgrading lark selects a new cache file"""
+        grammar = parser_module._load_grammar("hexen_lalr.lark")
+        original = parser_module._grammar_cache_file("hexen_lalr.lark", grammar)
+
+        edited = parser_module._grammar_cache_file("hexen_lalr.lark", grammar + "\n")
+        assert edited != original
+
+        monkeypatch.setattr(lark, "__version__", "0.0.0")
+        upgraded = parser_module._grammar_cache_file("hexen_lalr.lark", grammar)
+        assert upgraded != original
+
+    def test_corrupt_cache_file_is_rebuilt(self, fresh_cache):
+        """A damaged cache file is ignored rather than breaking the parser"""
+        grammar = parser_module._load_grammar("hexen_lalr.lark")
+        cache_file = parser_module._grammar_cache_file("hexen_lalr.lark", grammar)
+        with open(cache_file, "wb") as f:
+            f.write(b"not a lark cache\n")
+
+        ast = HexenParser(mode="lalr").parse(SOURCE)
+        assert ast == HexenParser(mode="earley").parse(SOURCE)
+
+    def test_disabled_cache(self, monkeypatch):
+        """An empty HEXEN_CACHE_DIR disables disk caching"""
+        monkeypatch.setenv("HEXEN_CACHE_DIR", "")
+        assert get_cache_dir("grammar") is None
+        grammar = parser_module._load_grammar("hexen_lalr.lark")
+        assert parser_module._grammar_cache_file("hexen_lalr.lark", grammar) is None
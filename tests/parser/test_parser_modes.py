@@ -0,0 +1,222 @@
+"""
+Test module for Hexen parser modes
+
+Tests that the deterministic LALR parser (hexen_lalr.lark), with or without
+an intermediate parse tree, builds exactly the same AST as the reference
+Earley parser (hexen.lark), and that the differential mode catches any
+disagreement between the two.
+
+The full corpus can be run in differential mode with:
+    pytest tests/parser --parser-mode=differential
+"""
+
+import time
+import tracemalloc
+
+import pytest
+from lark import Lark
+
+from src.hexen.ast_nodes import NodeType
+from src.hexen.parser import HexenParser, _load_grammar
+
+# Representative sources covering every grammar area that differs between
+# the two grammar files or relies on the contextual lexer
+PARITY_SOURCES = [
+    # Functions, parameters, returns
+    """
+    func add(a: i32, mut b: i64) : i64 = {
+        b = b + a:i64
+        return b
+    }
+    func noop() : void = {
+        return
+    }
+    """,
+    # Signed literals always become unary operations
+    """
+    func main() : i32 = {
+        val a = -42
+        val b = -2.5
+        val c = 2 * -3
+        val d = -(-0x1F)
+        val e = 1.5e3 - -2e-2
+        return 0
+    }
+    """,
+    # undef is an identifier in both grammars
+    """
+    func main() : i32 = {
+        val x : i32 = undef
+        mut y : [3]f64 = undef
+        return 0
+    }
+    """,
+    # Conversions versus range steps
+    """
+    val arr : [5]i32 = [1, 2, 3, 4, 5]
+    val a = arr[1..4]
+    val b = arr[..3]
+    val c = arr[2..]
+    val d = arr[..]
+    val e = arr[4..0:-1]
+    val r : range[i32] = 1..=10:2
+    val f = (1..10):range[i64]
+    val g = arr[0]:f64
+    val h = [1, 2]:[_]i64
+    """,
+    # Relational, logical and equality chains
+    """
+    func check(a: i32, b: i32) : bool = {
+        return a < b && b >= 0 || !(a == b) && a != 3
+    }
+    """,
+    # Conditionals in statement and expression position, expression blocks
+    """
+    func pick(flag: bool) : i32 = {
+        val x : i32 = if flag { -> 1 } else if !flag { -> 2 } else { -> 3 }
+        val y : i32 = { val t = 10 \\ 3 -> t % 2 }
+        if x > y {
+            pick(!flag)
+        }
+        return x + y
+    }
+    """,
+    # Multidimensional arrays and properties
+    """
+    func sum(m: [_][_]i32) : usize = {
+        val rows = m.length
+        val row = m[0][..]
+        return rows
+    }
+    """,
+    # A bare return or open range ends before an assignment, even across
+    # lines, and otherwise takes the following expression as its operand
+    """
+    func f() : void = {
+        mut x : i32 = 0
+        return
+        x = 5
+    }
+    func g() : void = {
+        mut x : i32 = 0
+        val r = 1..
+        x = 5
+        val s = ..:2
+        x // comment
+            = x == 1
+        val t = 1..
+        foo()
+        return
+        if x > 0 { -> 1 } else { -> 2 }
+    }
+    """,
+]
+
+INVALID_SOURCES = [
+    "func main() : i32 = { return 42",
+    "val = 5",
+    "func main() : i32 = { val x : = 1 }",
+    "val x = 1 +",
+]
+
+
+class TestParserModes:
+    """Test parser mode selection and LALR/Earley parity"""
+
+    def test_default_mode_is_earley(self):
+        """The reference Earley parser stays the default"""
+        assert HexenParser.DEFAULT_MODE in HexenParser.MODES
+        assert HexenParser(mode="earley").mode == "earley"
+
+    def test_unknown_mode_rejected(self):
+        """Invalid modes fail loudly at construction time"""
+        with pytest.raises(ValueError, match="Unknown parser mode 'glr'"):
+            HexenParser(mode="glr")
+
+    @pytest.mark.parametrize("source", PARITY_SOURCES)
+    def test_lalr_matches_earley(self, source):
+        """LALR parser produces exactly the same AST dicts as Earley"""
+        earley_ast = HexenParser(mode="earley").parse(source)
+        lalr_ast = HexenParser(mode="lalr").parse(source)
+        assert lalr_ast == earley_ast
+
+    @pytest.mark.parametrize("source", PARITY_SOURCES)
+    def test_differential_mode_accepts_matching_parses(self, source):
+        """Differential mode returns the shared AST when both parsers agree"""
+        ast = HexenParser(mode="differential").parse(source)
+        assert ast == HexenParser(mode="earley").parse(source)
+
+    @pytest.mark.parametrize("source", INVALID_SOURCES)
+    def test_lalr_rejects_invalid_sources(self, source):
+        """Both modes reject the same invalid sources with SyntaxError"""
+        with pytest.raises(SyntaxError):
+            HexenParser(mode="lalr").parse(source)
+        with pytest.raises(SyntaxError):
+            HexenParser(mode="differential").parse(source)
+
+    def test_lalr_negative_literal_is_unary(self):
+        """The LALR grammar never folds the sign into the literal"""
+        ast = HexenParser(mode="lalr").parse("val x = -100")
+        value = ast["statements"][0]["value"]
+        assert value["type"] == NodeType.UNARY_OPERATION.value
+        assert value["operator"] == "-"
+        assert value["operand"]["value"] == 100
+
+    def test_differential_mode_reports_disagreement(self):
+        """A grammar drift between the two parsers raises AssertionError"""
+        parser = HexenParser(mode="differential")
+        # Simulate drift: the Earley grammar under LALR lexes "-100" as a
+        # single signed NUMBER instead of a unary operation
+        parser.parser = Lark(
+            _load_grammar("hexen.lark"), start="program", parser="lalr"
+        )
+        with pytest.raises(AssertionError, match="disagrees with Earley"):
+            parser.parse("val x = -100")
+
+
+class TestTreelessParsing:
+    """Test LALR parsing with the transformer fused into the parser pass"""
+
+    @pytest.mark.parametrize("source", PARITY_SOURCES)
+    def test_treeless_matches_earley(self, source):
+        """Inline transformation produces exactly the same AST dicts"""
+        earley_ast = HexenParser(mode="earley").parse(source)
+        treeless_ast = HexenParser(mode="lalr-treeless").parse(source)
+        assert treeless_ast == earley_ast
+
+    @pytest.mark.parametrize("source", INVALID_SOURCES)
+    def test_treeless_rejects_invalid_sources(self, source):
+        """Syntax errors surface as SyntaxError like the other modes"""
+        with pytest.raises(SyntaxError):
+            HexenParser(mode="lalr-treeless").parse(source)
+
+    def test_treeless_reports_literal_overflow(self):
+        """Errors raised by transformer callbacks mid-parse are preserved"""
+        with pytest.raises(SyntaxError, match="exceeds maximum safe range"):
+            HexenParser(mode="lalr-treeless").parse("val x = 99999999999999999999999")
+
+    def test_treeless_lowers_peak_memory(self):
+        """Skipping the intermediate parse tree cuts peak parse memory"""
+        source = "\n".join(
+            f"func f{i}(a: i32, b: i32) : i32 = {{ val x : i32 = a * {i} + b return x }}"
+            for i in range(300)
+        )
+
+        peaks = {}
+        timings = {}
+        for mode in ("lalr", "lalr-treeless"):
+            parser = HexenParser(mode=mode)
+            tracemalloc.start()
+            start_time = time.perf_counter()
+            ast = parser.parse(source)
+            timings[mode] = time.perf_counter() - start_time
+            peaks[mode] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert len(ast["functions"]) == 300
+
+        assert peaks["lalr-treeless"] < peaks["lalr"] * 0.5, peaks
+
+        print(
+            f"✅ 300 functions: tree {timings['lalr']:.3f}s / {peaks['lalr'] / 1e6:.1f}MB, "
+            f"tree-less {timings['lalr-treeless']:.3f}s / {peaks['lalr-treeless'] / 1e6:.1f}MB"
+        )
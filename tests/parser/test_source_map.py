@@ -0,0 +1,171 @@
+"""
+Test module for source span tracking
+
+Tests the span table recorded by HexenParser(track_spans=True): spans are
+identical across parser modes, line/column resolution is lazy and correct,
+spans survive typed-AST conversion and the AST cache, and semantic errors
+render with their position.
+"""
+
+import pytest
+
+from src.hexen.ast_cache import ASTCache
+from src.hexen.parser import HexenParser, _get_lalr_parser, _SpanRecorder
+from src.hexen.semantic import SemanticAnalyzer
+from src.hexen.source_map import SourceMap
+
+SOURCE = """func main() : i32 = {
+    val x : i32 = (1 + 2) * 3
+    mut total : i64 = undef
+    total = x:i64 + 10 + x:i64
+    return x
+}
+"""
+
+
+def _walk(value):
+    if isinstance(value, dict):
+        yield value
+        for child in value.values():
+            yield from _walk(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _walk(child)
+
+
+class TestSpans:
+    """Test the recorded spans"""
+
+    def _parse(self, mode="lalr-treeless", source=SOURCE):
+        parser = HexenParser(mode=mode, track_spans=True, typed_ast=False)
+        return parser.parse(source), parser.source_map
+
+    def _text(self, source_map, node):
+        start, end = source_map.span(node)
+        return source_map.source[start:end]
+
+    def test_spans_disabled_by_default(self):
+        parser = HexenParser()
+        parser.parse(SOURCE)
+        assert parser.source_map is None
+
+    def test_spans_include_keywords(self):
+        """Node spans cover the keyword tokens filtered out of the AST"""
+        ast, source_map = self._parse()
+        function = ast["functions"][0]
+        declaration, _, assignment, ret = function["body"]["statements"]
+
+        assert self._text(source_map, function) == SOURCE.rstrip("\n")
+        assert self._text(source_map, declaration) == "val x : i32 = (1 + 2) * 3"
+        assert self._text(source_map, declaration["value"]) == "(1 + 2) * 3"
+        assert self._text(source_map, ret) == "return x"
+        assert self._text(source_map, ret["value"]) == "x"
+        assert self._text(source_map, assignment) == "total = x:i64 + 10 + x:i64"
+
+    def test_chain_inner_nodes_are_derived(self):
+        """Inner nodes of `a + b + c` chains get spans from their children"""
+        ast, source_map = self._parse()
+        assignment = ast["functions"][0]["body"]["statements"][2]
+        outer = assignment["value"]
+        assert self._text(source_map, outer) == "x:i64 + 10 + x:i64"
+        assert self._text(source_map, outer["left"]) == "x:i64 + 10"
+
+    @pytest.mark.parametrize("mode", ["earley", "lalr", "differential"])
+    def test_spans_identical_across_modes(self, mode):
+        reference_ast, reference_map = self._parse()
+        ast, source_map = self._parse(mode)
+        for reference, node in zip(_walk(reference_ast), _walk(ast)):
+            assert source_map.span(node) == reference_map.span(reference)
+
+    def test_every_node_has_a_span(self):
+        ast, source_map = self._parse()
+        for node in _walk(ast):
+            assert source_map.span(node) is not None, node
+
+    def test_long_chain_derivation_is_iterative(self):
+        """Deriving spans along a very long chain does not recurse"""
+        terms = " + ".join("a" for _ in range(5000))
+        ast, source_map = self._parse(source=f"val a = 1\nval x = {terms}\n")
+        value = ast["statements"][1]["value"]
+        assert source_map.span(value["left"]) == (18, 18 + len(terms) - 4)
+
+    def test_typed_ast_keeps_spans(self):
+        parser = HexenParser(mode="lalr-treeless", track_spans=True, typed_ast=True)
+        ast = parser.parse(SOURCE)
+        ret = ast.functions[0].body.statements[-1]
+        assert parser.source_map.location(ret) == (5, 5)
+
+
+class TestSpanRecorderHooks:
+    """Test the Lark internals the tree-less span recorder relies on"""
+
+    def test_lalr_callback_table_is_wrapped(self):
+        """Fails loudly if a lark upgrade drops or copies the callback table"""
+        callbacks = _get_lalr_parser(treeless=True, spans=True)._callbacks
+        assert isinstance(callbacks, dict) and callbacks
+        names = {callback.__name__ for callback in callbacks.values()}
+        assert names == {"record_rule", "record_terminal"}
+
+    def test_missing_callback_table_is_an_error(self):
+        with pytest.raises(RuntimeError, match="Span tracking is not supported"):
+            _SpanRecorder().install(object())
+
+
+class TestLazyResolution:
+    """Test that positions are only computed when asked for"""
+
+    def test_indexes_built_on_first_lookup(self):
+        parser = HexenParser(mode="lalr-treeless", track_spans=True, typed_ast=False)
+        ast = parser.parse(SOURCE)
+        source_map = parser.source_map
+        assert len(source_map) > 0
+        assert source_map._index is None and source_map._line_starts is None
+
+        assert source_map.location(ast["functions"][0]) == (1, 1)
+        assert source_map._index is not None and source_map._line_starts is not None
+
+    def test_line_col(self):
+        source_map = SourceMap("ab\n\ncd\n")
+        assert source_map.line_col(0) == (1, 1)
+        assert source_map.line_col(2) == (1, 3)
+        assert source_map.line_col(3) == (2, 1)
+        assert source_map.line_col(5) == (3, 2)
+
+    def test_unknown_node(self):
+        source_map = SourceMap("")
+        assert source_map.span({"type": "identifier", "name": "x"}) is None
+        assert source_map.location(None) is None
+
+
+class TestSpanConsumers:
+    """Test the AST cache and error rendering"""
+
+    def test_ast_cache_round_trip(self, tmp_path):
+        path = tmp_path / "main.hxn"
+        path.write_text(SOURCE)
+        cache = ASTCache(tmp_path / "ast")
+
+        # An entry stored without spans is a miss for span-tracking readers
+        plain = HexenParser(mode="lalr-treeless", ast_cache=cache, typed_ast=False)
+        plain.parse_file(str(path))
+        parser = HexenParser(
+            mode="lalr-treeless", ast_cache=cache, track_spans=True, typed_ast=False
+        )
+        parsed = parser.parse_file(str(path))
+        parsed_map = parser.source_map
+        assert (cache.hits, cache.misses) == (0, 2)
+
+        cached = parser.parse_file(str(path))
+        assert cache.hits == 1
+        for original, node in zip(_walk(parsed), _walk(cached)):
+            assert parser.source_map.span(node) == parsed_map.span(original)
+
+    def test_errors_render_line_and_column(self):
+        source = "func main() : i32 = {\n    return undefined_name\n}\n"
+        parser = HexenParser(mode="lalr-treeless", track_spans=True, typed_ast=False)
+        errors = SemanticAnalyzer().analyze(parser.parse(source))
+
+        assert errors
+        rendered = errors[0].format(parser.source_map)
+        assert rendered == f"2:12: {errors[0].message}"
+        assert errors[0].format() == errors[0].message
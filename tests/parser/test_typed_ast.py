@@ -0,0 +1,196 @@
+"""
+Test module for the typed (slotted) AST
+
+Tests conversion between the dict-based AST and hexen.typed_ast nodes, the
+mapping compatibility layer, memory footprint, and that the semantic
+analyzer gives identical results on both AST forms.
+
+The whole suite can also be run on typed ASTs with:
+    pytest --typed-ast
+"""
+
+import tracemalloc
+
+import pytest
+
+from src.hexen.ast_nodes import NodeType
+from src.hexen.parser import HexenParser
+from src.hexen.semantic import SemanticAnalyzer
+from src.hexen.typed_ast import (
+    NODE_CLASSES,
+    BinaryOperationNode,
+    Node,
+    NodeKind,
+    ProgramNode,
+    to_typed_ast,
+)
+
+SOURCE = """
+func scale(values: [_]f64, mut factor: f64) : f64 = {
+    factor = factor * 2.0
+    return values[0] * factor
+}
+func main() : i32 = {
+    val data : [3]f64 = [1.0, 2.5, -3.0]
+    val window = data[0..2]
+    val total : f64 = scale(data[..], 1.5)
+    val kind : i32 = if total > 0.0 { -> 1 } else { -> -1 }
+    mut count : i32 = undef
+    count = data.length:i32
+    return (kind + count) * 10
+}
+val limit : i32 = 10
+"""
+
+INVALID_SOURCE = """
+func main() : i32 = {
+    val a : i32 = 10
+    val b : i64 = 20
+    val c : i32 = a + b
+    return undefined_name
+}
+"""
+
+
+class TestTypedAstConversion:
+    """Test dict <-> typed AST conversion"""
+
+    def setup_method(self):
+        self.parser = HexenParser(typed_ast=False)
+
+    def test_one_class_per_node_type(self):
+        """Every NodeType has a slotted class and a distinct integer kind"""
+        assert set(NODE_CLASSES) == {node_type.value for node_type in NodeType}
+        kinds = {cls.kind for cls in NODE_CLASSES.values()}
+        assert len(kinds) == len(NodeType)
+        for node_type in NodeType:
+            node_class = NODE_CLASSES[node_type.value]
+            assert node_class.type == node_type.value
+            assert node_class.kind == NodeKind[node_type.name]
+
+    def test_round_trip(self):
+        """to_dict() reproduces the dict-based AST exactly"""
+        ast = self.parser.parse(SOURCE)
+        typed = to_typed_ast(ast)
+        assert isinstance(typed, ProgramNode)
+        assert typed.to_dict() == ast
+        assert typed == ast and ast == typed
+
+    def test_nodes_have_no_instance_dict(self):
+        """Nodes are slotted: no per-instance __dict__"""
+        typed = to_typed_ast(self.parser.parse(SOURCE))
+        assert not hasattr(typed, "__dict__")
+        assert not hasattr(typed.functions[0].body, "__dict__")
+
+    def test_unknown_node_type_rejected(self):
+        """Conversion fails loudly on malformed input"""
+        with pytest.raises(ValueError, match="Unknown AST node type"):
+            to_typed_ast({"type": "while_statement"})
+        with pytest.raises(ValueError, match="Unexpected field 'extra'"):
+            to_typed_ast({"type": "identifier", "name": "x", "extra": 1})
+
+    def test_typed_ast_is_smaller(self):
+        """The typed AST needs a fraction of the dict-based AST's memory"""
+        source = "\n".join(
+            f"func f{i}(a: i32) : i32 = {{ val x : i32 = a * {i} + a return x }}"
+            for i in range(200)
+        )
+        parser = HexenParser(mode="lalr-treeless", typed_ast=False)
+
+        tracemalloc.start()
+        ast = parser.parse(source)
+        dict_size = tracemalloc.get_traced_memory()[0]
+        typed = to_typed_ast(ast)
+        typed_size = tracemalloc.get_traced_memory()[0] - dict_size
+        tracemalloc.stop()
+
+        assert typed == ast
+        assert typed_size < dict_size * 0.5, (typed_size, dict_size)
+
+
+class TestMappingCompatibility:
+    """Test the dict-like view analyzers rely on"""
+
+    def setup_method(self):
+        self.node = to_typed_ast(
+            {
+                "type": "binary_operation",
+                "operator": "+",
+                "left": {"type": "identifier", "name": "a"},
+                "right": {"type": "comptime_int", "value": 1, "source_text": "1"},
+            }
+        )
+
+    def test_item_and_attribute_access(self):
+        assert isinstance(self.node, BinaryOperationNode)
+        assert self.node["type"] == NodeType.BINARY_OPERATION.value
+        assert self.node.get("type") == self.node.type
+        assert self.node["left"]["name"] == self.node.left.name == "a"
+        assert self.node.kind == NodeKind.BINARY_OPERATION
+
+    def test_missing_keys(self):
+        """Unknown keys behave like missing dict keys"""
+        assert self.node.get("statements") is None
+        assert self.node.get("statements", []) == []
+        assert "statements" not in self.node
+        assert "kind" not in self.node and "get" not in self.node
+        with pytest.raises(KeyError):
+            self.node["statements"]
+
+    def test_optional_fields_are_absent_when_unset(self):
+        """A program without top-level statements has no 'statements' key"""
+        program = to_typed_ast({"type": "program", "functions": []})
+        assert "statements" not in program
+        assert program.get("statements", []) == []
+        assert list(program) == ["type", "functions"]
+        assert len(program) == 2
+
+    def test_field_assignment(self):
+        """Fields can be replaced; type and unknown keys cannot"""
+        self.node["operator"] = "-"
+        assert self.node.operator == "-"
+        with pytest.raises(KeyError):
+            self.node["type"] = "literal"
+        with pytest.raises(KeyError):
+            self.node["extra"] = 1
+
+    def test_is_mapping_not_dict(self):
+        from collections.abc import Mapping
+
+        assert isinstance(self.node, Mapping)
+        assert isinstance(self.node, Node)
+        assert not isinstance(self.node, dict)
+
+
+class TestTypedAstParsing:
+    """Test parser and analyzer integration"""
+
+    def test_parser_typed_ast_flag(self):
+        """HexenParser(typed_ast=True) returns typed nodes"""
+        typed = HexenParser(typed_ast=True).parse(SOURCE)
+        assert isinstance(typed, ProgramNode)
+        assert typed == HexenParser(typed_ast=False).parse(SOURCE)
+
+    def test_parse_file_with_cache_returns_typed_ast(self, tmp_path):
+        """Cached entries are stored as dicts and converted on the way out"""
+        from src.hexen.ast_cache import ASTCache
+
+        path = tmp_path / "main.hxn"
+        path.write_text(SOURCE)
+        parser = HexenParser(typed_ast=True, ast_cache=ASTCache(tmp_path / "ast"))
+
+        first = parser.parse_file(str(path))
+        second = parser.parse_file(str(path))
+        assert isinstance(first, ProgramNode) and isinstance(second, ProgramNode)
+        assert first == second
+        assert parser.ast_cache.hits == 1
+
+    @pytest.mark.parametrize("source", [SOURCE, INVALID_SOURCE])
+    def test_analyzer_results_identical(self, source):
+        """Semantic analysis gives the same errors on both AST forms"""
+        dict_ast = HexenParser(typed_ast=False).parse(source)
+        typed_ast = HexenParser(typed_ast=True).parse(source)
+
+        dict_errors = [e.message for e in SemanticAnalyzer().analyze(dict_ast)]
+        typed_errors = [e.message for e in SemanticAnalyzer().analyze(typed_ast)]
+        assert typed_errors == dict_errors
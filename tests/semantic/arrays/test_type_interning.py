@@ -0,0 +1,195 @@
+"""
+Tests for hash-consed (interned) array and range types.
+
+Tests that the interning factories return one shared instance per
+structural type, that equality stays structural against non-interned
+instances, that the intern table does not keep unused types alive, and
+benchmarks analysis of an array-heavy program.
+"""
+
+import gc
+import pickle
+import time
+import tracemalloc
+
+import pytest
+
+from src.hexen.parser import HexenParser
+from src.hexen.semantic.analyzer import SemanticAnalyzer
+from src.hexen.semantic.types import (
+    ArrayType,
+    ComptimeArrayType,
+    ComptimeRangeType,
+    HexenType,
+    RangeType,
+    _interned_types,
+    intern_array_type,
+    intern_comptime_array_type,
+    intern_comptime_range_type,
+    intern_range_type,
+)
+
+from .. import assert_no_errors
+
+
+class TestInterning:
+    """Test the interning factories"""
+
+    def test_structurally_equal_types_are_identical(self):
+        assert intern_array_type(HexenType.I32, [3]) is intern_array_type(
+            HexenType.I32, [3]
+        )
+        assert intern_comptime_array_type(
+            HexenType.COMPTIME_INT, [2, 2]
+        ) is intern_comptime_array_type(HexenType.COMPTIME_INT, [2, 2])
+        assert intern_range_type(
+            HexenType.USIZE, True, True, False, False
+        ) is intern_range_type(HexenType.USIZE, True, True, False, False)
+        assert intern_comptime_range_type(
+            HexenType.COMPTIME_INT, True, False, False, False
+        ) is intern_comptime_range_type(
+            HexenType.COMPTIME_INT, True, False, False, False
+        )
+
+    def test_distinct_types_stay_distinct(self):
+        assert intern_array_type(HexenType.I32, [3]) != intern_array_type(
+            HexenType.I32, ["_"]
+        )
+        assert intern_array_type(HexenType.I32, [3]) != intern_array_type(
+            HexenType.I64, [3]
+        )
+        # Ranges compare across the comptime/concrete classes structurally
+        concrete = intern_range_type(HexenType.COMPTIME_INT, True, True, False, False)
+        comptime = intern_comptime_range_type(
+            HexenType.COMPTIME_INT, True, True, False, False
+        )
+        assert concrete is not comptime and concrete == comptime
+
+    def test_equality_with_non_interned_instances(self):
+        interned = intern_array_type(HexenType.F64, [2, 3])
+        assert interned == ArrayType(HexenType.F64, [2, 3])
+        assert ArrayType(HexenType.F64, [2, 3]) == interned
+        assert hash(interned) == hash(ArrayType(HexenType.F64, [2, 3]))
+        assert intern_comptime_array_type(
+            HexenType.COMPTIME_FLOAT, [4]
+        ) == ComptimeArrayType(HexenType.COMPTIME_FLOAT, [4])
+        assert intern_range_type(HexenType.I32, True, True, True, True) == RangeType(
+            HexenType.I32, True, True, True, True
+        )
+        assert intern_comptime_range_type(
+            HexenType.COMPTIME_FLOAT, True, True, True, False
+        ) == ComptimeRangeType(HexenType.COMPTIME_FLOAT, True, True, True, False)
+
+    def test_caller_dimensions_are_not_aliased(self):
+        dimensions = [5, 7]
+        interned = intern_array_type(HexenType.I32, dimensions)
+        dimensions.append(9)
+        assert interned.dimensions == [5, 7]
+
+    def test_invalid_types_are_rejected_and_not_interned(self):
+        size = len(_interned_types)
+        with pytest.raises(ValueError):
+            intern_comptime_array_type(HexenType.I32, [3])
+        with pytest.raises(ValueError):
+            intern_array_type(HexenType.COMPTIME_INT, [3])
+        assert len(_interned_types) == size
+
+    def test_unused_types_are_dropped(self):
+        interned = intern_array_type(HexenType.I64, [12345, 678])
+        key = (ArrayType, HexenType.I64, 12345, 678)
+        assert _interned_types[key] is interned
+        del interned
+        gc.collect()
+        assert key not in _interned_types
+
+    def test_pickled_types_unpickle_to_shared_instances(self):
+        """Types sent to worker processes stay comparable by identity"""
+        interned = [
+            intern_array_type(HexenType.I32, [3]),
+            intern_comptime_array_type(HexenType.COMPTIME_INT, [2, 2]),
+            intern_range_type(HexenType.I32, True, True, False, False),
+            intern_comptime_range_type(HexenType.COMPTIME_INT, True, True, False, True),
+        ]
+        for original in interned:
+            assert pickle.loads(pickle.dumps(original)) is original
+
+        plain = ArrayType(HexenType.I32, [3])
+        copy = pickle.loads(pickle.dumps(plain))
+        assert copy is not plain and copy == plain and not copy._interned
+
+    def test_inferred_conversion_does_not_mutate_shared_target(self):
+        """Resolving [_] in a conversion builds a new type"""
+        source = """
+        func main() : void = {
+            val a : [3]i32 = [1, 2, 3]
+            val b : [4]i32 = [1, 2, 3, 4]
+            val x : [_]i64 = a[..]:[_]i64
+            val y : [_]i64 = b[..]:[_]i64
+            return
+        }
+        """
+        wildcard = intern_array_type(HexenType.I64, ["_"])
+        errors = SemanticAnalyzer().analyze(HexenParser().parse(source))
+        assert_no_errors(errors)
+        assert wildcard.dimensions == ["_"]
+
+
+class TestInterningBenchmark:
+    """Benchmark analysis of an array-heavy program"""
+
+    def _array_heavy_source(self, functions: int) -> str:
+        parts = []
+        for i in range(functions):
+            parts.append(
+                f"""
+        func sum{i}(data: [_]i32, grid: [2][3]f64) : i32 = {{
+            val first : i32 = data[0]
+            val corner : f64 = grid[1][2]
+            return first + data.length:i32
+        }}"""
+            )
+        calls = "\n".join(
+            f"            val r{i} : i32 = sum{i}(values[..], [[1.0, 2.0, 3.0], "
+            f"[4.0, 5.0, 6.0]])"
+            for i in range(functions)
+        )
+        parts.append(
+            f"""
+        func main() : i32 = {{
+            val values : [4]i32 = [1, 2, 3, 4]
+{calls}
+            return 0
+        }}"""
+        )
+        return "\n".join(parts)
+
+    def test_array_heavy_program(self):
+        """Analyze 200 array-parameter functions and their calls"""
+        functions = 200
+        source = self._array_heavy_source(functions)
+        ast = HexenParser(mode="lalr-treeless").parse(source)
+
+        tracemalloc.start()
+        start_time = time.time()
+        analyzer = SemanticAnalyzer()
+        errors = analyzer.analyze(ast)
+        elapsed = time.time() - start_time
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert_no_errors(errors)
+
+        # Every signature shares the same two parameter type objects
+        signatures = analyzer.symbol_table.functions
+        for position in range(2):
+            parameter_types = {
+                id(signatures[f"sum{i}"].parameters[position].param_type)
+                for i in range(functions)
+            }
+            assert len(parameter_types) == 1
+
+        assert elapsed < 5.0, f"Array-heavy analysis too slow: {elapsed:.3f}s"
+        print(
+            f"✅ Analyzed {functions} array functions + calls in {elapsed:.4f}s "
+            f"(peak {peak / 1024:.0f} KiB)"
+        )
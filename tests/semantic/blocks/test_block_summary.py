@@ -0,0 +1,177 @@
+"""
+Tests for the fused block summary used by block evaluability classification
+
+Tests that a single memoized walk yields all block flags (function calls,
+conditionals, runtime variables, comptime-only), that repeat queries do not
+re-walk the block, and that variable-dependent flags still follow the
+current symbol table.
+"""
+
+import time
+
+from src.hexen.parser import HexenParser
+from src.hexen.semantic.analyzer import SemanticAnalyzer
+from src.hexen.semantic.comptime.block_evaluation import BlockEvaluation, BlockFlags
+from src.hexen.semantic.symbol_table import Symbol
+from src.hexen.semantic.types import BlockEvaluability, HexenType, Mutability
+
+
+def _block_statements(parser, body: str):
+    """Parse `func f() : i32 = { <body> }` and return the body statements"""
+    ast = parser.parse(f"func f() : i32 = {{\n{body}\n}}")
+    return ast["functions"][0]["body"]["statements"]
+
+
+class TestBlockSummaryFlags:
+    """Test the flags computed by the fused walk"""
+
+    def setup_method(self):
+        self.parser = HexenParser()
+        self.analyzer = SemanticAnalyzer()
+        self.block_eval = self.analyzer.block_analyzer.comptime_analyzer.block_eval
+        assert isinstance(self.block_eval, BlockEvaluation)
+
+    def test_comptime_only_block(self):
+        statements = _block_statements(
+            self.parser, "val a = 42\nval b = a * 2\n-> b + 1"
+        )
+        assert self.block_eval.summarize_block(statements) == BlockFlags.NONE
+        assert (
+            self.block_eval.classify_block_evaluability(statements)
+            == BlockEvaluability.COMPILE_TIME
+        )
+
+    def test_function_calls_and_conditionals(self):
+        statements = _block_statements(
+            self.parser,
+            "val a : i32 = helper()\n"
+            "val b : i32 = if a > 0 { -> 1 } else { -> 2 }\n"
+            "-> a + b",
+        )
+        flags = self.block_eval.summarize_block(statements)
+        assert flags & BlockFlags.FUNCTION_CALLS
+        assert flags & BlockFlags.CONDITIONALS
+        assert flags & BlockFlags.RUNTIME_VARIABLES  # concrete annotations
+        assert flags & BlockFlags.NOT_COMPTIME_ONLY
+
+    def test_nested_blocks_propagate(self):
+        statements = _block_statements(
+            self.parser, "val x = { val y = { -> helper() }\n-> y }\n-> x"
+        )
+        assert self.block_eval._contains_function_calls(statements)
+        assert not self.block_eval._contains_conditionals(statements)
+
+    def test_calls_inside_array_literals_are_not_runtime_operations(self):
+        """Call detection does not look into array literals (unchanged rule)"""
+        statements = _block_statements(self.parser, "val a = [helper(), 2]\n-> 1")
+        flags = self.block_eval.summarize_block(statements)
+        assert not flags & BlockFlags.FUNCTION_CALLS
+        assert flags & BlockFlags.NOT_COMPTIME_ONLY
+
+    def test_array_type_annotation(self):
+        """Array annotations are judged by their element type"""
+        statements = _block_statements(self.parser, "val a : [2]i32 = [1, 2]\n-> 1")
+        assert self.block_eval.has_runtime_variables(statements)
+
+
+class TestBlockSummaryMemoization:
+    """Test memoization and symbol-table dependent resolution"""
+
+    def setup_method(self):
+        self.parser = HexenParser()
+        self.block_eval = SemanticAnalyzer().block_analyzer.comptime_analyzer.block_eval
+
+    def test_repeat_queries_do_not_rewalk(self, monkeypatch):
+        statements = _block_statements(
+            self.parser, "val a = { val b = { -> 1 + 2 }\n-> b }\n-> a"
+        )
+        walked = []
+        compute = BlockEvaluation._compute_statement_summary
+
+        def counting_compute(block_eval, statement):
+            walked.append(statement["type"])
+            return compute(block_eval, statement)
+
+        monkeypatch.setattr(
+            BlockEvaluation, "_compute_statement_summary", counting_compute
+        )
+
+        # Every statement of the nested blocks is walked exactly once ...
+        self.block_eval.classify_block_evaluability(statements)
+        assert len(walked) == 5
+
+        # ... and neither repeat queries nor queries on inner blocks re-walk
+        inner_block = statements[0]["value"]
+        self.block_eval.classify_block_evaluability(statements)
+        self.block_eval.get_runtime_operation_reason(statements)
+        self.block_eval.has_comptime_only_operations(inner_block["statements"])
+        assert len(walked) == 5
+
+    def test_variable_flags_follow_symbol_table(self):
+        """Memoized summaries are resolved against the current scope"""
+        statements = _block_statements(self.parser, "val a = outer + 1\n-> a")
+        assert (
+            self.block_eval.classify_block_evaluability(statements)
+            == BlockEvaluability.COMPILE_TIME
+        )  # unknown names are forward references (comptime)
+
+        self.block_eval.symbol_table.declare_symbol(
+            Symbol("outer", HexenType.I64, Mutability.IMMUTABLE)
+        )
+        assert (
+            self.block_eval.classify_block_evaluability(statements)
+            == BlockEvaluability.RUNTIME
+        )
+        assert self.block_eval.has_runtime_variables(statements)
+
+    def test_clear_summaries(self):
+        statements = _block_statements(self.parser, "-> 1")
+        self.block_eval.summarize_block(statements)
+        assert self.block_eval._statement_summaries
+        self.block_eval.clear_summaries()
+        assert not self.block_eval._statement_summaries
+        assert not self.block_eval._statement_list_summaries
+
+    def test_deeply_nested_blocks_classify_in_linear_time(self):
+        """Classifying every level of a nested block chain stays linear"""
+        depth = 30
+        body = "-> helper()"
+        for _ in range(depth):
+            body = f"val v = {{ {body} }}\n-> v"
+        statements = _block_statements(self.parser, body)
+
+        # Collect the statement list of every nesting level
+        levels = [statements]
+        while levels[-1][0]["type"] == "val_declaration":
+            levels.append(levels[-1][0]["value"]["statements"])
+        assert len(levels) == depth + 1
+
+        start_time = time.time()
+        for level in levels:
+            assert (
+                self.block_eval.classify_block_evaluability(level)
+                == BlockEvaluability.RUNTIME
+            )
+        elapsed = time.time() - start_time
+
+        assert len(self.block_eval._statement_summaries) == 2 * depth + 1
+        assert elapsed < 0.1, f"Classification too slow: {elapsed:.3f}s"
+        print(f"✅ Classified {depth + 1} nested block levels in {elapsed:.4f}s")
+
+    def test_long_operator_chain_does_not_recurse(self):
+        """Expression summaries are walked with a work stack, not recursion"""
+        parser = HexenParser(mode="lalr-treeless", typed_ast=False)
+        chain = " + ".join("outer" if i % 2 else str(i) for i in range(20_000))
+        statements = _block_statements(parser, f"val a = {chain}\n-> a")
+
+        assert (
+            self.block_eval.classify_block_evaluability(statements)
+            == BlockEvaluability.COMPILE_TIME
+        )
+        self.block_eval.symbol_table.declare_symbol(
+            Symbol("outer", HexenType.I64, Mutability.IMMUTABLE)
+        )
+        assert (
+            self.block_eval.classify_block_evaluability(statements)
+            == BlockEvaluability.RUNTIME
+        )
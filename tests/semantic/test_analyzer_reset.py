@@ -0,0 +1,132 @@
+"""
+Test module for reusing one SemanticAnalyzer across programs
+
+Tests that analyze() starts from a clean state (no symbols, functions,
+errors or context left over from earlier programs, even after an internal
+error), that reset() restores a newly constructed analyzer, and benchmarks
+checking 10k small programs through a single instance.
+"""
+
+import time
+
+from src.hexen.parser import HexenParser
+from src.hexen.semantic.analyzer import SemanticAnalyzer
+
+from . import assert_error_contains, assert_no_errors
+
+FIRST = """
+func helper(x : i32) : i32 = {
+    return x
+}
+func main() : i32 = {
+    return helper(1)
+}
+val shared : i32 = 1
+"""
+
+SECOND = """
+func main() : i32 = {
+    return helper(2)
+}
+val shared : i32 = 2
+"""
+
+
+class TestAnalyzerReuse:
+    """Test that state does not leak between analyses"""
+
+    def setup_method(self):
+        self.parser = HexenParser()
+        self.analyzer = SemanticAnalyzer()
+
+    def test_programs_are_isolated(self):
+        assert_no_errors(self.analyzer.analyze(self.parser.parse(FIRST)))
+        errors = self.analyzer.analyze(self.parser.parse(SECOND))
+        # helper belongs to the first program; main and shared are not
+        # reported as redeclared
+        assert [error.message for error in errors] == [
+            error.message
+            for error in SemanticAnalyzer().analyze(self.parser.parse(SECOND))
+        ]
+        assert_error_contains(errors, "Undefined function: 'helper'")
+        assert len(errors) == 1
+
+    def test_same_program_twice(self):
+        ast = self.parser.parse(FIRST)
+        assert_no_errors(self.analyzer.analyze(ast))
+        assert_no_errors(self.analyzer.analyze(ast))
+
+    def test_returned_errors_are_not_reused(self):
+        first = self.analyzer.analyze(self.parser.parse(SECOND))
+        self.analyzer.analyze(self.parser.parse(FIRST))
+        assert len(first) == 1
+
+    def test_recovers_after_internal_error(self):
+        def fail(node):
+            raise RuntimeError("boom")
+
+        ast = self.parser.parse(FIRST)
+        handlers = self.analyzer._statement_handlers
+        original = handlers["return_statement"]
+        handlers["return_statement"] = fail
+        errors = self.analyzer.analyze(ast)
+        assert_error_contains(errors, "Internal analysis error: boom")
+        # The failure left the function scope open
+        assert len(self.analyzer.symbol_table.scopes) > 1
+
+        handlers["return_statement"] = original
+        assert_no_errors(self.analyzer.analyze(ast))
+        assert len(self.analyzer.symbol_table.scopes) == 1
+
+    def test_reset_matches_new_analyzer(self):
+        analyzer = self.analyzer
+        analyzer.analyze(self.parser.parse(FIRST))
+        analyzer.block_context.append("expression")
+        analyzer.modified_mut_parameters.add("x")
+        analyzer.symbol_table.enter_function_scope("helper")
+
+        analyzer.reset()
+        fresh = SemanticAnalyzer()
+        table = analyzer.symbol_table
+        assert table.scopes == [{}] and table.functions == {}
+        assert table._bindings == {} and table.current_function is None
+        assert analyzer.errors == [] and analyzer.block_context == []
+        assert analyzer.modified_mut_parameters == set()
+        assert analyzer.current_function_return_type is None
+        assert analyzer.expression_memo.stats() == fresh.expression_memo.stats()
+        assert not analyzer.comptime_analyzer.block_eval._statement_summaries
+
+
+class TestAnalyzerReuseBenchmark:
+    """Benchmark checking many small programs through one instance"""
+
+    def test_ten_thousand_programs(self):
+        parser = HexenParser(mode="lalr-treeless")
+        programs = [
+            parser.parse(
+                f"func main() : i32 = {{\n"
+                f"    val a : i32 = {index}\n"
+                f"    val b = a + {index} * 2\n"
+                f"    return b\n"
+                f"}}"
+            )
+            for index in range(10)
+        ]
+        count = 10_000
+
+        start_time = time.time()
+        for index in range(count):
+            assert not SemanticAnalyzer().analyze(programs[index % 10])
+        fresh_time = time.time() - start_time
+
+        analyzer = SemanticAnalyzer()
+        start_time = time.time()
+        for index in range(count):
+            assert not analyzer.analyze(programs[index % 10])
+        reused_time = time.time() - start_time
+
+        assert reused_time < 10.0, f"Reused analyzer too slow: {reused_time:.3f}s"
+        print(
+            f"✅ {count} programs: {count / fresh_time:.0f}/s with a new analyzer "
+            f"each -> {count / reused_time:.0f}/s through one instance"
+        )
@@ -142,6 +142,38 @@ class TestDivisionOperators(StandardTestBase):
         errors = self.analyzer.analyze(ast)
         assert_no_errors(errors)
 
+    def test_modulo(self):
+        """Test modulo operator (%) takes its operands' type like + - *"""
+        source = """
+        func test() : i32 = {
+            val rem = 7 % 3                 // comptime_int % comptime_int -> comptime_int
+            val a:i32 = -7
+            val b:f64 = 7.5
+            val irem:i32 = a % 3            // i32 % comptime_int -> i32
+            val frem:f64 = b % 2.0          // f64 % comptime_float -> f64
+            val wide:i64 = a % 3            // comptime adapts to the i64 target
+            return irem
+        }
+        """
+        ast = self.parser.parse(source)
+        errors = self.analyzer.analyze(ast)
+        assert_no_errors(errors)
+
+    def test_modulo_mixed_types(self):
+        """Test modulo between different concrete types needs conversions"""
+        source = """
+        func test() : i64 = {
+            val a:i32 = 10
+            val b:i64 = 3
+            val rem:i64 = a % b
+            return rem
+        }
+        """
+        ast = self.parser.parse(source)
+        errors = self.analyzer.analyze(ast)
+        assert_error_count(errors, 1)
+        assert "arithmetic operation '%'" in errors[0].message
+
 
 class TestMixedTypeOperations(StandardTestBase):
     """Test operations between mixed concrete types"""
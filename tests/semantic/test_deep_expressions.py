@@ -0,0 +1,117 @@
+"""
+Test module for iterative analysis of deeply nested expressions
+
+Binary operation chains parse into left-deep trees as deep as the chain is
+long. Tests that operation chains are analyzed with an explicit work stack
+(no RecursionError at any depth), that the results and errors match the
+recursive analysis, and benchmarks 10^5-term expressions.
+"""
+
+import time
+
+from src.hexen.parser import HexenParser
+from src.hexen.semantic.analyzer import SemanticAnalyzer
+
+from . import assert_error_contains, assert_no_errors
+
+
+def _chain(terms: int, operator: str = "+") -> str:
+    """`0 + a + 2 + a + ...` with `terms` operands"""
+    return f" {operator} ".join("a" if i % 2 else str(i) for i in range(terms))
+
+
+def _program(declarations: str) -> str:
+    return f"""
+    func main() : i64 = {{
+        val a : i64 = 1
+        val flag : bool = true
+{declarations}
+        return 0
+    }}
+    """
+
+
+def _use_recursive_operations(analyzer: SemanticAnalyzer) -> None:
+    """Route operations through the recursive analyzers (pre-iterative path)"""
+    handlers = analyzer.expression_analyzer._handlers
+    handlers["binary_operation"] = analyzer.binary_ops.analyze_binary_operation
+    handlers["unary_operation"] = analyzer.unary_ops.analyze_unary_operation
+
+
+class TestDeepExpressions:
+    """Test that nesting depth does not exhaust the Python stack"""
+
+    def setup_method(self):
+        self.parser = HexenParser(mode="lalr-treeless", typed_ast=False)
+
+    def test_long_sum(self):
+        source = _program(f"        val x : i64 = {_chain(5_000)}")
+        assert_no_errors(SemanticAnalyzer().analyze(self.parser.parse(source)))
+
+    def test_deep_unary_nesting(self):
+        source = _program(
+            f"        val x : i64 = {'-' * 5_000}a\n"
+            f"        val y : bool = {'!' * 5_000}flag"
+        )
+        assert_no_errors(SemanticAnalyzer().analyze(self.parser.parse(source)))
+
+    def test_mixed_chain_in_nested_contexts(self):
+        """Operands that are themselves expressions re-enter the work loop"""
+        chain = _chain(2_000, "*")
+        source = _program(
+            f"        val x : i32 = ({chain}):i32\n"
+            f"        val y : i64 = {{ -> -({chain}) + {chain} }}\n"
+            f"        val z : bool = {chain} > 0 && !({chain} < 0)"
+        )
+        assert_no_errors(SemanticAnalyzer().analyze(self.parser.parse(source)))
+
+    def test_error_deep_in_chain_reported_once(self):
+        terms = ["a"] * 5_000
+        terms[2_500] = "missing"
+        source = _program(f"        val x : i64 = {' + '.join(terms)}")
+        errors = SemanticAnalyzer().analyze(self.parser.parse(source))
+        assert_error_contains(errors, "Undefined variable: 'missing'")
+        assert len(errors) == 1
+
+
+class TestRecursiveEquivalence:
+    """Test that the work stack reproduces the recursive analysis"""
+
+    SOURCES = [
+        _program("        val x : i32 = a + 1"),
+        _program("        val x : i64 = -a * (a + 2) / 3"),
+        _program("        val x : i32 = 10 / 3\n        val y : f64 = 10 / 3"),
+        _program("        val x : bool = !flag && a > 2 || -a < 0"),
+        _program("        val x : i64 = missing + other * a"),
+        _program("        val x : i64 = !a + -flag + (flag && 1)"),
+        _program("        val x : f32 = a + 1.5\n        val y : i32 = a"),
+    ]
+
+    def test_same_types_and_errors(self):
+        parser = HexenParser(mode="lalr-treeless", typed_ast=False)
+        for source in self.SOURCES:
+            iterative = SemanticAnalyzer()
+            recursive = SemanticAnalyzer()
+            _use_recursive_operations(recursive)
+            iterative_errors = iterative.analyze(parser.parse(source))
+            recursive_errors = recursive.analyze(parser.parse(source))
+            assert [str(error) for error in iterative_errors] == [
+                str(error) for error in recursive_errors
+            ], source
+
+
+class TestDeepExpressionBenchmark:
+    """Benchmark analysis of 10^5-term expressions"""
+
+    def test_hundred_thousand_term_sum(self):
+        terms = 100_000
+        source = _program(f"        val x : i64 = {_chain(terms)}")
+        ast = HexenParser(mode="lalr-treeless", typed_ast=False).parse(source)
+
+        start_time = time.time()
+        errors = SemanticAnalyzer().analyze(ast)
+        elapsed = time.time() - start_time
+
+        assert_no_errors(errors)
+        assert elapsed < 10.0, f"Deep expression analysis too slow: {elapsed:.3f}s"
+        print(f"✅ Analyzed a {terms}-term sum in {elapsed:.4f}s")
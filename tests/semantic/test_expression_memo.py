@@ -0,0 +1,114 @@
+"""
+Test module for per-analysis expression memoization
+
+Tests that repeated analysis of the same subtree in the same target context
+is answered by the ExpressionMemo, that cached errors are replayed so the
+reported errors match an analysis without the memo, that the stats hook
+receives the hit rate of every analysis and that no entries outlive it.
+"""
+
+from src.hexen.parser import HexenParser
+from src.hexen.semantic import MemoStats
+from src.hexen.semantic.analyzer import SemanticAnalyzer
+from src.hexen.semantic.types import HexenType
+
+from . import assert_no_errors
+
+
+def _disable_memo(analyzer: SemanticAnalyzer) -> None:
+    analyzer.expression_analyzer._memo = None
+
+
+SOURCES = [
+    """
+    func main() : i64 = {
+        val a : i64 = 1
+        mut t : i64 = 0
+        t = a + 2 * a
+        return t
+    }
+    """,
+    """
+    func main() : i32 = {
+        val a : i64 = 1
+        mut t : i32 = 0
+        t = a + 2 * a
+        t = -a + missing
+        val x : i32 = a * 2 + 1
+        return 0
+    }
+    """,
+    """
+    func main() : i32 = {
+        val a : i64 = 1
+        val c = 1 + 2 * 3
+        val x : i32 = c
+        val y = (a + 2):i32
+        val z : bool = !(a > 2) || a < 0 && c > 1
+        return x
+    }
+    """,
+]
+
+
+class TestExpressionMemo:
+    """Test memo hits, error replay and statistics"""
+
+    def setup_method(self):
+        self.parser = HexenParser()
+        self.stats = []
+        self.analyzer = SemanticAnalyzer(stats_hook=self.stats.append)
+
+    def test_reanalyzed_assignment_value_hits(self):
+        errors = self.analyzer.analyze(self.parser.parse(SOURCES[0]))
+        assert_no_errors(errors)
+        [stats] = self.stats
+        assert isinstance(stats, MemoStats)
+        assert stats.hits >= 1
+        assert stats.lookups == stats.hits + stats.misses
+        assert 0.0 < stats.hit_rate <= 1.0
+
+    def test_same_errors_without_memo(self):
+        for source in SOURCES:
+            ast = self.parser.parse(source)
+            memoized = [str(error) for error in SemanticAnalyzer().analyze(ast)]
+            plain = SemanticAnalyzer()
+            _disable_memo(plain)
+            assert memoized == [str(error) for error in plain.analyze(ast)], source
+
+    def test_hit_replays_errors(self):
+        expression = self.analyzer.expression_analyzer
+        node = self.parser.parse(SOURCES[1])["functions"][0]["body"]["statements"][3][
+            "value"
+        ]
+        assert expression.analyze_expression(node, HexenType.I32) == (HexenType.UNKNOWN)
+        first = list(self.analyzer.errors)
+        assert first
+        assert expression.analyze_expression(node, HexenType.I32) == (HexenType.UNKNOWN)
+        assert self.analyzer.errors == first + first
+        assert self.analyzer.expression_memo.hits == 1
+
+    def test_target_type_is_part_of_the_key(self):
+        expression = self.analyzer.expression_analyzer
+        node = {
+            "type": "binary_operation",
+            "operator": "/",
+            "left": {"type": "comptime_int", "value": 10},
+            "right": {"type": "comptime_int", "value": 3},
+        }
+        assert expression.analyze_expression(node, HexenType.F64) == (
+            HexenType.COMPTIME_FLOAT
+        )
+        assert expression.analyze_expression(node, HexenType.I32) == (
+            HexenType.COMPTIME_FLOAT
+        )
+        assert self.analyzer.expression_memo.hits == 0
+
+    def test_memo_is_per_analysis(self):
+        memo = self.analyzer.expression_memo
+        self.analyzer.analyze(self.parser.parse(SOURCES[0]))
+        assert self.stats[0].entries > 0
+        assert memo.stats().entries == 0
+
+        self.analyzer.analyze({"type": "program", "functions": []})
+        assert self.stats[1] == MemoStats(hits=0, misses=0, entries=0)
@@ -0,0 +1,141 @@
+"""
+Test module for incremental semantic re-checking
+
+Tests that an IncrementalSession replays the results of unchanged functions
+with the same (located) errors as a full analysis, re-checks functions whose
+AST or whose dependencies' signatures changed, and benchmarks an edit-check
+cycle on a program with thousands of functions.
+"""
+
+import time
+
+from src.hexen.parser import HexenParser
+from src.hexen.semantic import IncrementalSession
+from src.hexen.semantic.analyzer import SemanticAnalyzer
+
+from . import assert_error_contains
+
+HELPER = "func helper(x : i64) : i64 = {\n    return x * 2\n}"
+
+
+def _program(functions) -> str:
+    return "\n".join(functions) + "\nval g : i64 = helper(1)\n"
+
+
+def _callers(count: int):
+    return [
+        f"func f{index}(x : i64) : i64 = {{\n"
+        f"    val a : i64 = x + {index}\n"
+        f"    val b : i32 = a\n"
+        f"    return helper(a)\n"
+        f"}}"
+        for index in range(count)
+    ]
+
+
+class TestIncrementalSession:
+    """Test which functions are re-checked and that results match"""
+
+    def setup_method(self):
+        self.parser = HexenParser(mode="lalr-treeless", track_spans=True)
+        self.session = IncrementalSession()
+
+    def _check(self, source):
+        ast = self.parser.parse(source)
+        errors = SemanticAnalyzer(incremental=self.session).analyze(ast)
+        located = [error.format(self.parser.source_map) for error in errors]
+        full = SemanticAnalyzer().analyze(ast)
+        assert located == [error.format(self.parser.source_map) for error in full]
+        return located
+
+    def test_unchanged_program_is_replayed(self):
+        source = _program([HELPER, *_callers(5)])
+        first = self._check(source)
+        assert self.session.rechecked == 6 and self.session.reused == 0
+        assert self._check(source) == first
+        assert self.session.rechecked == 0 and self.session.reused == 6
+        assert len(self.session) == 6
+
+    def test_changed_body_is_rechecked(self):
+        functions = [HELPER, *_callers(5)]
+        self._check(_program(functions))
+        functions[3] = functions[3].replace("val b : i32 = a", "val b : i64 = a")
+        self._check(_program(functions))
+        assert self.session.rechecked == 1 and self.session.reused == 5
+
+    def test_moved_functions_keep_their_results(self):
+        functions = [HELPER, *_callers(5)]
+        self._check(_program(functions))
+        functions[1:] = reversed(functions[1:])
+        self._check(_program(["", *functions]))
+        assert self.session.rechecked == 0
+
+    def test_signature_change_rechecks_callers(self):
+        lone = "func lone() : i32 = {\n    return 1\n}"
+        self._check(_program([HELPER, *_callers(3), lone]))
+        changed = HELPER.replace("x : i64", "x : bool")
+        errors = self._check(_program([changed, *_callers(3), lone]))
+        assert self.session.rechecked == 4 and self.session.reused == 1
+        assert any("bool" in error for error in errors)
+
+    def test_removed_and_restored_dependency(self):
+        self._check(_program([HELPER, *_callers(2)]))
+        errors = self._check(_program(_callers(2)))
+        assert sum("Undefined function: 'helper'" in e for e in errors) == 3
+        assert self.session.rechecked == 2
+
+        self._check(_program([HELPER, *_callers(2)]))
+        assert self.session.rechecked == 3
+
+    def test_redeclaration_depends_on_earlier_functions(self):
+        duplicate = HELPER.replace("x * 2", "x * 3")
+        self._check(_program([HELPER, duplicate]))
+        errors = self._check(_program([duplicate]))
+        assert self.session.rechecked == 1
+        assert not any("already declared" in error for error in errors)
+
+        ast = self.parser.parse(_program([HELPER, duplicate]))
+        errors = SemanticAnalyzer(incremental=self.session).analyze(ast)
+        assert_error_contains(errors, "Function 'helper' is already declared")
+
+    def test_typed_ast(self):
+        self.parser = HexenParser(
+            mode="lalr-treeless", typed_ast=True, track_spans=True
+        )
+        functions = [HELPER, *_callers(4)]
+        self._check(_program(functions))
+        functions[2] = functions[2].replace("x + 1", "x + 100")
+        self._check(_program(functions))
+        assert self.session.rechecked == 1 and self.session.reused == 4
+
+
+class TestIncrementalBenchmark:
+    """Benchmark an edit-check cycle on a large program"""
+
+    def test_single_function_edit(self):
+        functions = [HELPER, *_callers(4_000)]
+        parser = HexenParser(mode="lalr-treeless", typed_ast=False)
+        session = IncrementalSession()
+        SemanticAnalyzer(incremental=session).analyze(parser.parse(_program(functions)))
+
+        functions[2_000] = functions[2_000].replace("val b : i32", "val b : i64")
+        ast = parser.parse(_program(functions))
+
+        start_time = time.time()
+        full_errors = SemanticAnalyzer().analyze(ast)
+        full_time = time.time() - start_time
+
+        start_time = time.time()
+        errors = SemanticAnalyzer(incremental=session).analyze(ast)
+        incremental_time = time.time() - start_time
+
+        assert [str(e) for e in errors] == [str(e) for e in full_errors]
+        assert session.rechecked == 1
+        assert incremental_time < 2.0, (
+            f"Incremental re-check too slow: {incremental_time:.3f}s"
+        )
+        print(
+            f"✅ Re-check after a one-function edit ({len(functions)} functions): "
+            f"{full_time * 1000:.0f} ms full -> {incremental_time * 1000:.0f} ms "
+            "incremental"
+        )
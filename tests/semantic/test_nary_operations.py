@@ -0,0 +1,243 @@
+"""
+Test module for flattened n-ary operation chains
+
+Tests that HexenParser(flatten_chains=True) turns same-operator chains of
+associative operators into nary_operation nodes, that every parser mode and
+the typed AST agree on them, that analysis gives the same types and errors
+as the left-deep binary form, and benchmarks both forms on long chains.
+
+The whole suite can also be run on flattened ASTs with:
+    pytest --flatten-chains
+"""
+
+import time
+
+import pytest
+
+from src.hexen.ast_cache import ASTCache
+from src.hexen.parser import HexenParser
+from src.hexen.semantic.analyzer import SemanticAnalyzer
+from src.hexen.source_map import _walk
+from src.hexen.typed_ast import to_typed_ast
+
+from . import assert_no_errors
+
+
+def _value(ast, index=0):
+    """Value expression of the index-th statement of the first function"""
+    return ast["functions"][0]["body"]["statements"][index]["value"]
+
+
+def _program(expression: str) -> str:
+    return f"""
+    func main() : i64 = {{
+        val a : i64 = 1
+        val b : i32 = 2
+        val f : f64 = 1.5
+        val flag : bool = true
+        val x = {expression}
+        return 0
+    }}
+    """
+
+
+class TestFlattening:
+    """Test the shape of flattened chains"""
+
+    def setup_method(self):
+        self.parser = HexenParser(flatten_chains=True)
+
+    def test_same_operator_chain_becomes_nary(self):
+        value = _value(self.parser.parse(_program("a + 1 + a + 2")), 4)
+        assert value["type"] == "nary_operation"
+        assert value["operator"] == "+"
+        operands = value["operands"]
+        assert [operand.get("name", operand.get("value")) for operand in operands] == [
+            "a",
+            1,
+            "a",
+            2,
+        ]
+
+    def test_two_operands_stay_binary(self):
+        value = _value(self.parser.parse(_program("a + 1")), 4)
+        assert value["type"] == "binary_operation"
+
+    def test_non_associative_operators_stay_binary(self):
+        value = _value(self.parser.parse(_program("a - 1 - 2 - 3")), 4)
+        assert value["type"] == "binary_operation"
+        assert value["left"]["type"] == "binary_operation"
+
+    def test_operator_change_splits_chain(self):
+        """a + b + c - d + e is ((nary + [a, b, c]) - d) + e"""
+        value = _value(self.parser.parse(_program("a + 1 + a - 2 + a")), 4)
+        assert value["type"] == "binary_operation" and value["operator"] == "+"
+        subtraction = value["left"]
+        assert subtraction["operator"] == "-"
+        assert subtraction["left"]["type"] == "nary_operation"
+        assert len(subtraction["left"]["operands"]) == 3
+
+    def test_precedence_levels_flatten_independently(self):
+        source = _program("flag && a * b * 2 > 0 && flag || flag || flag")
+        value = _value(self.parser.parse(source), 4)
+        assert value["type"] == "nary_operation" and value["operator"] == "||"
+        conjunction = value["operands"][0]
+        assert conjunction["type"] == "nary_operation"
+        assert conjunction["operator"] == "&&"
+        product = conjunction["operands"][1]["left"]
+        assert product["type"] == "nary_operation" and product["operator"] == "*"
+
+    def test_default_is_binary(self):
+        value = _value(HexenParser(flatten_chains=False).parse(_program("a+1+2")), 4)
+        assert value["type"] == "binary_operation"
+
+    @pytest.mark.parametrize("mode", ["lalr", "lalr-treeless", "differential"])
+    def test_modes_agree(self, mode):
+        source = _program("flag && flag && (a + b:i64 + 3) * 2 * a > 0 || flag")
+        expected = HexenParser(mode="earley", flatten_chains=True).parse(source)
+        parser = HexenParser(mode=mode, flatten_chains=True, typed_ast=False)
+        assert parser.parse(source) == expected
+
+    def test_typed_ast(self):
+        source = _program("a + 1 + a + 2")
+        ast = HexenParser(flatten_chains=True, typed_ast=False).parse(source)
+        typed = to_typed_ast(ast)
+        assert _value(typed, 4).operands[3]["value"] == 2
+        assert typed.to_dict() == ast
+
+    def test_spans_cover_the_whole_chain(self):
+        source = _program("a + 1 + a + 2")
+        parser = HexenParser(
+            mode="lalr-treeless", flatten_chains=True, track_spans=True
+        )
+        value = _value(parser.parse(source), 4)
+        start, end = parser.source_map.span(value)
+        assert source[start:end] == "a + 1 + a + 2"
+
+    def test_ast_cache_keeps_forms_apart(self, tmp_path):
+        path = tmp_path / "chain.hxn"
+        path.write_text(_program("a + 1 + a + 2"))
+        cache = ASTCache(tmp_path / "cache")
+        flat = HexenParser(ast_cache=cache, flatten_chains=True)
+        binary = HexenParser(ast_cache=cache, flatten_chains=False)
+        assert _value(flat.parse_file(str(path)), 4)["type"] == "nary_operation"
+        assert _value(binary.parse_file(str(path)), 4)["type"] == "binary_operation"
+        assert _value(flat.parse_file(str(path)), 4)["type"] == "nary_operation"
+        assert cache.misses == 2 and cache.hits == 1
+
+
+class TestNaryAnalysis:
+    """Test that n-ary nodes analyze like their binary trees"""
+
+    EXPRESSIONS = [
+        "a + 1 + a + 2",
+        "1 + 2 + 3 + 4",
+        "1.5 + 2 + 3",
+        "b + b + b",
+        "a + b + a",
+        "b * 2 * a * 3",
+        "f * 2 * 3.5 * f",
+        "flag && flag && flag || flag || !flag",
+        "flag && a && flag",
+        "a + missing + a + 1",
+        "a + 1 + a + 2 > b * 2 * 3 && flag && flag",
+        '"x" + "y" + "z"',
+    ]
+    TARGET_DECLARATIONS = [
+        "val t : i32 = b + b + 1 + 2",
+        "val t : i32 = a + a + a",
+        "val t : f32 = f + f + f",
+        "val t : f64 = b + f + 1",
+        "mut t : i64 = 0\n        t = a + b + 1 + 2",
+        "mut t : i32 = 0\n        t = a + a + 1",
+    ]
+
+    def _errors(self, source, flatten_chains):
+        parser = HexenParser(flatten_chains=flatten_chains)
+        errors = SemanticAnalyzer().analyze(parser.parse(source))
+        return [error.message for error in errors]
+
+    @pytest.mark.parametrize("expression", EXPRESSIONS)
+    def test_same_errors_as_binary_tree(self, expression):
+        source = _program(expression)
+        assert self._errors(source, True) == self._errors(source, False)
+
+    @pytest.mark.parametrize("declaration", TARGET_DECLARATIONS)
+    def test_same_errors_with_target_types(self, declaration):
+        source = _program("0").replace("val x = 0", declaration)
+        assert self._errors(source, True) == self._errors(source, False)
+
+    def test_comptime_chain_stays_comptime(self):
+        source = """
+        func main() : i32 = {
+            val c = 1 + 2 + 3 + 4
+            val narrow : i32 = c
+            val wide : f64 = c * 2 * 3
+            return narrow
+        }
+        """
+        parser = HexenParser(flatten_chains=True)
+        assert_no_errors(SemanticAnalyzer().analyze(parser.parse(source)))
+
+    def test_assignment_analyzes_only_tree_nodes(self):
+        """The precision check folds operand types instead of building nodes"""
+        assignment = "mut t : i64 = 0\n        t = a + b:i64 + a + 1 + 2"
+        source = _program("0").replace("val x = 0", assignment)
+        ast = HexenParser(flatten_chains=True, typed_ast=False).parse(source)
+        tree_nodes = {id(node) for node in _walk(ast)}
+
+        analyzer = SemanticAnalyzer()
+        assignments = analyzer.assignment_analyzer
+        analyze = assignments._analyze_expression
+        analyzed = []
+
+        def recording_analyze(node, target_type=None):
+            analyzed.append(node)
+            return analyze(node, target_type)
+
+        assignments._analyze_expression = recording_analyze
+        assert_no_errors(analyzer.analyze(ast))
+        assert analyzed and all(id(node) in tree_nodes for node in analyzed)
+
+
+class TestNaryBenchmark:
+    """Compare node counts and analysis time of both forms"""
+
+    def test_long_chains(self):
+        terms = 20_000
+        additions = " + ".join("a" if i % 2 else str(i) for i in range(terms))
+        conjunctions = " && ".join(["flag"] * terms)
+        source = f"""
+        func main() : i64 = {{
+            val a : i64 = 1
+            val flag : bool = true
+            val x : i64 = {additions}
+            val y : bool = {conjunctions}
+            return x
+        }}
+        """
+        results = {}
+        for flatten_chains in (False, True):
+            parser = HexenParser(
+                mode="lalr-treeless", typed_ast=False, flatten_chains=flatten_chains
+            )
+            ast = parser.parse(source)
+            node_count = sum(1 for _ in _walk(ast))
+
+            start_time = time.time()
+            errors = SemanticAnalyzer().analyze(ast)
+            elapsed = time.time() - start_time
+
+            assert_no_errors(errors)
+            results[flatten_chains] = (node_count, elapsed)
+
+        (binary_nodes, binary_time), (nary_nodes, nary_time) = (
+            results[False],
+            results[True],
+        )
+        assert nary_nodes < binary_nodes * 0.6
+        assert nary_time < binary_time, (nary_time, binary_time)
+        print(
+            f"✅ {terms}-term chains: {binary_nodes} -> {nary_nodes} nodes, "
+            f"analysis {binary_time:.4f}s -> {nary_time:.4f}s"
+        )
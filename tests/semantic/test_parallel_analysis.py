@@ -0,0 +1,131 @@
+"""
+Test module for parallel per-function semantic analysis
+
+Tests that SemanticAnalyzer(workers=N) analyzes function bodies in a
+process pool with the same errors, in the same order and located on the
+same nodes as sequential analysis, that small programs stay in-process, and
+benchmarks a program with thousands of functions.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.hexen.parser import HexenParser
+from src.hexen.semantic.analyzer import SemanticAnalyzer
+from src.hexen.semantic.parallel_analysis import function_chunks
+
+from . import assert_no_errors
+
+
+def _function(index: int) -> str:
+    """A function exercising locals, calls to neighbours and some errors"""
+    if index % 50 == 7:
+        # Narrowing error and calls to the previous and the next function
+        body = (
+            f"    val a : i64 = {index}\n"
+            "    val b : i32 = a\n"
+            f"    return f{index - 1}(a) + f{index + 1}(a)"
+        )
+    elif index % 10 == 0:
+        body = f"    val a : i64 = x + {index}\n    return a"
+    else:
+        body = f"    mut t : i64 = x * 2\n    t = t + {index} + missing\n    return t"
+    return f"func f{index}(x : i64) : i64 = {{\n{body}\n}}"
+
+
+def _program(function_count: int) -> str:
+    functions = [_function(index) for index in range(function_count)]
+    functions.append("func f3(x : i64, x : i32) : i64 = { return x }")
+    functions.append("func f4(y : i64) : i64 = { return y }")
+    return (
+        "\n".join(functions) + "\nval g : i64 = f5(1)\nval h : i32 = f5(1) + f9999(2)\n"
+    )
+
+
+def _located_errors(parser, ast, workers):
+    analyzer = SemanticAnalyzer(workers=workers)
+    analyzer.PARALLEL_MIN_FUNCTIONS = 1
+    return [error.format(parser.source_map) for error in analyzer.analyze(ast)]
+
+
+class TestParallelAnalysis:
+    """Test that the process pool reproduces sequential analysis"""
+
+    def setup_method(self):
+        self.parser = HexenParser(mode="lalr-treeless", track_spans=True)
+
+    @pytest.mark.parametrize("workers", [2, 3])
+    def test_same_errors_in_source_order(self, workers):
+        ast = self.parser.parse(_program(200))
+        sequential = _located_errors(self.parser, ast, workers=1)
+        assert any("Undefined function: 'f8'" in error for error in sequential)
+        assert any("Duplicate parameter name" in error for error in sequential)
+        assert any("'f4' is already declared" in error for error in sequential)
+        assert _located_errors(self.parser, ast, workers) == sequential
+
+    def test_same_errors_on_typed_ast(self):
+        parser = HexenParser(mode="lalr-treeless", typed_ast=True, track_spans=True)
+        ast = parser.parse(_program(100))
+        assert _located_errors(parser, ast, 2) == _located_errors(parser, ast, 1)
+
+    def test_top_level_statements_see_all_functions(self):
+        ast = self.parser.parse(_program(100))
+        analyzer = SemanticAnalyzer(workers=2)
+        analyzer.PARALLEL_MIN_FUNCTIONS = 1
+        analyzer.analyze(ast)
+        assert analyzer.symbol_table.lookup_function("f99") is not None
+        assert analyzer.symbol_table.lookup_symbol("g") is not None
+
+    def test_memo_statistics_include_workers(self):
+        ast = self.parser.parse(_program(100))
+        stats = []
+        for workers in (1, 2):
+            analyzer = SemanticAnalyzer(stats_hook=stats.append, workers=workers)
+            analyzer.PARALLEL_MIN_FUNCTIONS = 1
+            analyzer.analyze(ast)
+        assert stats[0].lookups == stats[1].lookups
+
+    def test_small_programs_stay_in_process(self, monkeypatch):
+        def fail(*args):
+            raise AssertionError("process pool used for a small program")
+
+        monkeypatch.setattr(SemanticAnalyzer, "_analyze_functions_parallel", fail)
+        source = "func main() : i32 = {\n    return 0\n}"
+        analyzer = SemanticAnalyzer(workers=4)
+        assert_no_errors(analyzer.analyze(self.parser.parse(source)))
+
+    def test_chunks_cover_functions_in_order(self):
+        for count, workers in [(1, 4), (10, 4), (100, 3), (1000, 8)]:
+            chunks = function_chunks(count, workers)
+            assert chunks[0][0] == 0 and chunks[-1][1] == count
+            assert all(end == start for (_, end), (start, _) in zip(chunks, chunks[1:]))
+            assert all(end > start for start, end in chunks)
+
+
+class TestParallelAnalysisBenchmark:
+    """Benchmark a program with thousands of functions"""
+
+    def test_thousands_of_functions(self):
+        function_count = 4_000
+        parser = HexenParser(mode="lalr-treeless", typed_ast=False)
+        ast = parser.parse(_program(function_count))
+        workers = os.cpu_count() or 1
+
+        timings = {}
+        errors = {}
+        for mode, worker_count in (("sequential", 1), ("parallel", max(workers, 2))):
+            analyzer = SemanticAnalyzer(workers=worker_count)
+            start_time = time.time()
+            errors[mode] = [str(error) for error in analyzer.analyze(ast)]
+            timings[mode] = time.time() - start_time
+
+        assert errors["parallel"] == errors["sequential"]
+        if workers >= 4:
+            assert timings["parallel"] < timings["sequential"], timings
+        print(
+            f"✅ {function_count} functions: {timings['sequential']:.3f}s "
+            f"sequential -> {timings['parallel']:.3f}s on {max(workers, 2)} "
+            f"processes ({workers} CPUs)"
+        )
@@ -0,0 +1,133 @@
+"""
+Test module for SymbolTable scope management
+
+Tests the flat binding-stack implementation: shadowing and unwinding across
+nested scopes, redeclaration rules, parameter lookups, slotted records, and
+that lookups do not slow down with nesting depth.
+"""
+
+import time
+
+import pytest
+
+from src.hexen.semantic.symbol_table import (
+    FunctionSignature,
+    Parameter,
+    Symbol,
+    SymbolTable,
+)
+from src.hexen.semantic.types import HexenType, Mutability
+
+
+def _symbol(name, symbol_type=HexenType.I32):
+    return Symbol(name, symbol_type, Mutability.IMMUTABLE)
+
+
+class TestScopes:
+    """Test declaration, shadowing and scope exit"""
+
+    def setup_method(self):
+        self.table = SymbolTable()
+
+    def test_shadowing_and_unwinding(self):
+        outer = _symbol("x")
+        inner = _symbol("x", HexenType.F64)
+        self.table.declare_symbol(outer)
+
+        self.table.enter_scope()
+        assert self.table.lookup_symbol("x") is outer
+        assert self.table.declare_symbol(inner)
+        assert self.table.lookup_symbol("x") is inner
+        self.table.declare_symbol(_symbol("local"))
+
+        self.table.exit_scope()
+        assert self.table.lookup_symbol("x") is outer
+        assert self.table.lookup_symbol("local") is None
+        assert self.table._bindings == {"x": [outer]}
+
+    def test_redeclaration_in_same_scope_rejected(self):
+        first = _symbol("x")
+        assert self.table.declare_symbol(first)
+        assert not self.table.declare_symbol(_symbol("x"))
+        assert self.table.lookup_symbol("x") is first
+
+        self.table.enter_scope()
+        self.table.exit_scope()
+        assert self.table.lookup_symbol("x") is first
+
+    def test_current_scope_view(self):
+        """scopes[-1] holds exactly the current scope's declarations"""
+        self.table.declare_symbol(_symbol("g"))
+        self.table.enter_scope()
+        self.table.declare_symbol(_symbol("a"))
+        assert list(self.table.scopes[-1]) == ["a"]
+        assert "g" not in self.table.scopes[-1]
+
+    def test_global_scope_is_never_popped(self):
+        symbol = _symbol("g")
+        self.table.declare_symbol(symbol)
+        self.table.exit_scope()
+        assert len(self.table.scopes) == 1
+        assert self.table.lookup_symbol("g") is symbol
+
+
+class TestParametersAndRecords:
+    """Test parameter lookups and the slotted record types"""
+
+    def setup_method(self):
+        self.table = SymbolTable()
+        self.signature = FunctionSignature(
+            "f",
+            [Parameter("a", HexenType.I32, False), Parameter("b", HexenType.F64, True)],
+            HexenType.I32,
+        )
+        self.table.declare_function(self.signature)
+
+    def test_parameter_lookups(self):
+        assert not self.table.is_parameter("a")
+        assert self.table.enter_function_scope("f")
+
+        assert self.table.is_parameter("b")
+        assert self.table.get_parameter_info("b") is self.signature.parameters[1]
+        assert self.table.lookup_symbol("b").mutability == Mutability.MUTABLE
+        assert not self.table.is_parameter("c")
+
+        self.table.exit_function_scope()
+        assert self.table.get_parameter_info("a") is None
+        assert self.table.lookup_symbol("a") is None
+
+    @pytest.mark.parametrize(
+        "record",
+        [
+            Symbol("x", HexenType.I32, Mutability.IMMUTABLE),
+            Parameter("x", HexenType.I32, False),
+            FunctionSignature("f", [], HexenType.VOID),
+        ],
+    )
+    def test_records_are_slotted(self, record):
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.unknown_field = 1
+
+
+class TestLookupPerformance:
+    """Test that lookups do not depend on nesting depth"""
+
+    def test_lookup_cost_independent_of_depth(self):
+        """Resolving an outer name from 2000 scopes deep stays flat"""
+        table = SymbolTable()
+        table.declare_symbol(_symbol("outer"))
+        for depth in range(2000):
+            table.enter_scope()
+            table.declare_symbol(_symbol(f"v{depth}"))
+
+        start_time = time.time()
+        for _ in range(100_000):
+            table.lookup_symbol("outer")
+        elapsed = time.time() - start_time
+
+        for _ in range(2000):
+            table.exit_scope()
+        assert table._bindings.keys() == {"outer"}
+        assert elapsed < 0.5, f"Lookup too slow: {elapsed:.3f}s"
+        print(f"✅ 100k lookups through 2000 scopes in {elapsed:.4f}s")
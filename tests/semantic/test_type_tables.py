@@ -0,0 +1,208 @@
+"""
+Test module for the precomputed type relation tables
+
+Tests that can_coerce, get_wider_type, is_precision_loss_operation and
+ConversionAnalyzer._is_valid_conversion, which now read dense tables for
+HexenType pairs, agree with the branch-chain rules they replaced on every
+scalar pair and on randomized mixes of scalar, array and range types.
+"""
+
+import random
+
+import pytest
+
+from src.hexen.semantic.analyzer import SemanticAnalyzer
+from src.hexen.semantic.type_util import (
+    COMPTIME_FLOAT_TARGETS,
+    COMPTIME_INT_TARGETS,
+    can_coerce,
+    get_wider_type,
+    is_float_type,
+    is_precision_loss_operation,
+)
+from src.hexen.semantic.types import (
+    ArrayType,
+    ComptimeArrayType,
+    ComptimeRangeType,
+    HexenType,
+    RangeType,
+    intern_array_type,
+    intern_comptime_array_type,
+    intern_comptime_range_type,
+    intern_range_type,
+)
+
+# =============================================================================
+# Reference implementations: the branch chains before tabulation
+# =============================================================================
+
+_INT_ELEMENTS = {HexenType.I32, HexenType.I64, HexenType.F32, HexenType.F64}
+_FLOAT_ELEMENTS = {HexenType.F32, HexenType.F64}
+
+
+def _reference_can_coerce(from_type, to_type):
+    if from_type == to_type:
+        return True
+    if isinstance(from_type, ComptimeArrayType) and isinstance(to_type, ArrayType):
+        if len(from_type.dimensions) != len(to_type.dimensions):
+            return False
+        for from_dim, to_dim in zip(from_type.dimensions, to_type.dimensions):
+            if to_dim != "_" and from_dim != to_dim:
+                return False
+        if from_type.element_comptime_type == HexenType.COMPTIME_INT:
+            return to_type.element_type in _INT_ELEMENTS
+        if from_type.element_comptime_type == HexenType.COMPTIME_FLOAT:
+            return to_type.element_type in _FLOAT_ELEMENTS
+        return False
+    if isinstance(from_type, ComptimeArrayType) and isinstance(
+        to_type, ComptimeArrayType
+    ):
+        return (
+            from_type.dimensions == to_type.dimensions
+            and from_type.element_comptime_type == to_type.element_comptime_type
+        )
+    if isinstance(from_type, ComptimeArrayType) and isinstance(to_type, HexenType):
+        return False
+    if isinstance(from_type, ComptimeRangeType) and isinstance(to_type, RangeType):
+        if from_type.element_type == HexenType.COMPTIME_INT:
+            return to_type.element_type in _INT_ELEMENTS | {HexenType.USIZE}
+        if from_type.element_type == HexenType.COMPTIME_FLOAT:
+            return to_type.element_type in _FLOAT_ELEMENTS
+        return from_type.element_type == to_type.element_type
+    if isinstance(from_type, ComptimeRangeType) and isinstance(
+        to_type, ComptimeRangeType
+    ):
+        return from_type.element_type == to_type.element_type
+    if isinstance(from_type, RangeType) and isinstance(to_type, RangeType):
+        return from_type.element_type == to_type.element_type
+    if isinstance(from_type, RangeType) or isinstance(to_type, RangeType):
+        return False
+    if isinstance(to_type, ArrayType):
+        if not isinstance(from_type, ArrayType):
+            return False
+        if from_type.element_type != to_type.element_type:
+            return False
+        if len(from_type.dimensions) != len(to_type.dimensions):
+            return False
+        for from_dim, to_dim in zip(from_type.dimensions, to_type.dimensions):
+            if to_dim == "_":
+                continue
+            if from_dim == "_" or from_dim != to_dim:
+                return False
+        return True
+    if isinstance(from_type, ArrayType):
+        return False
+    if not isinstance(from_type, HexenType) or not isinstance(to_type, HexenType):
+        return False
+    if from_type == HexenType.COMPTIME_INT:
+        return to_type in COMPTIME_INT_TARGETS
+    if from_type == HexenType.COMPTIME_FLOAT:
+        return to_type in COMPTIME_FLOAT_TARGETS
+    return False
+
+
+def _reference_get_wider_type(left_type, right_type):
+    if is_float_type(left_type) or is_float_type(right_type):
+        return (
+            HexenType.F64 if HexenType.F64 in {left_type, right_type} else HexenType.F32
+        )
+    if left_type == HexenType.USIZE and right_type == HexenType.USIZE:
+        return HexenType.USIZE
+    return HexenType.I64 if HexenType.I64 in {left_type, right_type} else HexenType.I32
+
+
+def _reference_is_precision_loss(from_type, to_type):
+    return (
+        (from_type == HexenType.I64 and to_type == HexenType.I32)
+        or (from_type == HexenType.F64 and to_type == HexenType.F32)
+        or (
+            from_type in {HexenType.F32, HexenType.F64, HexenType.COMPTIME_FLOAT}
+            and to_type in {HexenType.I32, HexenType.I64}
+        )
+        or (from_type == HexenType.I64 and to_type == HexenType.F32)
+        or (from_type == HexenType.F64 and to_type == HexenType.I32)
+    )
+
+
+def _reference_is_valid_conversion(source, target):
+    if source == target:
+        return True
+    if source == HexenType.COMPTIME_INT:
+        return target in _INT_ELEMENTS | {HexenType.USIZE}
+    if source == HexenType.COMPTIME_FLOAT:
+        return target in _INT_ELEMENTS
+    numeric_types = _INT_ELEMENTS | {HexenType.USIZE}
+    if source in numeric_types and target in numeric_types:
+        return not (source in _FLOAT_ELEMENTS and target == HexenType.USIZE)
+    return False
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+SCALARS = list(HexenType)
+PAIRS = [(left, right) for left in SCALARS for right in SCALARS]
+
+
+def _type_pool():
+    """Scalars plus interned and freshly constructed array/range types"""
+    pool = list(SCALARS)
+    for element in (HexenType.I32, HexenType.I64, HexenType.F32, HexenType.F64):
+        for dimensions in ([3], [4], ["_"], [2, 3], [2, "_"]):
+            pool.append(intern_array_type(element, dimensions))
+            pool.append(ArrayType(element, list(dimensions)))
+    for element in (HexenType.COMPTIME_INT, HexenType.COMPTIME_FLOAT):
+        for dimensions in ([3], [4], [2, 3]):
+            pool.append(intern_comptime_array_type(element, dimensions))
+            pool.append(ComptimeArrayType(element, list(dimensions)))
+        pool.append(intern_comptime_range_type(element, True, True, False, False))
+        pool.append(ComptimeRangeType(element, True, False, True, True))
+    for element in (HexenType.I32, HexenType.USIZE, HexenType.F64):
+        pool.append(intern_range_type(element, True, True, False, False))
+        pool.append(RangeType(element, False, True, False, True))
+    return pool
+
+
+class TestScalarTables:
+    """Exhaustive check of every HexenType pair"""
+
+    def setup_method(self):
+        self.conversion_analyzer = SemanticAnalyzer().conversion_analyzer
+
+    @pytest.mark.parametrize("left,right", PAIRS)
+    def test_pair_matches_reference(self, left, right):
+        assert can_coerce(left, right) == _reference_can_coerce(left, right)
+        assert get_wider_type(left, right) == _reference_get_wider_type(left, right)
+        assert is_precision_loss_operation(left, right) == (
+            _reference_is_precision_loss(left, right)
+        )
+        assert self.conversion_analyzer._is_valid_conversion(left, right) == (
+            _reference_is_valid_conversion(left, right)
+        )
+
+
+class TestRandomizedEquivalence:
+    """Randomized mixes of scalar, array and range types"""
+
+    def test_random_pairs_match_reference(self):
+        rng = random.Random(20240611)
+        pool = _type_pool()
+        conversion_analyzer = SemanticAnalyzer().conversion_analyzer
+
+        for _ in range(20_000):
+            left = rng.choice(pool)
+            right = rng.choice(pool)
+            context = f"{left!r} -> {right!r}"
+            assert can_coerce(left, right) == _reference_can_coerce(left, right), (
+                context
+            )
+            assert is_precision_loss_operation(left, right) == (
+                _reference_is_precision_loss(left, right)
+            ), context
+            assert conversion_analyzer._is_valid_conversion(left, right) == (
+                _reference_is_valid_conversion(left, right)
+            ), context
+            assert get_wider_type(left, right) == _reference_get_wider_type(
+                left, right
+            ), context
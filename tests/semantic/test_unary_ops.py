@@ -9,6 +9,8 @@ Tests semantic analysis of:
 - Error cases and edge cases
 """
 
+from collections.abc import Mapping
+
 from tests.semantic import (
     StandardTestBase,
     assert_no_errors,
@@ -232,7 +234,8 @@ class TestNegativeNumberLiterals(StandardTestBase):
         assert_no_errors(errors)
 
         # Verify AST structure contains unary operations
-        assert isinstance(ast, dict)
+        # Dict nodes, or typed nodes under --typed-ast
+        assert isinstance(ast, Mapping)
         assert "functions" in ast
 
 
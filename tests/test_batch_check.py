@@ -0,0 +1,124 @@
+"""
+Test module for batch `hexen check`
+
+Tests source collection from files and directories, that batch results are
+the same in-process and in the worker pool, the CLI output and exit codes,
+and benchmarks one batch run against one CLI invocation per file.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.hexen import cli
+from src.hexen.batch import check_files, collect_sources
+
+ROOT = Path(__file__).resolve().parents[1]
+
+VALID = """
+func main() : i32 = {
+    val a : i32 = 1
+    return a
+}
+"""
+INVALID = """
+func main() : i32 = {
+    val a : i64 = 1
+    return a
+}
+"""
+
+
+def _write_tree(root: Path, count: int = 6) -> None:
+    """count sources in root and root/nested (every third one invalid)"""
+    (root / "nested").mkdir()
+    for index in range(count):
+        directory = root / "nested" if index % 2 else root
+        source = INVALID if index % 3 == 0 else VALID
+        (directory / f"file{index}.hxn").write_text(source)
+    (root / "notes.txt").write_text("not a source")
+
+
+class TestBatchCheck:
+    """Test collecting and checking many files"""
+
+    def test_collect_sources(self, tmp_path):
+        _write_tree(tmp_path)
+        single = str(tmp_path / "file0.hxn")
+        files = collect_sources([single, str(tmp_path)])
+        assert files[0] == single
+        assert len(files) == 6 and len(set(files)) == 6
+        assert all(file.endswith(".hxn") for file in files)
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_results(self, tmp_path, jobs):
+        _write_tree(tmp_path)
+        (tmp_path / "broken.hxn").write_text("func main( : i32 = {")
+        files = collect_sources([str(tmp_path)])
+        results = {
+            Path(result.path).name: result
+            for result in check_files(files, jobs, "lalr-treeless")
+        }
+
+        assert len(results) == 7
+        assert results["broken.hxn"].failure.startswith("Parse error")
+        assert results["file0.hxn"].errors == [
+            "4:5: Potential truncation. Use explicit conversion: 'value:i32'"
+        ]
+        assert results["file1.hxn"].ok
+        assert sum(result.ok for result in results.values()) == 4
+
+    def test_cli_summary_and_exit_code(self, tmp_path, monkeypatch, capsys):
+        _write_tree(tmp_path)
+        monkeypatch.setattr(sys, "argv", ["hexen", "check", str(tmp_path), "--jobs=2"])
+        with pytest.raises(SystemExit) as exit_info:
+            cli.main()
+        output = capsys.readouterr().out
+
+        assert exit_info.value.code == 1
+        assert "🔍 Checking 6 files with 2 process(es)" in output
+        assert output.count("✅") == 4 and output.count("❌") == 2
+        assert "6 files checked in" in output and "4 passed, 2 failed" in output
+
+    def test_cli_passes_without_errors(self, tmp_path, monkeypatch, capsys):
+        for index in range(3):
+            (tmp_path / f"ok{index}.hxn").write_text(VALID)
+        paths = [str(path) for path in sorted(tmp_path.iterdir())]
+        monkeypatch.setattr(sys, "argv", ["hexen", "check", *paths, "--jobs=1"])
+        cli.main()
+        assert "3 passed, 0 failed" in capsys.readouterr().out
+
+
+class TestBatchCheckBenchmark:
+    """Compare a batch run with one CLI process per file"""
+
+    def test_batch_versus_one_process_per_file(self, tmp_path):
+        _write_tree(tmp_path, count=8)
+        files = collect_sources([str(tmp_path)])
+
+        def run(*args):
+            return subprocess.run(
+                [sys.executable, "-m", "src.hexen.cli", "check", *args],
+                cwd=ROOT,
+                capture_output=True,
+                text=True,
+            )
+
+        start_time = time.time()
+        for file in files:
+            run(file)
+        per_file_time = time.time() - start_time
+
+        start_time = time.time()
+        result = run(str(tmp_path))
+        batch_time = time.time() - start_time
+
+        assert "8 files checked in" in result.stdout
+        assert batch_time < 30.0, f"Batch check too slow: {batch_time:.3f}s"
+        print(
+            f"✅ {len(files)} files: {per_file_time:.2f}s as one process per file "
+            f"-> {batch_time:.2f}s as one batch"
+        )
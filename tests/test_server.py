@@ -0,0 +1,196 @@
+"""
+Test module for the `hexen serve` compile server
+
+Tests the JSON protocol (ping, parse, check, unsaved sources, invalid and
+multiple requests per connection), that CLI output is the same with and
+without a running server, incremental re-checks per file, stale and busy
+sockets, stopping the server, and benchmarks a check round trip.
+"""
+
+import json
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.hexen import cli
+from src.hexen.client import send_request, server_running
+from src.hexen.server import create_server, serve
+
+SOURCE = """
+func helper(x : i64) : i64 = {
+    return x
+}
+func main() : i32 = {
+    val a : i64 = helper(1)
+    return a
+}
+"""
+
+
+@pytest.fixture
+def socket_dir():
+    # Unix socket paths are limited to ~100 bytes, too short for tmp_path
+    with tempfile.TemporaryDirectory(prefix="hx") as directory:
+        yield Path(directory)
+
+
+@pytest.fixture
+def server(socket_dir):
+    server = create_server(str(socket_dir / "hexen.sock"))
+    thread = threading.Thread(target=serve, args=(server,), daemon=True)
+    thread.start()
+    yield server
+    send_request({"command": "shutdown"}, server.server_address)
+    thread.join(timeout=10)
+
+
+def _run_cli(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["hexen", *args])
+    code = 0
+    try:
+        cli.main()
+    except SystemExit as exit_info:
+        code = exit_info.code
+    return code, capsys.readouterr().out
+
+
+class TestCompileServer:
+    """Test requests answered by a running server"""
+
+    def test_ping(self, server):
+        assert server_running(server.server_address)
+        response = send_request({"command": "ping"}, server.server_address)
+        assert response["status"] == "ok"
+
+    def test_check_and_parse(self, server, socket_dir):
+        source = socket_dir / "main.hxn"
+        source.write_text(SOURCE)
+        request = {"command": "check", "path": str(source)}
+        response = send_request(request, server.server_address)
+        assert response["errors"] == [
+            "7:5: Potential truncation. Use explicit conversion: 'value:i32'"
+        ]
+
+        request["command"] = "parse"
+        response = send_request(request, server.server_address)
+        assert response["ast"]["type"] == "program"
+
+    def test_default_parser_is_warmed_up(self, server):
+        """Checks without a parser mode reuse the warm LALR parser"""
+        request = {"command": "check", "source": SOURCE}
+        assert len(send_request(request, server.server_address)["errors"]) == 1
+        assert list(server.service._parsers) == [("lalr-treeless", True, False)]
+
+    def test_errors(self, server):
+        address = server.server_address
+        missing = {"command": "check", "path": "/nonexistent/main.hxn"}
+        assert send_request(missing, address)["status"] == "error"
+        broken = {"command": "check", "source": "func main( : i32 = {"}
+        assert send_request(broken, address)["status"] == "syntax_error"
+        mode = {"command": "check", "source": SOURCE, "parser": "cyk"}
+        assert send_request(mode, address)["status"] == "usage"
+        unknown = {"command": "build"}
+        assert send_request(unknown, address)["message"] == "Unknown command: build"
+
+    def test_several_requests_per_connection(self, server):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(server.server_address)
+            connection.sendall(
+                b"not json\n"
+                + json.dumps({"command": "check", "source": SOURCE}).encode()
+                + b"\n"
+                + json.dumps({"command": "ping"}).encode()
+                + b"\n"
+            )
+            with connection.makefile("rb") as stream:
+                responses = [json.loads(stream.readline()) for _ in range(3)]
+
+        assert responses[0] == {"status": "error", "message": "Invalid request"}
+        assert len(responses[1]["errors"]) == 1
+        assert responses[2]["status"] == "ok"
+
+    def test_unsaved_source_is_checked_incrementally(self, server):
+        request = {"command": "check", "path": "/virtual/main.hxn", "source": SOURCE}
+        send_request(request, server.server_address)
+        request["source"] = SOURCE.replace("val a : i64", "val a : i32")
+        response = send_request(request, server.server_address)
+
+        assert response["errors"] == [
+            "6:5: Potential truncation. Use explicit conversion: 'value:i32'"
+        ]
+        session = server.service._sessions["/virtual/main.hxn"]
+        assert session.reused == 1 and session.rechecked == 1
+
+    @pytest.mark.parametrize("command", ["check", "parse"])
+    def test_cli_output_matches_local(
+        self, server, socket_dir, monkeypatch, capsys, command
+    ):
+        source = socket_dir / "main.hxn"
+        source.write_text(SOURCE)
+        option = f"--socket={server.server_address}"
+        remote = _run_cli(monkeypatch, capsys, command, str(source), option)
+        local = _run_cli(monkeypatch, capsys, command, str(source), "--no-server")
+        assert remote == local
+        assert remote[1].startswith("✅ Parse successful!")
+
+
+class TestServerLifecycle:
+    """Test starting and stopping the server"""
+
+    def test_no_server(self, socket_dir):
+        address = str(socket_dir / "hexen.sock")
+        assert send_request({"command": "ping"}, address) is None
+        assert not server_running(address)
+
+    def test_already_running(self, server):
+        with pytest.raises(RuntimeError, match="already running"):
+            create_server(server.server_address)
+
+    def test_stale_socket_is_replaced(self, socket_dir):
+        address = str(socket_dir / "hexen.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(address)
+        server = create_server(address)
+        try:
+            assert Path(address).stat().st_mode & 0o777 == 0o600
+        finally:
+            server.server_close()
+
+    def test_cli_stop(self, server, monkeypatch, capsys):
+        address = server.server_address
+        stop = ["serve", "--stop", f"--socket={address}"]
+        code, output = _run_cli(monkeypatch, capsys, *stop)
+        assert code == 0 and "Hexen server stopped" in output
+
+        for _ in range(100):
+            if not Path(address).exists():
+                break
+            time.sleep(0.05)
+        assert not Path(address).exists()
+
+        code, output = _run_cli(monkeypatch, capsys, *stop)
+        assert code == 1 and "No Hexen server running" in output
+
+
+class TestCompileServerBenchmark:
+    """Benchmark a check answered by a warm server"""
+
+    def test_check_round_trip(self, server, socket_dir):
+        source = socket_dir / "main.hxn"
+        source.write_text(SOURCE)
+        request = {"command": "check", "path": str(source)}
+        send_request(request, server.server_address)
+
+        count = 100
+        start_time = time.time()
+        for _ in range(count):
+            send_request(request, server.server_address)
+        round_trip = (time.time() - start_time) / count
+
+        assert round_trip < 0.5, f"Server round trip too slow: {round_trip:.3f}s"
+        print(f"✅ Check through a warm server: {round_trip * 1000:.2f} ms/request")